@@ -8,6 +8,16 @@
 //   2. LLM-based text generation/completion (`GetCompletion`)
 //   3. Optimization problem solving using OR-Tools (`SolveOptimization`)
 //   4. Asynchronous job status tracking (`GetJobStatus`)
+//   5. Pushed job status transitions (`WatchJob`)
+//   6. Batch submission and status lookup (`SolveOptimizationBatch`,
+//      `GetJobStatusBatch`)
+//   7. Scoring and validating a schedule without solving (`EvaluateSchedule`)
+//   8. Typed scheduling payloads (`ScheduleProblem`, `ScheduleSolution`) as a
+//      compact alternative to the JSON-in-string fields
+//   9. Roster upload (`UploadRoster`) returning a `problem_id` that solve
+//      requests reference instead of resending the roster
+//  10. Token-by-token completions (`StreamCompletion`)
+//  11. Job cancellation (`CancelJob`)
 //
 // The service is designed to integrate components like:
 //   - Large Language Models (e.g., GPT, Claude)
@@ -50,10 +60,17 @@ import (
 const _ = grpc.SupportPackageIsVersion9
 
 const (
-	AIService_Ping_FullMethodName              = "/orchestrator.AIService/Ping"
-	AIService_GetCompletion_FullMethodName     = "/orchestrator.AIService/GetCompletion"
-	AIService_SolveOptimization_FullMethodName = "/orchestrator.AIService/SolveOptimization"
-	AIService_GetJobStatus_FullMethodName      = "/orchestrator.AIService/GetJobStatus"
+	AIService_Ping_FullMethodName                   = "/orchestrator.AIService/Ping"
+	AIService_GetCompletion_FullMethodName          = "/orchestrator.AIService/GetCompletion"
+	AIService_StreamCompletion_FullMethodName       = "/orchestrator.AIService/StreamCompletion"
+	AIService_SolveOptimization_FullMethodName      = "/orchestrator.AIService/SolveOptimization"
+	AIService_GetJobStatus_FullMethodName           = "/orchestrator.AIService/GetJobStatus"
+	AIService_WatchJob_FullMethodName               = "/orchestrator.AIService/WatchJob"
+	AIService_SolveOptimizationBatch_FullMethodName = "/orchestrator.AIService/SolveOptimizationBatch"
+	AIService_GetJobStatusBatch_FullMethodName      = "/orchestrator.AIService/GetJobStatusBatch"
+	AIService_EvaluateSchedule_FullMethodName       = "/orchestrator.AIService/EvaluateSchedule"
+	AIService_UploadRoster_FullMethodName           = "/orchestrator.AIService/UploadRoster"
+	AIService_CancelJob_FullMethodName              = "/orchestrator.AIService/CancelJob"
 )
 
 // AIServiceClient is the client API for AIService service.
@@ -64,12 +81,32 @@ const (
 type AIServiceClient interface {
 	// Simple ping for health check
 	Ping(ctx context.Context, in *PingRequest, opts ...grpc.CallOption) (*PingResponse, error)
-	// LLM completion
+	// LLM completion. Identical requests (prompt, model, max_tokens) are
+	// answered from a cache or share one model call; RESOURCE_EXHAUSTED when
+	// the model is too busy to start within the queue timeout.
 	GetCompletion(ctx context.Context, in *CompletionRequest, opts ...grpc.CallOption) (*CompletionResponse, error)
+	// LLM completion streamed as it is generated; cancelling the call stops
+	// the generation
+	StreamCompletion(ctx context.Context, in *CompletionRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[CompletionChunk], error)
 	// OR-Tools solver (async via RabbitMQ recommended)
 	SolveOptimization(ctx context.Context, in *OptimizationRequest, opts ...grpc.CallOption) (*OptimizationResponse, error)
 	// Get solver job status
 	GetJobStatus(ctx context.Context, in *JobStatusRequest, opts ...grpc.CallOption) (*JobStatusResponse, error)
+	// Stream job status transitions until the job completes, fails or is
+	// cancelled
+	WatchJob(ctx context.Context, in *JobStatusRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[JobStatusResponse], error)
+	// Queue several optimization problems in one call
+	SolveOptimizationBatch(ctx context.Context, in *OptimizationBatchRequest, opts ...grpc.CallOption) (*OptimizationBatchResponse, error)
+	// Get the status of several jobs in one call
+	GetJobStatusBatch(ctx context.Context, in *JobStatusBatchRequest, opts ...grpc.CallOption) (*JobStatusBatchResponse, error)
+	// Score and validate an assignment against a problem without solving
+	EvaluateSchedule(ctx context.Context, in *EvaluationRequest, opts ...grpc.CallOption) (*EvaluationResponse, error)
+	// Upload employees.csv / shifts.csv in chunks; returns a problem_id for
+	// OptimizationRequest.problem_id
+	UploadRoster(ctx context.Context, opts ...grpc.CallOption) (grpc.ClientStreamingClient[RosterChunk, RosterUploadResponse], error)
+	// Cancel a queued or running job. It ends "cancelled", keeping the best
+	// schedule reported while it ran (if any); a finished job is left as it is.
+	CancelJob(ctx context.Context, in *JobStatusRequest, opts ...grpc.CallOption) (*JobStatusResponse, error)
 }
 
 type aIServiceClient struct {
@@ -100,6 +137,25 @@ func (c *aIServiceClient) GetCompletion(ctx context.Context, in *CompletionReque
 	return out, nil
 }
 
+func (c *aIServiceClient) StreamCompletion(ctx context.Context, in *CompletionRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[CompletionChunk], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &AIService_ServiceDesc.Streams[0], AIService_StreamCompletion_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[CompletionRequest, CompletionChunk]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AIService_StreamCompletionClient = grpc.ServerStreamingClient[CompletionChunk]
+
 func (c *aIServiceClient) SolveOptimization(ctx context.Context, in *OptimizationRequest, opts ...grpc.CallOption) (*OptimizationResponse, error) {
 	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
 	out := new(OptimizationResponse)
@@ -120,6 +176,78 @@ func (c *aIServiceClient) GetJobStatus(ctx context.Context, in *JobStatusRequest
 	return out, nil
 }
 
+func (c *aIServiceClient) WatchJob(ctx context.Context, in *JobStatusRequest, opts ...grpc.CallOption) (grpc.ServerStreamingClient[JobStatusResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &AIService_ServiceDesc.Streams[1], AIService_WatchJob_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[JobStatusRequest, JobStatusResponse]{ClientStream: stream}
+	if err := x.ClientStream.SendMsg(in); err != nil {
+		return nil, err
+	}
+	if err := x.ClientStream.CloseSend(); err != nil {
+		return nil, err
+	}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AIService_WatchJobClient = grpc.ServerStreamingClient[JobStatusResponse]
+
+func (c *aIServiceClient) SolveOptimizationBatch(ctx context.Context, in *OptimizationBatchRequest, opts ...grpc.CallOption) (*OptimizationBatchResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(OptimizationBatchResponse)
+	err := c.cc.Invoke(ctx, AIService_SolveOptimizationBatch_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *aIServiceClient) GetJobStatusBatch(ctx context.Context, in *JobStatusBatchRequest, opts ...grpc.CallOption) (*JobStatusBatchResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(JobStatusBatchResponse)
+	err := c.cc.Invoke(ctx, AIService_GetJobStatusBatch_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *aIServiceClient) EvaluateSchedule(ctx context.Context, in *EvaluationRequest, opts ...grpc.CallOption) (*EvaluationResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(EvaluationResponse)
+	err := c.cc.Invoke(ctx, AIService_EvaluateSchedule_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
+func (c *aIServiceClient) UploadRoster(ctx context.Context, opts ...grpc.CallOption) (grpc.ClientStreamingClient[RosterChunk, RosterUploadResponse], error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	stream, err := c.cc.NewStream(ctx, &AIService_ServiceDesc.Streams[2], AIService_UploadRoster_FullMethodName, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	x := &grpc.GenericClientStream[RosterChunk, RosterUploadResponse]{ClientStream: stream}
+	return x, nil
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AIService_UploadRosterClient = grpc.ClientStreamingClient[RosterChunk, RosterUploadResponse]
+
+func (c *aIServiceClient) CancelJob(ctx context.Context, in *JobStatusRequest, opts ...grpc.CallOption) (*JobStatusResponse, error) {
+	cOpts := append([]grpc.CallOption{grpc.StaticMethod()}, opts...)
+	out := new(JobStatusResponse)
+	err := c.cc.Invoke(ctx, AIService_CancelJob_FullMethodName, in, out, cOpts...)
+	if err != nil {
+		return nil, err
+	}
+	return out, nil
+}
+
 // AIServiceServer is the server API for AIService service.
 // All implementations must embed UnimplementedAIServiceServer
 // for forward compatibility.
@@ -128,12 +256,32 @@ func (c *aIServiceClient) GetJobStatus(ctx context.Context, in *JobStatusRequest
 type AIServiceServer interface {
 	// Simple ping for health check
 	Ping(context.Context, *PingRequest) (*PingResponse, error)
-	// LLM completion
+	// LLM completion. Identical requests (prompt, model, max_tokens) are
+	// answered from a cache or share one model call; RESOURCE_EXHAUSTED when
+	// the model is too busy to start within the queue timeout.
 	GetCompletion(context.Context, *CompletionRequest) (*CompletionResponse, error)
+	// LLM completion streamed as it is generated; cancelling the call stops
+	// the generation
+	StreamCompletion(*CompletionRequest, grpc.ServerStreamingServer[CompletionChunk]) error
 	// OR-Tools solver (async via RabbitMQ recommended)
 	SolveOptimization(context.Context, *OptimizationRequest) (*OptimizationResponse, error)
 	// Get solver job status
 	GetJobStatus(context.Context, *JobStatusRequest) (*JobStatusResponse, error)
+	// Stream job status transitions until the job completes, fails or is
+	// cancelled
+	WatchJob(*JobStatusRequest, grpc.ServerStreamingServer[JobStatusResponse]) error
+	// Queue several optimization problems in one call
+	SolveOptimizationBatch(context.Context, *OptimizationBatchRequest) (*OptimizationBatchResponse, error)
+	// Get the status of several jobs in one call
+	GetJobStatusBatch(context.Context, *JobStatusBatchRequest) (*JobStatusBatchResponse, error)
+	// Score and validate an assignment against a problem without solving
+	EvaluateSchedule(context.Context, *EvaluationRequest) (*EvaluationResponse, error)
+	// Upload employees.csv / shifts.csv in chunks; returns a problem_id for
+	// OptimizationRequest.problem_id
+	UploadRoster(grpc.ClientStreamingServer[RosterChunk, RosterUploadResponse]) error
+	// Cancel a queued or running job. It ends "cancelled", keeping the best
+	// schedule reported while it ran (if any); a finished job is left as it is.
+	CancelJob(context.Context, *JobStatusRequest) (*JobStatusResponse, error)
 	mustEmbedUnimplementedAIServiceServer()
 }
 
@@ -150,12 +298,33 @@ func (UnimplementedAIServiceServer) Ping(context.Context, *PingRequest) (*PingRe
 func (UnimplementedAIServiceServer) GetCompletion(context.Context, *CompletionRequest) (*CompletionResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method GetCompletion not implemented")
 }
+func (UnimplementedAIServiceServer) StreamCompletion(*CompletionRequest, grpc.ServerStreamingServer[CompletionChunk]) error {
+	return status.Errorf(codes.Unimplemented, "method StreamCompletion not implemented")
+}
 func (UnimplementedAIServiceServer) SolveOptimization(context.Context, *OptimizationRequest) (*OptimizationResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method SolveOptimization not implemented")
 }
 func (UnimplementedAIServiceServer) GetJobStatus(context.Context, *JobStatusRequest) (*JobStatusResponse, error) {
 	return nil, status.Errorf(codes.Unimplemented, "method GetJobStatus not implemented")
 }
+func (UnimplementedAIServiceServer) WatchJob(*JobStatusRequest, grpc.ServerStreamingServer[JobStatusResponse]) error {
+	return status.Errorf(codes.Unimplemented, "method WatchJob not implemented")
+}
+func (UnimplementedAIServiceServer) SolveOptimizationBatch(context.Context, *OptimizationBatchRequest) (*OptimizationBatchResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method SolveOptimizationBatch not implemented")
+}
+func (UnimplementedAIServiceServer) GetJobStatusBatch(context.Context, *JobStatusBatchRequest) (*JobStatusBatchResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method GetJobStatusBatch not implemented")
+}
+func (UnimplementedAIServiceServer) EvaluateSchedule(context.Context, *EvaluationRequest) (*EvaluationResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method EvaluateSchedule not implemented")
+}
+func (UnimplementedAIServiceServer) UploadRoster(grpc.ClientStreamingServer[RosterChunk, RosterUploadResponse]) error {
+	return status.Errorf(codes.Unimplemented, "method UploadRoster not implemented")
+}
+func (UnimplementedAIServiceServer) CancelJob(context.Context, *JobStatusRequest) (*JobStatusResponse, error) {
+	return nil, status.Errorf(codes.Unimplemented, "method CancelJob not implemented")
+}
 func (UnimplementedAIServiceServer) mustEmbedUnimplementedAIServiceServer() {}
 func (UnimplementedAIServiceServer) testEmbeddedByValue()                   {}
 
@@ -213,6 +382,17 @@ func _AIService_GetCompletion_Handler(srv interface{}, ctx context.Context, dec
 	return interceptor(ctx, in, info, handler)
 }
 
+func _AIService_StreamCompletion_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(CompletionRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(AIServiceServer).StreamCompletion(m, &grpc.GenericServerStream[CompletionRequest, CompletionChunk]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AIService_StreamCompletionServer = grpc.ServerStreamingServer[CompletionChunk]
+
 func _AIService_SolveOptimization_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
 	in := new(OptimizationRequest)
 	if err := dec(in); err != nil {
@@ -249,6 +429,96 @@ func _AIService_GetJobStatus_Handler(srv interface{}, ctx context.Context, dec f
 	return interceptor(ctx, in, info, handler)
 }
 
+func _AIService_WatchJob_Handler(srv interface{}, stream grpc.ServerStream) error {
+	m := new(JobStatusRequest)
+	if err := stream.RecvMsg(m); err != nil {
+		return err
+	}
+	return srv.(AIServiceServer).WatchJob(m, &grpc.GenericServerStream[JobStatusRequest, JobStatusResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AIService_WatchJobServer = grpc.ServerStreamingServer[JobStatusResponse]
+
+func _AIService_SolveOptimizationBatch_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(OptimizationBatchRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(AIServiceServer).SolveOptimizationBatch(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: AIService_SolveOptimizationBatch_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(AIServiceServer).SolveOptimizationBatch(ctx, req.(*OptimizationBatchRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _AIService_GetJobStatusBatch_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(JobStatusBatchRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(AIServiceServer).GetJobStatusBatch(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: AIService_GetJobStatusBatch_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(AIServiceServer).GetJobStatusBatch(ctx, req.(*JobStatusBatchRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _AIService_EvaluateSchedule_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(EvaluationRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(AIServiceServer).EvaluateSchedule(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: AIService_EvaluateSchedule_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(AIServiceServer).EvaluateSchedule(ctx, req.(*EvaluationRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
+func _AIService_UploadRoster_Handler(srv interface{}, stream grpc.ServerStream) error {
+	return srv.(AIServiceServer).UploadRoster(&grpc.GenericServerStream[RosterChunk, RosterUploadResponse]{ServerStream: stream})
+}
+
+// This type alias is provided for backwards compatibility with existing code that references the prior non-generic stream type by name.
+type AIService_UploadRosterServer = grpc.ClientStreamingServer[RosterChunk, RosterUploadResponse]
+
+func _AIService_CancelJob_Handler(srv interface{}, ctx context.Context, dec func(interface{}) error, interceptor grpc.UnaryServerInterceptor) (interface{}, error) {
+	in := new(JobStatusRequest)
+	if err := dec(in); err != nil {
+		return nil, err
+	}
+	if interceptor == nil {
+		return srv.(AIServiceServer).CancelJob(ctx, in)
+	}
+	info := &grpc.UnaryServerInfo{
+		Server:     srv,
+		FullMethod: AIService_CancelJob_FullMethodName,
+	}
+	handler := func(ctx context.Context, req interface{}) (interface{}, error) {
+		return srv.(AIServiceServer).CancelJob(ctx, req.(*JobStatusRequest))
+	}
+	return interceptor(ctx, in, info, handler)
+}
+
 // AIService_ServiceDesc is the grpc.ServiceDesc for AIService service.
 // It's only intended for direct use with grpc.RegisterService,
 // and not to be introspected or modified (even as a copy)
@@ -272,7 +542,39 @@ var AIService_ServiceDesc = grpc.ServiceDesc{
 			MethodName: "GetJobStatus",
 			Handler:    _AIService_GetJobStatus_Handler,
 		},
+		{
+			MethodName: "SolveOptimizationBatch",
+			Handler:    _AIService_SolveOptimizationBatch_Handler,
+		},
+		{
+			MethodName: "GetJobStatusBatch",
+			Handler:    _AIService_GetJobStatusBatch_Handler,
+		},
+		{
+			MethodName: "EvaluateSchedule",
+			Handler:    _AIService_EvaluateSchedule_Handler,
+		},
+		{
+			MethodName: "CancelJob",
+			Handler:    _AIService_CancelJob_Handler,
+		},
+	},
+	Streams: []grpc.StreamDesc{
+		{
+			StreamName:    "StreamCompletion",
+			Handler:       _AIService_StreamCompletion_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "WatchJob",
+			Handler:       _AIService_WatchJob_Handler,
+			ServerStreams: true,
+		},
+		{
+			StreamName:    "UploadRoster",
+			Handler:       _AIService_UploadRoster_Handler,
+			ClientStreams: true,
+		},
 	},
-	Streams:  []grpc.StreamDesc{},
 	Metadata: "service.proto",
 }
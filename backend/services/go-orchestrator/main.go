@@ -2,6 +2,8 @@ package main
 
 import (
 	"context"
+	"encoding/json"
+	"io"
 	"log"
 	"net/http"
 	"os"
@@ -10,7 +12,12 @@ import (
 	"github.com/gin-contrib/cors"
 	"github.com/gin-gonic/gin"
 	"google.golang.org/grpc"
+	"google.golang.org/grpc/codes"
 	"google.golang.org/grpc/credentials/insecure"
+	"google.golang.org/grpc/metadata"
+	"google.golang.org/grpc/status"
+	"google.golang.org/protobuf/encoding/protojson"
+	"google.golang.org/protobuf/proto"
 
 	pb "go-orchestrator/internal/proto" // Adjust import path
 )
@@ -47,8 +54,15 @@ func main() {
 	{
 		api.GET("/ping", server.ping)
 		api.POST("/completion", server.getCompletion)
+		api.POST("/completion/stream", server.streamCompletion)
 		api.POST("/optimize", server.optimize)
+		api.POST("/optimize/batch", server.optimizeBatch)
 		api.GET("/job/:id", server.getJobStatus)
+		api.POST("/jobs/status", server.getJobStatusBatch)
+		api.POST("/evaluate", server.evaluateSchedule)
+		api.GET("/job/:id/watch", server.watchJob)
+		api.POST("/job/:id/cancel", server.cancelJob)
+		api.POST("/problems", server.uploadRoster)
 	}
 
 	// Start HTTP server
@@ -120,13 +134,22 @@ func (s *Server) ping(c *gin.Context) {
 	})
 }
 
-func (s *Server) getCompletion(c *gin.Context) {
-	var req struct {
-		Prompt    string `json:"prompt" binding:"required"`
-		Model     string `json:"model"`
-		MaxTokens int32  `json:"max_tokens"`
+type completionRequest struct {
+	Prompt    string `json:"prompt" binding:"required"`
+	Model     string `json:"model"`
+	MaxTokens int32  `json:"max_tokens"`
+}
+
+func (r completionRequest) toProto() *pb.CompletionRequest {
+	return &pb.CompletionRequest{
+		Prompt:    r.Prompt,
+		Model:     r.Model,
+		MaxTokens: r.MaxTokens,
 	}
+}
 
+func (s *Server) getCompletion(c *gin.Context) {
+	var req completionRequest
 	if err := c.ShouldBindJSON(&req); err != nil {
 		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
 		return
@@ -140,15 +163,9 @@ func (s *Server) getCompletion(c *gin.Context) {
 	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
 	defer cancel()
 
-	grpcReq := &pb.CompletionRequest{
-		Prompt:    req.Prompt,
-		Model:     req.Model,
-		MaxTokens: req.MaxTokens,
-	}
-
-	resp, err := s.pythonClient.GetCompletion(ctx, grpcReq)
+	resp, err := s.pythonClient.GetCompletion(ctx, req.toProto())
 	if err != nil {
-		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		writeRPCError(c, err, nil)
 		return
 	}
 
@@ -156,15 +173,200 @@ func (s *Server) getCompletion(c *gin.Context) {
 		"completion":  resp.Completion,
 		"tokens_used": resp.TokensUsed,
 		"model":       resp.Model,
+		"cached":      resp.Cached,
 	})
 }
 
+// completionStreamTimeout bounds a streamed completion from request to last
+// token; the client disconnecting ends it earlier
+const completionStreamTimeout = 5 * time.Minute
+
+// streamCompletion forwards a completion as server-sent events while it is
+// generated: a "token" event per token, then a "done" event with the finish
+// reason and token count. A client that disconnects cancels the gRPC call,
+// which stops the generation upstream. The first token is awaited before
+// answering, so a model too busy to start answers 429 rather than a stream.
+func (s *Server) streamCompletion(c *gin.Context) {
+	var req completionRequest
+	if err := c.ShouldBindJSON(&req); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	if s.pythonClient == nil {
+		c.JSON(http.StatusServiceUnavailable, gin.H{"error": "Python service not available"})
+		return
+	}
+
+	ctx, cancel := context.WithTimeout(c.Request.Context(), completionStreamTimeout)
+	defer cancel()
+
+	stream, err := s.pythonClient.StreamCompletion(ctx, req.toProto())
+	if err != nil {
+		writeRPCError(c, err, nil)
+		return
+	}
+	chunk, err := stream.Recv()
+	if err != nil {
+		writeRPCError(c, err, stream.Trailer())
+		return
+	}
+
+	c.Header("Cache-Control", "no-cache")
+	c.Header("X-Accel-Buffering", "no")
+	if !writeCompletionChunk(c, chunk) {
+		return
+	}
+	c.Writer.Flush()
+	c.Stream(func(w io.Writer) bool {
+		chunk, err := stream.Recv()
+		if err == io.EOF {
+			return false
+		}
+		if err != nil {
+			c.SSEvent("error", gin.H{"error": err.Error()})
+			return false
+		}
+		return writeCompletionChunk(c, chunk)
+	})
+}
+
+// writeCompletionChunk sends a chunk as a "token" or, for the last one, a
+// "done" event; it reports whether more chunks follow
+func writeCompletionChunk(c *gin.Context, chunk *pb.CompletionChunk) bool {
+	if chunk.FinishReason != "" {
+		c.SSEvent("done", gin.H{
+			"finish_reason": chunk.FinishReason,
+			"tokens_used":   chunk.TokensUsed,
+			"model":         chunk.Model,
+			"cached":        chunk.Cached,
+		})
+		return false
+	}
+	c.SSEvent("token", gin.H{"text": chunk.Text})
+	return true
+}
+
+// protobufContentType selects binary protobuf request and response bodies
+// (OptimizationRequest in, OptimizationResponse / JobStatusResponse out)
+const protobufContentType = "application/x-protobuf"
+
+type optimizeRequest struct {
+	ProblemType        string `json:"problem_type" binding:"required"`
+	ConstraintsJSON    string `json:"constraints_json"`
+	ObjectivesJSON     string `json:"objectives_json"`
+	TimeoutSeconds     int32  `json:"timeout_seconds"`
+	BaseJobID          string `json:"base_job_id"`
+	BaseAssignmentJSON string `json:"base_assignment_json"`
+	// Typed alternative to constraints_json/objectives_json: a ScheduleProblem
+	// (and optionally a ScheduleSolution to warm-start from) in protobuf JSON
+	Problem      json.RawMessage `json:"problem"`
+	BaseSolution json.RawMessage `json:"base_solution"`
+	// A roster uploaded to /problems, instead of the problem itself
+	ProblemID string `json:"problem_id"`
+	// Profile the solve (served by the Python service's /jobs/{id}/profile)
+	Profile bool `json:"profile"`
+	// "interactive", "standard" (default) or "batch"; see the proto
+	Priority string `json:"priority"`
+}
+
+func (r optimizeRequest) toProto() (*pb.OptimizationRequest, error) {
+	req := &pb.OptimizationRequest{
+		ProblemType:        r.ProblemType,
+		ConstraintsJson:    r.ConstraintsJSON,
+		ObjectivesJson:     r.ObjectivesJSON,
+		TimeoutSeconds:     r.TimeoutSeconds,
+		BaseJobId:          r.BaseJobID,
+		BaseAssignmentJson: r.BaseAssignmentJSON,
+		ProblemId:          r.ProblemID,
+		Profile:            r.Profile,
+		Priority:           r.Priority,
+	}
+	var err error
+	if len(r.Problem) > 0 {
+		if req.Problem, err = marshalJSON(r.Problem, &pb.ScheduleProblem{}); err != nil {
+			return nil, err
+		}
+	}
+	if len(r.BaseSolution) > 0 {
+		if req.BaseSolution, err = marshalJSON(r.BaseSolution, &pb.ScheduleSolution{}); err != nil {
+			return nil, err
+		}
+	}
+	return req, nil
+}
+
+// marshalJSON converts a protobuf JSON message to its binary encoding
+func marshalJSON(body []byte, message proto.Message) ([]byte, error) {
+	if err := protojson.Unmarshal(body, message); err != nil {
+		return nil, err
+	}
+	return proto.Marshal(message)
+}
+
+// bindOptimizationRequest reads a JSON optimizeRequest or, with
+// Content-Type application/x-protobuf, a binary OptimizationRequest whose
+// problem bytes are forwarded as they are
+func bindOptimizationRequest(c *gin.Context) (*pb.OptimizationRequest, error) {
+	if c.ContentType() == protobufContentType {
+		body, err := io.ReadAll(c.Request.Body)
+		if err != nil {
+			return nil, err
+		}
+		req := &pb.OptimizationRequest{}
+		if err := proto.Unmarshal(body, req); err != nil {
+			return nil, err
+		}
+		return req, nil
+	}
+	var req optimizeRequest
+	if err := c.ShouldBindJSON(&req); err != nil {
+		return nil, err
+	}
+	return req.toProto()
+}
+
+// wantsProtobuf reports whether the client asked for a binary response
+func wantsProtobuf(c *gin.Context) bool {
+	return c.NegotiateFormat(gin.MIMEJSON, protobufContentType) == protobufContentType
+}
+
 func (s *Server) optimize(c *gin.Context) {
+	req, err := bindOptimizationRequest(c)
+	if err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	if s.pythonClient == nil {
+		c.JSON(http.StatusServiceUnavailable, gin.H{"error": "Python service not available"})
+		return
+	}
+
+	ctx, cancel := context.WithTimeout(clientContext(context.Background(), c), 10*time.Second)
+	defer cancel()
+
+	var trailer metadata.MD
+	resp, err := s.pythonClient.SolveOptimization(ctx, req, grpc.Trailer(&trailer))
+	if err != nil {
+		writeRPCError(c, err, trailer)
+		return
+	}
+
+	if wantsProtobuf(c) {
+		c.ProtoBuf(http.StatusOK, resp)
+		return
+	}
+	c.JSON(http.StatusOK, optimizationBody(resp))
+}
+
+// optimizeBatch queues several problems with one gRPC call; each entry of
+// "jobs" reports its own status, so one bad problem doesn't fail the batch.
+// Problems turned away by admission control have status "rejected", and the
+// response carries a Retry-After header.
+func (s *Server) optimizeBatch(c *gin.Context) {
 	var req struct {
-		ProblemType     string `json:"problem_type" binding:"required"`
-		ConstraintsJSON string `json:"constraints_json"`
-		ObjectivesJSON  string `json:"objectives_json"`
-		TimeoutSeconds  int32  `json:"timeout_seconds"`
+		Problems []optimizeRequest `json:"problems" binding:"required,dive"`
 	}
 
 	if err := c.ShouldBindJSON(&req); err != nil {
@@ -177,27 +379,89 @@ func (s *Server) optimize(c *gin.Context) {
 		return
 	}
 
-	ctx, cancel := context.WithTimeout(context.Background(), 10*time.Second)
+	ctx, cancel := context.WithTimeout(clientContext(context.Background(), c), 30*time.Second)
 	defer cancel()
 
-	grpcReq := &pb.OptimizationRequest{
-		ProblemType:     req.ProblemType,
-		ConstraintsJson: req.ConstraintsJSON,
-		ObjectivesJson:  req.ObjectivesJSON,
-		TimeoutSeconds:  req.TimeoutSeconds,
+	grpcReq := &pb.OptimizationBatchRequest{}
+	for _, problem := range req.Problems {
+		item, err := problem.toProto()
+		if err != nil {
+			c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+			return
+		}
+		grpcReq.Requests = append(grpcReq.Requests, item)
 	}
 
-	resp, err := s.pythonClient.SolveOptimization(ctx, grpcReq)
+	var trailer metadata.MD
+	resp, err := s.pythonClient.SolveOptimizationBatch(ctx, grpcReq, grpc.Trailer(&trailer))
 	if err != nil {
-		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		writeRPCError(c, err, trailer)
 		return
 	}
+	setRetryAfter(c, trailer)
 
-	c.JSON(http.StatusOK, gin.H{
+	jobs := make([]gin.H, 0, len(resp.Responses))
+	for _, item := range resp.Responses {
+		jobs = append(jobs, optimizationBody(item))
+	}
+	c.JSON(http.StatusOK, gin.H{"jobs": jobs})
+}
+
+// clientContext tags an outgoing call with the client it is made for
+// (X-Client-ID, else the caller's address), which the Python service's
+// per-client admission limits count against
+func clientContext(ctx context.Context, c *gin.Context) context.Context {
+	client := c.GetHeader("X-Client-ID")
+	if client == "" {
+		client = c.ClientIP()
+	}
+	return metadata.AppendToOutgoingContext(ctx, "x-client-id", client)
+}
+
+// writeRPCError answers a failed gRPC call: RESOURCE_EXHAUSTED (admission
+// control, or a busy completion model) becomes 429 with the service's
+// retry-after hint, anything else 500
+func writeRPCError(c *gin.Context, err error, trailer metadata.MD) {
+	if status.Code(err) == codes.ResourceExhausted {
+		setRetryAfter(c, trailer)
+		c.JSON(http.StatusTooManyRequests, gin.H{"error": status.Convert(err).Message()})
+		return
+	}
+	c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+}
+
+// setRetryAfter forwards the service's retry-after trailer, in seconds
+func setRetryAfter(c *gin.Context, trailer metadata.MD) {
+	if retryAfter := trailer.Get("retry-after"); len(retryAfter) > 0 {
+		c.Header("Retry-After", retryAfter[0])
+	}
+}
+
+func optimizationBody(resp *pb.OptimizationResponse) gin.H {
+	body := gin.H{
 		"job_id": resp.JobId,
 		"status": resp.Status,
 		"result": resp.ResultJson,
-	})
+		"error":  resp.ErrorMessage,
+	}
+	if len(resp.Solution) > 0 {
+		body["solution"] = solutionJSON(resp.Solution)
+	}
+	return body
+}
+
+// solutionJSON renders a typed job's serialized ScheduleSolution as protobuf
+// JSON; the bytes are only decoded here, for JSON clients
+func solutionJSON(solution []byte) interface{} {
+	message := &pb.ScheduleSolution{}
+	if err := proto.Unmarshal(solution, message); err != nil {
+		return gin.H{"error": err.Error()}
+	}
+	body, err := protojson.Marshal(message)
+	if err != nil {
+		return gin.H{"error": err.Error()}
+	}
+	return json.RawMessage(body)
 }
 
 func (s *Server) getJobStatus(c *gin.Context) {
@@ -217,13 +481,254 @@ func (s *Server) getJobStatus(c *gin.Context) {
 		return
 	}
 
-	c.JSON(http.StatusOK, gin.H{
+	if wantsProtobuf(c) {
+		c.ProtoBuf(http.StatusOK, resp)
+		return
+	}
+	c.JSON(http.StatusOK, jobStatusBody(resp))
+}
+
+// cancelJob stops a queued or running job; the response is its status
+// afterwards ("cancelled", or how it had already finished)
+func (s *Server) cancelJob(c *gin.Context) {
+	jobID := c.Param("id")
+
+	if s.pythonClient == nil {
+		c.JSON(http.StatusServiceUnavailable, gin.H{"error": "Python service not available"})
+		return
+	}
+
+	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+	defer cancel()
+
+	resp, err := s.pythonClient.CancelJob(ctx, &pb.JobStatusRequest{JobId: jobID})
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+
+	if wantsProtobuf(c) {
+		c.ProtoBuf(http.StatusOK, resp)
+		return
+	}
+	c.JSON(http.StatusOK, jobStatusBody(resp))
+}
+
+func (s *Server) getJobStatusBatch(c *gin.Context) {
+	var req struct {
+		JobIDs []string `json:"job_ids" binding:"required"`
+	}
+
+	if err := c.ShouldBindJSON(&req); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	if s.pythonClient == nil {
+		c.JSON(http.StatusServiceUnavailable, gin.H{"error": "Python service not available"})
+		return
+	}
+
+	ctx, cancel := context.WithTimeout(context.Background(), 5*time.Second)
+	defer cancel()
+
+	resp, err := s.pythonClient.GetJobStatusBatch(ctx, &pb.JobStatusBatchRequest{JobIds: req.JobIDs})
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+
+	jobs := make([]gin.H, 0, len(resp.Statuses))
+	for _, status := range resp.Statuses {
+		jobs = append(jobs, jobStatusBody(status))
+	}
+	c.JSON(http.StatusOK, gin.H{"jobs": jobs})
+}
+
+// watchJob streams job status transitions as server-sent events until the
+// job completes, fails or is cancelled, instead of the client polling /job/:id
+func (s *Server) watchJob(c *gin.Context) {
+	jobID := c.Param("id")
+
+	if s.pythonClient == nil {
+		c.JSON(http.StatusServiceUnavailable, gin.H{"error": "Python service not available"})
+		return
+	}
+
+	// Cancelled when the HTTP client disconnects
+	stream, err := s.pythonClient.WatchJob(c.Request.Context(), &pb.JobStatusRequest{JobId: jobID})
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+
+	c.Header("Cache-Control", "no-cache")
+	c.Stream(func(w io.Writer) bool {
+		resp, err := stream.Recv()
+		if err == io.EOF {
+			return false
+		}
+		if err != nil {
+			c.SSEvent("error", gin.H{"error": err.Error()})
+			return false
+		}
+		c.SSEvent("status", jobStatusBody(resp))
+		return true
+	})
+}
+
+func jobStatusBody(resp *pb.JobStatusResponse) gin.H {
+	body := gin.H{
 		"job_id":       resp.JobId,
 		"status":       resp.Status,
 		"result":       resp.ResultJson,
 		"error":        resp.ErrorMessage,
 		"created_at":   resp.CreatedAt,
 		"completed_at": resp.CompletedAt,
+	}
+	if len(resp.Solution) > 0 {
+		body["solution"] = solutionJSON(resp.Solution)
+	}
+	return body
+}
+
+// rosterChunkSize is the most CSV bytes sent per UploadRoster message
+const rosterChunkSize = 64 * 1024
+
+// uploadRoster streams a multipart roster upload (files "employees" and
+// "shifts", optional fields "constraints_json" and "objectives_json") to
+// UploadRoster part by part, so the CSV files are never held in memory here.
+// Solve requests then reference the returned problem_id.
+func (s *Server) uploadRoster(c *gin.Context) {
+	if s.pythonClient == nil {
+		c.JSON(http.StatusServiceUnavailable, gin.H{"error": "Python service not available"})
+		return
+	}
+
+	reader, err := c.Request.MultipartReader()
+	if err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	ctx, cancel := context.WithTimeout(c.Request.Context(), 60*time.Second)
+	defer cancel()
+
+	stream, err := s.pythonClient.UploadRoster(ctx)
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+
+	options := &pb.RosterChunk{}
+	buf := make([]byte, rosterChunkSize)
+	for {
+		part, err := reader.NextPart()
+		if err == io.EOF {
+			break
+		}
+		if err != nil {
+			c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+			return
+		}
+		switch name := part.FormName(); name {
+		case "constraints_json", "objectives_json":
+			value, err := io.ReadAll(io.LimitReader(part, 1<<20))
+			if err != nil {
+				c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+				return
+			}
+			if name == "constraints_json" {
+				options.ConstraintsJson = string(value)
+			} else {
+				options.ObjectivesJson = string(value)
+			}
+		case "employees", "shifts":
+			for {
+				n, err := io.ReadFull(part, buf)
+				if n > 0 {
+					// Send serializes the message, so buf can be reused
+					if sendErr := stream.Send(&pb.RosterChunk{File: name, Data: buf[:n]}); sendErr != nil {
+						// The service ended the stream; CloseAndRecv reports why
+						break
+					}
+				}
+				if err == io.EOF || err == io.ErrUnexpectedEOF {
+					break
+				}
+				if err != nil {
+					c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+					return
+				}
+			}
+		}
+	}
+	if options.ConstraintsJson != "" || options.ObjectivesJson != "" {
+		// Error ignored like above: CloseAndRecv returns the stream's status
+		_ = stream.Send(options)
+	}
+
+	resp, err := stream.CloseAndRecv()
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+	if resp.ProblemId == "" {
+		c.JSON(http.StatusBadRequest, gin.H{"error": resp.ErrorMessage, "errors": resp.Errors})
+		return
+	}
+
+	c.JSON(http.StatusOK, gin.H{
+		"problem_id": resp.ProblemId,
+		"created":    resp.Created,
+		"employees":  resp.Employees,
+		"shifts":     resp.Shifts,
+	})
+}
+
+func (s *Server) evaluateSchedule(c *gin.Context) {
+	var req struct {
+		ProblemType     string `json:"problem_type"`
+		ConstraintsJSON string `json:"constraints_json" binding:"required"`
+		ObjectivesJSON  string `json:"objectives_json"`
+		AssignmentJSON  string `json:"assignment_json" binding:"required"`
+	}
+
+	if err := c.ShouldBindJSON(&req); err != nil {
+		c.JSON(http.StatusBadRequest, gin.H{"error": err.Error()})
+		return
+	}
+
+	if s.pythonClient == nil {
+		c.JSON(http.StatusServiceUnavailable, gin.H{"error": "Python service not available"})
+		return
+	}
+
+	if req.ProblemType == "" {
+		req.ProblemType = "shift_scheduling"
+	}
+
+	ctx, cancel := context.WithTimeout(context.Background(), 30*time.Second)
+	defer cancel()
+
+	resp, err := s.pythonClient.EvaluateSchedule(ctx, &pb.EvaluationRequest{
+		ProblemType:     req.ProblemType,
+		ConstraintsJson: req.ConstraintsJSON,
+		ObjectivesJson:  req.ObjectivesJSON,
+		AssignmentJson:  req.AssignmentJSON,
+	})
+	if err != nil {
+		c.JSON(http.StatusInternalServerError, gin.H{"error": err.Error()})
+		return
+	}
+	if resp.ErrorMessage != "" {
+		c.JSON(http.StatusBadRequest, gin.H{"error": resp.ErrorMessage})
+		return
+	}
+
+	c.JSON(http.StatusOK, gin.H{
+		"valid":      resp.Valid,
+		"evaluation": json.RawMessage(resp.EvaluationJson),
 	})
 }
 
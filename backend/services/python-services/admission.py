@@ -0,0 +1,217 @@
+"""Admission control and priority classes for optimization jobs.
+
+Every job that needs a solve is admitted against two limits on the jobs
+still queued or running: ``max_active`` over all clients and
+``max_active_per_client`` per client. The client is the ``x-client-id``
+gRPC metadata (the Go orchestrator sets it from ``X-Client-ID`` or the
+caller's address), else the peer address. Each priority class may only fill
+its share of the global limit, so under load batch runs are shed first and
+interactive what-if solves keep headroom:
+
+    interactive 100%    standard 80%    batch 50%
+
+A request over a limit is rejected at once with ``AdmissionRejected``,
+which carries a retry-after estimate from recent job durations. Answers
+from the result cache and requests attached to a running solve need no
+slot and are never rejected.
+
+The class also orders the work: the task queue is a broker priority queue,
+and the solver pool hands a free process to the highest-priority waiting
+solve. The time from admission to a solver starting is observed per class.
+
+Limits are per API process; replicas sharing a job store each admit up to
+them. A replica does not hear of jobs finished by another replica's result
+consumer, so when a limit is reached the jobs counted against it are first
+looked up in the job store again.
+"""
+
+import math
+import time
+from collections import Counter
+from collections.abc import Callable
+
+from job_store import JobRecord
+from metrics import JOB_QUEUE_WAIT, JOBS_REJECTED
+
+# Priority class -> broker message priority; higher runs first
+PRIORITIES = {"batch": 0, "standard": 1, "interactive": 2}
+DEFAULT_PRIORITY = "standard"
+# Share of the global limit each class may fill
+PRIORITY_SHARES = {"batch": 0.5, "standard": 0.8, "interactive": 1.0}
+
+CLIENT_ID_METADATA = "x-client-id"
+ANONYMOUS_CLIENT = "anonymous"
+
+# Least seconds between two job store lookups of the admitted jobs
+SWEEP_INTERVAL = 1.0
+
+
+class AdmissionRejected(Exception):
+    def __init__(self, message: str, retry_after: int):
+        super().__init__(message)
+        # Seconds before retrying is worthwhile
+        self.retry_after = retry_after
+
+
+def priority_class(priority: str) -> str:
+    """Validate a request's priority; empty means the default class"""
+    if not priority:
+        return DEFAULT_PRIORITY
+    if priority not in PRIORITIES:
+        raise ValueError(
+            f"Unknown priority '{priority}', "
+            f"expected one of: {', '.join(sorted(PRIORITIES, key=PRIORITIES.get))}"
+        )
+    return priority
+
+
+def priority_level(priority: str) -> int:
+    """Broker / solver pool priority of a class; unknown ones get the default"""
+    return PRIORITIES.get(priority, PRIORITIES[DEFAULT_PRIORITY])
+
+
+def client_id(context) -> str:
+    """Who is asking: x-client-id metadata, else the peer's address"""
+    if context is None:
+        return ANONYMOUS_CLIENT
+    for key, value in context.invocation_metadata() or ():
+        if key == CLIENT_ID_METADATA and value:
+            return value
+    # "ipv4:10.0.0.5:53422" -> "ipv4:10.0.0.5"; a port is per connection
+    peer = context.peer() or ""
+    return peer.rsplit(":", 1)[0] if peer.count(":") > 1 else peer or ANONYMOUS_CLIENT
+
+
+class _Admitted:
+    __slots__ = ("client", "priority", "admitted_at", "started")
+
+    def __init__(self, client: str, priority: str):
+        self.client = client
+        self.priority = priority
+        self.admitted_at = time.monotonic()
+        self.started = False
+
+
+class AdmissionController:
+    def __init__(
+        self,
+        max_active: int = 1000,
+        max_active_per_client: int = 100,
+        lookup: Callable[[str], JobRecord | None] | None = None,
+    ):
+        # 0 disables a limit
+        self.max_active = max_active
+        self.max_active_per_client = max_active_per_client
+        # Current record of a job, for catching up on missed finishes
+        self.lookup = lookup
+        self.admitted = 0
+        self.rejected = 0
+        # Moving average of admission-to-finish times, for retry-after hints
+        self.mean_job_seconds = 5.0
+
+        self._active: dict[str, _Admitted] = {}
+        self._by_client: Counter[str] = Counter()
+        self._by_priority: Counter[str] = Counter()
+        self._swept_at = -SWEEP_INTERVAL
+
+    def stats(self) -> dict:
+        return {
+            "active": len(self._active),
+            "active_by_priority": self.active_by_priority(),
+            "clients": len(self._by_client),
+            "max_active": self.max_active,
+            "max_active_per_client": self.max_active_per_client,
+            "admitted": self.admitted,
+            "rejected": self.rejected,
+            "mean_job_seconds": self.mean_job_seconds,
+        }
+
+    def active_by_priority(self) -> dict[str, int]:
+        return {priority: self._by_priority[priority] for priority in PRIORITIES}
+
+    def check(self, client: str, priority: str):
+        """Raise AdmissionRejected if a new job would exceed a limit"""
+        limit = (
+            max(1, math.floor(self.max_active * PRIORITY_SHARES[priority]))
+            if self.max_active
+            else 0
+        )
+        if (limit and len(self._active) >= limit) or (
+            self.max_active_per_client
+            and self._by_client[client] >= self.max_active_per_client
+        ):
+            self._sweep()
+
+        active = len(self._active)
+        if limit and active >= limit:
+            self._reject(
+                priority,
+                "global",
+                f"Service at capacity for {priority} jobs "
+                f"({active} active, limit {limit})",
+                active - limit + 1,
+                limit,
+            )
+        active = self._by_client[client]
+        if self.max_active_per_client and active >= self.max_active_per_client:
+            self._reject(
+                priority,
+                "client",
+                f"Client '{client}' has {active} active jobs "
+                f"(limit {self.max_active_per_client})",
+                active - self.max_active_per_client + 1,
+                self.max_active_per_client,
+            )
+
+    def track(self, job_id: str, client: str, priority: str):
+        """Count an admitted job against the limits until it finishes"""
+        self.admitted += 1
+        self._active[job_id] = _Admitted(client, priority)
+        self._by_client[client] += 1
+        self._by_priority[priority] += 1
+
+    def on_job_update(self, record: JobRecord):
+        """Job store listener: queue wait on start, free the slot on finish"""
+        admitted = self._active.get(record.job_id)
+        if admitted is None:
+            return
+        if not admitted.started and record.status == "running":
+            admitted.started = True
+            JOB_QUEUE_WAIT.labels(admitted.priority).observe(
+                time.monotonic() - admitted.admitted_at
+            )
+        if record.finished:
+            self._release(record.job_id, admitted)
+            self.mean_job_seconds += 0.1 * (
+                time.monotonic() - admitted.admitted_at - self.mean_job_seconds
+            )
+
+    def _release(self, job_id: str, admitted: _Admitted):
+        del self._active[job_id]
+        self._by_client[admitted.client] -= 1
+        if not self._by_client[admitted.client]:
+            del self._by_client[admitted.client]
+        self._by_priority[admitted.priority] -= 1
+
+    def _sweep(self):
+        """Release jobs that finished (or expired) without this process
+        applying the update, e.g. their result reached another replica"""
+        now = time.monotonic()
+        if self.lookup is None or now - self._swept_at < SWEEP_INTERVAL:
+            return
+        self._swept_at = now
+        for job_id, admitted in list(self._active.items()):
+            record = self.lookup(job_id)
+            if record is None:
+                self._release(job_id, admitted)
+            elif record.finished:
+                self.on_job_update(record)
+
+    def _reject(
+        self, priority: str, limit_name: str, message: str, excess: int, limit: int
+    ):
+        self.rejected += 1
+        JOBS_REJECTED.labels(priority, limit_name).inc()
+        # A slot frees about every mean_job_seconds / limit seconds
+        retry_after = max(1, math.ceil(self.mean_job_seconds * excess / limit))
+        raise AdmissionRejected(f"{message}; retry in {retry_after}s", retry_after)
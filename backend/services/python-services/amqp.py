@@ -0,0 +1,474 @@
+"""Thin asyncio AMQP layer shared by the API process and the solver worker.
+
+Two interchangeable transports expose the same small surface
+(``connect() -> connection``, ``connection.channel()``, ``channel.publish()``):
+
+* ``AioPikaBroker`` talks to RabbitMQ through aio-pika.
+* ``InMemoryBroker`` is an in-process stand-in for tests, benchmarks and
+  running the service without a broker (``RABBITMQ_URL=memory://``).
+
+``channel.publish`` only returns once the broker has confirmed the message
+(publisher confirms), so callers can batch many publishes and await them
+together. ``channel.consume`` hands each delivery to a callback; the message
+exposes ``body``, ``headers``, ``redelivered`` and ``ack()`` / ``reject()``.
+``channel.message_count`` reports how many messages a queue holds.
+
+Besides the work queues, ``optimization_cancel`` is a fanout exchange: every
+solver worker binds an exclusive queue of its own to it, so a cancellation
+published there reaches whichever worker holds the job.
+
+Results go to ``optimization_results`` unless the task names another queue
+in its ``x-reply-to`` header: an API process whose jobs live only in its own
+memory has a reply queue of its own, as no other process could apply them.
+"""
+
+import asyncio
+import heapq
+import itertools
+import logging
+from collections.abc import Awaitable, Callable
+
+import aio_pika
+from aio_pika import exceptions as aio_pika_exceptions
+
+logger = logging.getLogger(__name__)
+
+TASK_QUEUE = "optimization_tasks"
+RESULT_QUEUE = "optimization_results"
+# Tasks rejected without requeue (poison messages) end up here
+TASK_DEAD_LETTER_QUEUE = "optimization_tasks.dlq"
+# optimization_tasks is a priority queue; tasks carry their class's priority
+# (admission.PRIORITIES), so the highest is delivered first
+TASK_MAX_PRIORITY = 2
+# Fanout exchange broadcasting {"job_id": ...} cancellations to every worker
+CANCEL_EXCHANGE = "optimization_cancel"
+
+# Header marking a message body as protobuf: an OptimizationTask on
+# optimization_tasks or a JobStatusResponse on optimization_results (typed
+# problems). Messages without it are JSON.
+FORMAT_HEADER = "x-format"
+PROTOBUF_FORMAT = "protobuf"
+PROTOBUF_HEADERS = {FORMAT_HEADER: PROTOBUF_FORMAT}
+
+# Header naming the queue a task's results go to (default RESULT_QUEUE)
+REPLY_TO_HEADER = "x-reply-to"
+# A reply queue nobody has used for this long is deleted (RabbitMQ x-expires)
+REPLY_QUEUE_EXPIRES_MS = 10 * 60 * 1000
+
+MEMORY_URL = "memory://"
+
+
+class BrokerError(Exception):
+    pass
+
+
+class BrokerUnavailable(BrokerError):
+    """The connection or channel went away; the message may be retried"""
+
+
+class PublishRejected(BrokerError):
+    """The broker nacked the message; retrying will not help"""
+
+
+async def declare_topology(channel):
+    """Declare the queues used by the optimization pipeline.
+
+    Queue arguments cannot be changed on an existing RabbitMQ queue, so a
+    broker that still has an older ``optimization_tasks`` (without the
+    dead-letter or priority arguments) must have it deleted before upgrading.
+    """
+    await channel.declare_queue(TASK_DEAD_LETTER_QUEUE)
+    await channel.declare_queue(
+        TASK_QUEUE,
+        arguments={
+            "x-dead-letter-exchange": "",
+            "x-dead-letter-routing-key": TASK_DEAD_LETTER_QUEUE,
+            "x-max-priority": TASK_MAX_PRIORITY,
+        },
+    )
+    await channel.declare_queue(RESULT_QUEUE)
+    await channel.declare_fanout_exchange(CANCEL_EXCHANGE)
+
+
+async def declare_reply_queue(channel, name: str):
+    """Declare an API process's own result queue. Durable rather than
+    exclusive: the publisher's connection declares it too, before the
+    first task that names it goes out."""
+    await channel.declare_queue(name, arguments={"x-expires": REPLY_QUEUE_EXPIRES_MS})
+
+
+def reply_queue(message) -> str:
+    """The queue a task's results go to"""
+    return (message.headers or {}).get(REPLY_TO_HEADER) or RESULT_QUEUE
+
+
+def is_protobuf(message) -> bool:
+    return (message.headers or {}).get(FORMAT_HEADER) == PROTOBUF_FORMAT
+
+
+def make_broker(url: str):
+    if url.startswith(MEMORY_URL):
+        return InMemoryBroker()
+    return AioPikaBroker(url)
+
+
+# --------------------------------------------------------------------------- #
+# RabbitMQ via aio-pika
+# --------------------------------------------------------------------------- #
+
+
+class AioPikaChannel:
+    def __init__(self, channel: aio_pika.abc.AbstractChannel):
+        self._channel = channel
+        self._queues: dict[str, aio_pika.abc.AbstractQueue] = {}
+        self._exchanges: dict[str, aio_pika.abc.AbstractExchange] = {}
+
+    @property
+    def is_closed(self) -> bool:
+        return self._channel.is_closed
+
+    async def declare_queue(
+        self, name: str, arguments: dict | None = None, exclusive: bool = False
+    ):
+        """Declare a durable queue, or with `exclusive` one that lives only as
+        long as this connection"""
+        queue = await self._channel.declare_queue(
+            name,
+            durable=not exclusive,
+            exclusive=exclusive,
+            auto_delete=exclusive,
+            arguments=arguments,
+        )
+        self._queues[name] = queue
+        return queue
+
+    async def declare_fanout_exchange(self, name: str):
+        exchange = await self._channel.declare_exchange(
+            name, aio_pika.ExchangeType.FANOUT, durable=True
+        )
+        self._exchanges[name] = exchange
+        return exchange
+
+    async def bind_queue(self, queue_name: str, exchange_name: str):
+        exchange = self._exchanges.get(exchange_name)
+        if exchange is None:
+            exchange = await self.declare_fanout_exchange(exchange_name)
+        await self._queues[queue_name].bind(exchange)
+
+    async def set_prefetch(self, count: int):
+        await self._channel.set_qos(prefetch_count=count)
+
+    async def message_count(self, queue_name: str) -> int:
+        # A passive declare answers with the queue's ready message count
+        try:
+            queue = await self._channel.declare_queue(queue_name, passive=True)
+        except aio_pika_exceptions.CONNECTION_EXCEPTIONS as e:
+            raise BrokerUnavailable(str(e) or type(e).__name__) from e
+        return queue.declaration_result.message_count
+
+    async def consume(
+        self, queue_name: str, callback: Callable[[object], Awaitable[None]]
+    ):
+        queue = self._queues.get(queue_name)
+        if queue is None:
+            queue = await self._channel.declare_queue(queue_name, passive=True)
+        return await queue.consume(callback)
+
+    async def publish(
+        self,
+        routing_key: str,
+        body: bytes,
+        headers: dict | None = None,
+        priority: int | None = None,
+        exchange: str = "",
+    ):
+        message = aio_pika.Message(
+            body,
+            headers=headers,
+            priority=priority,
+            delivery_mode=aio_pika.DeliveryMode.PERSISTENT,
+        )
+        try:
+            target = self._channel.default_exchange
+            if exchange:
+                target = self._exchanges.get(exchange)
+                if target is None:
+                    target = await self._channel.get_exchange(exchange, ensure=False)
+                    self._exchanges[exchange] = target
+            await target.publish(message, routing_key=routing_key)
+        except aio_pika_exceptions.DeliveryError as e:
+            raise PublishRejected(str(e)) from e
+        except aio_pika_exceptions.CONNECTION_EXCEPTIONS as e:
+            raise BrokerUnavailable(str(e) or type(e).__name__) from e
+
+    async def close(self):
+        if not self._channel.is_closed:
+            await self._channel.close()
+
+
+class AioPikaConnection:
+    def __init__(self, connection: aio_pika.abc.AbstractConnection):
+        self._connection = connection
+
+    @property
+    def is_closed(self) -> bool:
+        return self._connection.is_closed
+
+    def add_close_callback(self, callback: Callable[[], None]):
+        self._connection.close_callbacks.add(lambda *_: callback())
+
+    async def channel(self) -> AioPikaChannel:
+        channel = await self._connection.channel(publisher_confirms=True)
+        return AioPikaChannel(channel)
+
+    async def close(self):
+        if not self._connection.is_closed:
+            await self._connection.close()
+
+
+class AioPikaBroker:
+    def __init__(self, url: str):
+        self.url = url
+
+    async def connect(self) -> AioPikaConnection:
+        try:
+            connection = await aio_pika.connect(self.url)
+        except aio_pika_exceptions.CONNECTION_EXCEPTIONS as e:
+            raise BrokerUnavailable(str(e) or type(e).__name__) from e
+        return AioPikaConnection(connection)
+
+
+# --------------------------------------------------------------------------- #
+# In-process stand-in
+# --------------------------------------------------------------------------- #
+
+
+class InMemoryMessage:
+    __slots__ = ("body", "headers", "priority", "redelivered", "_delivery")
+
+    def __init__(self, body: bytes, headers: dict | None, priority: int | None):
+        self.body = body
+        self.headers = headers or {}
+        self.priority = priority
+        self.redelivered = False
+        self._delivery: tuple[InMemoryChannel, str] | None = None
+
+    async def ack(self):
+        channel, _ = self._settle()
+        channel._release(self)
+
+    async def reject(self, requeue: bool = False):
+        channel, queue_name = self._settle()
+        channel._release(self)
+        broker = channel.broker
+        if requeue:
+            self.redelivered = True
+            broker.queue(queue_name).put_nowait(self)
+            return
+        dead_letter = broker.arguments(queue_name).get("x-dead-letter-routing-key")
+        if dead_letter:
+            broker.queue(dead_letter).put_nowait(self)
+
+    def _settle(self) -> tuple["InMemoryChannel", str]:
+        if self._delivery is None:
+            raise BrokerError("message already acknowledged")
+        delivery, self._delivery = self._delivery, None
+        return delivery
+
+
+class _MessageQueue(asyncio.Queue):
+    """Higher priority first, then first in first out, like a RabbitMQ
+    priority queue (messages without a priority count as 0)"""
+
+    def _init(self, maxsize):
+        self._queue = []
+        self._order = itertools.count()
+
+    def _put(self, message):
+        heapq.heappush(
+            self._queue, (-(message.priority or 0), next(self._order), message)
+        )
+
+    def _get(self):
+        return heapq.heappop(self._queue)[2]
+
+
+class InMemoryChannel:
+    def __init__(self, connection: "InMemoryConnection"):
+        self._connection = connection
+        self.is_closed = False
+        self._prefetch: asyncio.Semaphore | None = None
+        self._consumers: list[asyncio.Task] = []
+        self._handlers: set[asyncio.Task] = set()
+        self._unacked: set[InMemoryMessage] = set()
+        # Queues deleted with this channel
+        self._exclusive: set[str] = set()
+
+    @property
+    def broker(self) -> "InMemoryBroker":
+        return self._connection.broker
+
+    def _check_open(self):
+        if self.is_closed or self._connection.is_closed:
+            raise BrokerUnavailable("channel is closed")
+
+    async def declare_queue(
+        self, name: str, arguments: dict | None = None, exclusive: bool = False
+    ):
+        self._check_open()
+        self.broker.arguments(name).update(arguments or {})
+        if exclusive:
+            self._exclusive.add(name)
+        return self.broker.queue(name)
+
+    async def declare_fanout_exchange(self, name: str):
+        self._check_open()
+        self.broker.bindings(name)
+
+    async def bind_queue(self, queue_name: str, exchange_name: str):
+        self._check_open()
+        self.broker.bindings(exchange_name).add(queue_name)
+
+    async def set_prefetch(self, count: int):
+        self._prefetch = asyncio.Semaphore(count) if count else None
+
+    async def message_count(self, queue_name: str) -> int:
+        self._check_open()
+        return self.broker.queue(queue_name).qsize()
+
+    async def publish(
+        self,
+        routing_key: str,
+        body: bytes,
+        headers: dict | None = None,
+        priority: int | None = None,
+        exchange: str = "",
+    ):
+        self._check_open()
+        if self.broker.confirm_delay:
+            await asyncio.sleep(self.broker.confirm_delay)
+            self._check_open()
+        queues = self.broker.bindings(exchange) if exchange else (routing_key,)
+        for queue_name in queues:
+            self.broker.queue(queue_name).put_nowait(
+                InMemoryMessage(body, headers, priority)
+            )
+        self.broker.published += 1
+
+    async def consume(
+        self, queue_name: str, callback: Callable[[object], Awaitable[None]]
+    ):
+        self._check_open()
+        task = asyncio.create_task(self._deliver(queue_name, callback))
+        self._consumers.append(task)
+        return f"ctag-{id(task)}"
+
+    async def _deliver(self, queue_name: str, callback):
+        queue = self.broker.queue(queue_name)
+        while True:
+            if self._prefetch is not None:
+                await self._prefetch.acquire()
+            message = await queue.get()
+            message._delivery = (self, queue_name)
+            self._unacked.add(message)
+            handler = asyncio.create_task(callback(message))
+            self._handlers.add(handler)
+            handler.add_done_callback(self._handlers.discard)
+
+    def _release(self, message: InMemoryMessage):
+        self._unacked.discard(message)
+        if self._prefetch is not None:
+            self._prefetch.release()
+
+    async def close(self):
+        if self.is_closed:
+            return
+        self.is_closed = True
+        for task in self._consumers:
+            task.cancel()
+        # Like RabbitMQ, unacknowledged deliveries go back to their queue
+        for message in list(self._unacked):
+            _, queue_name = message._settle()
+            message.redelivered = True
+            self.broker.queue(queue_name).put_nowait(message)
+        self._unacked.clear()
+        for queue_name in self._exclusive:
+            self.broker.delete_queue(queue_name)
+
+
+class InMemoryConnection:
+    def __init__(self, broker: "InMemoryBroker"):
+        self.broker = broker
+        self.is_closed = False
+        self._channels: list[InMemoryChannel] = []
+        self._close_callbacks: list[Callable[[], None]] = []
+
+    def add_close_callback(self, callback: Callable[[], None]):
+        self._close_callbacks.append(callback)
+
+    async def channel(self) -> InMemoryChannel:
+        if self.is_closed:
+            raise BrokerUnavailable("connection is closed")
+        channel = InMemoryChannel(self)
+        self._channels.append(channel)
+        return channel
+
+    async def _drop(self):
+        if self.is_closed:
+            return
+        self.is_closed = True
+        for channel in self._channels:
+            await channel.close()
+        for callback in self._close_callbacks:
+            callback()
+
+    async def close(self):
+        await self._drop()
+
+
+class InMemoryBroker:
+    """Process-local AMQP stand-in.
+
+    `confirm_delay` simulates the broker round trip for publisher confirms;
+    `disconnect()` / `available` simulate outages.
+    """
+
+    def __init__(self, confirm_delay: float = 0.0):
+        self.confirm_delay = confirm_delay
+        self.available = True
+        self.published = 0
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._arguments: dict[str, dict] = {}
+        # Fanout exchange -> bound queues
+        self._bindings: dict[str, set[str]] = {}
+        self._connections: list[InMemoryConnection] = []
+
+    def queue(self, name: str) -> asyncio.Queue:
+        if name not in self._queues:
+            self._queues[name] = _MessageQueue()
+        return self._queues[name]
+
+    def arguments(self, name: str) -> dict:
+        return self._arguments.setdefault(name, {})
+
+    def bindings(self, exchange: str) -> set[str]:
+        return self._bindings.setdefault(exchange, set())
+
+    def delete_queue(self, name: str):
+        self._queues.pop(name, None)
+        self._arguments.pop(name, None)
+        for queues in self._bindings.values():
+            queues.discard(name)
+
+    async def connect(self) -> InMemoryConnection:
+        if not self.available:
+            raise BrokerUnavailable("in-memory broker is unavailable")
+        connection = InMemoryConnection(self)
+        self._connections.append(connection)
+        return connection
+
+    async def disconnect(self):
+        """Drop every open connection, as a broker restart would"""
+        connections, self._connections = self._connections, []
+        for connection in connections:
+            await connection._drop()
@@ -0,0 +1,372 @@
+"""LLM completions, generated token by token.
+
+A ``CompletionModel`` yields a completion's tokens as it generates them.
+``CompletionService`` puts ``max_tokens`` on top and either forwards each
+token (``StreamCompletion``) or joins them (``GetCompletion``), reusing
+model calls where it can:
+
+* Finished completions are cached by ``(prompt, model, max_tokens)``, least
+  recently used first out, within ``max_entries`` and for ``ttl_seconds``.
+  A hit is replayed without calling the model and reported as ``cached``.
+* Concurrent requests for the same completion share one generation: a
+  request arriving mid-way replays the tokens so far, then follows along.
+* At most ``max_concurrency`` generations per model run at a time; one that
+  waits longer than ``queue_timeout`` for its turn fails with
+  ``CompletionBusyError``.
+
+A generation runs in a task of its own and is cancelled once the last
+request following it goes away: the model's generator is closed where it
+is waiting for its next token, so generation stops with it.
+
+``COMPLETION_MODEL_URL`` selects the model. ``fake://`` is a canned reply
+echoing the prompt. It can be paced for testing streaming clients:
+``fake://?first_token_delay=0.5&token_delay=0.05`` waits half a second
+before the first token and 50 ms before each token after that.
+"""
+
+import asyncio
+import hashlib
+import logging
+import re
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+from dataclasses import dataclass
+from typing import Protocol
+from urllib.parse import parse_qs, urlparse
+
+from metrics import (
+    COMPLETION_CANCELLED,
+    COMPLETION_REQUESTS,
+    COMPLETION_TIME_TO_FIRST_TOKEN,
+)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MODEL = "mock-model"
+
+STOP = "stop"
+# max_tokens reached
+LENGTH = "length"
+
+
+class CompletionModel(Protocol):
+    def stream(self, prompt: str, model: str, max_tokens: int) -> AsyncIterator[str]:
+        """The completion's tokens, as they are generated"""
+        ...
+
+
+def tokenize(text: str) -> list[str]:
+    """Word tokens, each carrying the whitespace before it"""
+    return re.findall(r"\s*\S+", text)
+
+
+class FakeModel:
+    """Canned replies at a configurable pace, for development and tests"""
+
+    def __init__(self, first_token_delay: float = 0.0, token_delay: float = 0.0):
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        # Streams generating now / closed before their last token
+        self.generating = 0
+        self.aborted = 0
+
+    def reply(self, prompt: str) -> str:
+        return f"This is a mock response to: {prompt[:30]}..."
+
+    async def stream(
+        self, prompt: str, model: str, max_tokens: int
+    ) -> AsyncIterator[str]:
+        self.generating += 1
+        finished = False
+        try:
+            await asyncio.sleep(self.first_token_delay)
+            for i, token in enumerate(tokenize(self.reply(prompt))):
+                if i and self.token_delay:
+                    await asyncio.sleep(self.token_delay)
+                yield token
+            finished = True
+        finally:
+            self.generating -= 1
+            if not finished:
+                self.aborted += 1
+
+
+def make_model(url: str) -> CompletionModel:
+    parsed = urlparse(url)
+    if parsed.scheme != "fake":
+        raise ValueError(f"Unsupported COMPLETION_MODEL_URL '{url}', expected fake://")
+    options = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+    return FakeModel(
+        first_token_delay=float(options.get("first_token_delay", "0")),
+        token_delay=float(options.get("token_delay", "0")),
+    )
+
+
+class CompletionBusyError(Exception):
+    """No generation slot for the model within the queue timeout"""
+
+
+@dataclass(slots=True)
+class Chunk:
+    """A generated token; the last chunk of a stream has no text and says
+    why generation finished, how many tokens it produced and whether they
+    came from the cache"""
+
+    text: str
+    finish_reason: str | None = None
+    tokens: int = 0
+    cached: bool = False
+
+
+@dataclass(slots=True)
+class Completion:
+    text: str
+    tokens: int
+    model: str
+    finish_reason: str
+    cached: bool = False
+
+
+def completion_key(prompt: str, model: str, max_tokens: int) -> str:
+    digest = hashlib.sha256()
+    for part in (model, str(max_tokens), prompt):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class CachedCompletion:
+    __slots__ = ("tokens", "finish_reason", "stored_at")
+
+    def __init__(self, tokens: tuple[str, ...], finish_reason: str, stored_at: float):
+        self.tokens = tokens
+        self.finish_reason = finish_reason
+        self.stored_at = stored_at
+
+
+class CompletionCache:
+    def __init__(self, max_entries: int = 1000, ttl_seconds: float = 600):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._completions: OrderedDict[str, CachedCompletion] = OrderedDict()
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._completions),
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+    def get(self, key: str) -> CachedCompletion | None:
+        cached = self._completions.get(key)
+        if cached is not None:
+            if time.monotonic() - cached.stored_at <= self.ttl_seconds:
+                self._completions.move_to_end(key)
+                self.hits += 1
+                return cached
+            del self._completions[key]
+        self.misses += 1
+        return None
+
+    def put(self, key: str, tokens: list[str], finish_reason: str):
+        if not self.enabled:
+            return
+        self._completions[key] = CachedCompletion(
+            tuple(tokens), finish_reason, time.monotonic()
+        )
+        self._completions.move_to_end(key)
+        while len(self._completions) > self.max_entries:
+            self._completions.popitem(last=False)
+
+
+class _Generation:
+    """One model call, followed by every request for its completion"""
+
+    def __init__(self):
+        self.tokens: list[str] = []
+        self.finish_reason: str | None = None
+        self.error: Exception | None = None
+        self.followers = 0
+        self.task: asyncio.Task | None = None
+        self._changed = asyncio.Event()
+
+    def append(self, token: str):
+        self.tokens.append(token)
+        self._wake()
+
+    def finish(self, finish_reason: str):
+        self.finish_reason = finish_reason
+        self._wake()
+
+    def fail(self, error: Exception):
+        self.error = error
+        self._wake()
+
+    def _wake(self):
+        self._changed.set()
+        self._changed = asyncio.Event()
+
+    async def follow(self) -> AsyncIterator[str]:
+        """Every token, from the first, as it is generated"""
+        sent = 0
+        while True:
+            changed = self._changed
+            while sent < len(self.tokens):
+                yield self.tokens[sent]
+                sent += 1
+            if self.error is not None:
+                raise self.error
+            if self.finish_reason is not None:
+                return
+            if changed is self._changed:
+                await changed.wait()
+
+
+class CompletionService:
+    def __init__(
+        self,
+        model: CompletionModel,
+        max_entries: int = 1000,
+        ttl_seconds: float = 600,
+        max_concurrency: int = 4,
+        queue_timeout: float = 10,
+    ):
+        self.model = model
+        self.cache = CompletionCache(max_entries, ttl_seconds)
+        self.max_concurrency = max_concurrency
+        self.queue_timeout = queue_timeout
+        self.coalesced = 0
+        # Generations waiting for a slot of their model
+        self.queued = 0
+        self._generations: dict[str, _Generation] = {}
+        self._slots: dict[str, asyncio.Semaphore] = {}
+
+    def stats(self) -> dict:
+        return {
+            "cache": self.cache.stats(),
+            "coalesced": self.coalesced,
+            "generating": len(self._generations) - self.queued,
+            "queued": self.queued,
+            "max_concurrency": self.max_concurrency,
+        }
+
+    async def stream(
+        self, prompt: str, model: str, max_tokens: int
+    ) -> AsyncIterator[Chunk]:
+        """Each token as it is generated (or replayed), then a final chunk"""
+        model = model or DEFAULT_MODEL
+        key = completion_key(prompt, model, max_tokens)
+        started = time.perf_counter()
+
+        cached = self.cache.get(key) if self.cache.enabled else None
+        if cached is not None:
+            COMPLETION_REQUESTS.labels(model, "cached").inc()
+            COMPLETION_TIME_TO_FIRST_TOKEN.labels(model).observe(
+                time.perf_counter() - started
+            )
+            for token in cached.tokens:
+                yield Chunk(token)
+            yield Chunk("", cached.finish_reason, len(cached.tokens), cached=True)
+            return
+
+        generation = self._generations.get(key)
+        if generation is None:
+            COMPLETION_REQUESTS.labels(model, "generated").inc()
+            generation = self._generations[key] = _Generation()
+            generation.task = asyncio.create_task(
+                self._generate(key, generation, prompt, model, max_tokens)
+            )
+        else:
+            COMPLETION_REQUESTS.labels(model, "coalesced").inc()
+            self.coalesced += 1
+
+        generation.followers += 1
+        first = True
+        try:
+            async with aclosing(generation.follow()) as tokens:
+                async for token in tokens:
+                    if first:
+                        first = False
+                        COMPLETION_TIME_TO_FIRST_TOKEN.labels(model).observe(
+                            time.perf_counter() - started
+                        )
+                    yield Chunk(token)
+        finally:
+            generation.followers -= 1
+            if generation.followers == 0 and not generation.task.done():
+                # Nobody is waiting for the rest
+                generation.task.cancel()
+                if self._generations.get(key) is generation:
+                    del self._generations[key]
+        yield Chunk("", generation.finish_reason, len(generation.tokens))
+
+    async def complete(self, prompt: str, model: str, max_tokens: int) -> Completion:
+        """The whole completion, once it has been generated"""
+        parts = []
+        async for chunk in self.stream(prompt, model, max_tokens):
+            if chunk.finish_reason is None:
+                parts.append(chunk.text)
+            else:
+                final = chunk
+        return Completion(
+            "".join(parts),
+            final.tokens,
+            model or DEFAULT_MODEL,
+            final.finish_reason,
+            final.cached,
+        )
+
+    async def _generate(
+        self,
+        key: str,
+        generation: _Generation,
+        prompt: str,
+        model: str,
+        max_tokens: int,
+    ):
+        try:
+            slots = self._slots.get(model)
+            if slots is None:
+                slots = self._slots[model] = asyncio.Semaphore(self.max_concurrency)
+            self.queued += 1
+            try:
+                async with asyncio.timeout(self.queue_timeout):
+                    await slots.acquire()
+            except TimeoutError as e:
+                raise CompletionBusyError(
+                    f"Model '{model}' is busy: no generation slot within "
+                    f"{self.queue_timeout:g} seconds"
+                ) from e
+            finally:
+                self.queued -= 1
+            try:
+                finish_reason = STOP
+                stream = self.model.stream(prompt, model, max_tokens)
+                async with aclosing(stream):
+                    async for token in stream:
+                        generation.append(token)
+                        if 0 < max_tokens <= len(generation.tokens):
+                            finish_reason = LENGTH
+                            break
+            finally:
+                slots.release()
+        except asyncio.CancelledError:
+            COMPLETION_CANCELLED.labels(model).inc()
+            logger.info(f"Completion cancelled after {len(generation.tokens)} tokens")
+            raise
+        except Exception as e:
+            generation.fail(e)
+        else:
+            generation.finish(finish_reason)
+            self.cache.put(key, generation.tokens, finish_reason)
+        finally:
+            if self._generations.get(key) is generation:
+                del self._generations[key]
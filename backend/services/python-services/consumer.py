@@ -0,0 +1,149 @@
+"""Asyncio AMQP consumer with bounded concurrency and dead-lettering.
+
+The handler decides the fate of each message by how it returns:
+
+* returns normally            -> ack
+* raises ``PoisonMessage``    -> reject without requeue (dead-lettered)
+* raises anything else        -> requeue once; a redelivered message that
+  fails again is dead-lettered so it cannot crash-loop the consumers
+
+Like ``AsyncPublisher`` the consumer reconnects with exponential backoff;
+unacknowledged messages are redelivered by the broker after a reconnect.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+
+logger = logging.getLogger(__name__)
+
+
+class PoisonMessage(Exception):
+    pass
+
+
+class AsyncConsumer:
+    def __init__(
+        self,
+        broker,
+        queue_name: str,
+        handler: Callable[[object], Awaitable[None]],
+        prefetch: int = 10,
+        concurrency: int | None = None,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        on_connect: Callable[[object], Awaitable[None]] | None = None,
+        on_dead_letter: Callable[[object, Exception], Awaitable[None]] | None = None,
+    ):
+        self.broker = broker
+        self.queue_name = queue_name
+        self.handler = handler
+        self.prefetch = prefetch
+        self.concurrency = concurrency or prefetch
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.on_connect = on_connect
+        self.on_dead_letter = on_dead_letter
+
+        self.processed = 0
+        self.dead_lettered = 0
+
+        self._slots = asyncio.Semaphore(self.concurrency)
+        self._connected = asyncio.Event()
+        self._supervisor: asyncio.Task | None = None
+        self._closing = False
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def start(self):
+        if self._supervisor is None:
+            self._supervisor = asyncio.create_task(self._run())
+
+    async def wait_connected(self, timeout: float | None = None) -> bool:
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def close(self):
+        self._closing = True
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            await asyncio.gather(self._supervisor, return_exceptions=True)
+            self._supervisor = None
+
+    async def _run(self):
+        delay = self.reconnect_delay
+        while not self._closing:
+            try:
+                connection = await self.broker.connect()
+                channel = await connection.channel()
+                await channel.set_prefetch(self.prefetch)
+                if self.on_connect is not None:
+                    await self.on_connect(channel)
+                await channel.consume(self.queue_name, self._on_message)
+            except Exception as e:
+                logger.warning(
+                    f"AMQP consumer for {self.queue_name} failed to start ({e}), "
+                    f"retrying in {delay:.1f}s"
+                )
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+                continue
+
+            delay = self.reconnect_delay
+            lost = asyncio.Event()
+            connection.add_close_callback(lost.set)
+            self._connected.set()
+            logger.info(
+                f"Consuming {self.queue_name} "
+                f"(prefetch={self.prefetch}, concurrency={self.concurrency})"
+            )
+            try:
+                await lost.wait()
+            finally:
+                self._connected.clear()
+                try:
+                    await connection.close()
+                except Exception:
+                    pass
+            if not self._closing:
+                logger.warning(f"AMQP consumer for {self.queue_name} lost connection")
+
+    async def _on_message(self, message):
+        async with self._slots:
+            try:
+                await self.handler(message)
+            except PoisonMessage as e:
+                await self._dead_letter(message, e)
+                return
+            except Exception as e:
+                if message.redelivered:
+                    await self._dead_letter(message, e)
+                else:
+                    logger.warning(f"Handler failed ({e}), requeueing message")
+                    await self._settle(message.reject(requeue=True))
+                return
+            self.processed += 1
+            await self._settle(message.ack())
+
+    async def _dead_letter(self, message, error: Exception):
+        logger.error(f"Dead-lettering message from {self.queue_name}: {error}")
+        self.dead_lettered += 1
+        if self.on_dead_letter is not None:
+            try:
+                await self.on_dead_letter(message, error)
+            except Exception as e:
+                logger.error(f"Dead-letter hook failed: {e}")
+        await self._settle(message.reject(requeue=False))
+
+    async def _settle(self, settle: Awaitable[None]):
+        # The channel may have died while the handler ran; the broker then
+        # redelivers the message and this ack/reject is moot
+        try:
+            await settle
+        except Exception as e:
+            logger.warning(f"Could not settle message on {self.queue_name}: {e}")
@@ -0,0 +1,214 @@
+"""Time-window decomposition for long scheduling horizons.
+
+One CP-SAT model over months of shifts and hundreds of employees does not
+finish within a request timeout. With ``constraints["solver"]["mode"] ==
+"decompose"`` the horizon is instead split into windows of ``window_days``
+dates, each extended by ``overlap_days`` on both sides so a window sees the
+shifts next to its boundaries:
+
+1. Every window is solved as its own ``ScheduleProblem`` (per-employee shift
+   caps prorated to the window's share of the horizon), ``parallel`` windows at
+   a time on threads; CP-SAT releases the GIL while it searches, so the
+   windows use separate cores.
+2. Each window contributes the assignments on its own (core) dates.
+3. The stitched schedule is checked with the evaluator, and a repair solve
+   over the full horizon, warm-started from it, re-opens only the dates
+   around window boundaries and the employees with violations (rest time
+   across a boundary, a weekly or total cap split between windows) while
+   every other assignment stays fixed.
+
+With ``compare_global`` a global solve over the whole horizon runs alongside
+and the result reports the objective gap between the two.
+"""
+
+import math
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+
+from evaluator import ScheduleMatrices
+from scheduling import ScheduleProblem, ShiftScheduleModel
+
+# Share of the time budget for the window solves; the rest is for the repair
+WINDOW_SHARE = 0.8
+
+# Violations the repair solve has to fix, by employee
+EMPLOYEE_VIOLATIONS = (
+    "max_shifts_per_day",
+    "max_shifts",
+    "min_rest",
+    "max_shifts_per_week",
+)
+
+
+def windows(dates: list[str], window_days: int, overlap_days: int) -> list[dict]:
+    """Split sorted dates into core windows, each extended by the overlap"""
+    return [
+        {
+            "start": start,
+            "core": dates[start : start + window_days],
+            "dates": dates[
+                max(start - overlap_days, 0) : start + window_days + overlap_days
+            ],
+        }
+        for start in range(0, len(dates), window_days)
+    ]
+
+
+def window_problem(
+    problem: ScheduleProblem, dates: list[str], horizon_days: int
+) -> ScheduleProblem:
+    """The part of `problem` on `dates`, with shift caps prorated to it"""
+    included = set(dates)
+    share = len(dates) / horizon_days
+    employees = []
+    for employee in problem.employees:
+        limit = problem.max_shifts_for(employee)
+        if limit is not None:
+            employee = replace(employee, max_shifts=math.ceil(limit * share))
+        employees.append(employee)
+    return replace(
+        problem,
+        employees=employees,
+        shifts=[shift for shift in problem.shifts if shift.date in included],
+        solver={},
+    )
+
+
+def solve_decomposed(
+    problem: ScheduleProblem, timeout_seconds: float, num_workers: int = 0
+) -> dict:
+    started = time.perf_counter()
+    options = problem.solver
+    window_days = int(options.get("window_days", 7))
+    overlap_days = int(options.get("overlap_days", 1))
+    if window_days < 1 or overlap_days < 0:
+        raise ValueError("solver.window_days must be >= 1 and overlap_days >= 0")
+
+    dates = sorted({shift.date for shift in problem.shifts})
+    plan = windows(dates, window_days, overlap_days)
+    parallel = max(
+        1, min(int(options.get("parallel") or os.cpu_count() or 1), len(plan))
+    )
+    # Windows beyond `parallel` wait for a thread, so split the budget in rounds
+    rounds = math.ceil(len(plan) / parallel)
+    window_timeout = timeout_seconds * WINDOW_SHARE / rounds
+    window_workers = max(1, (num_workers or os.cpu_count() or 1) // parallel)
+
+    def solve_window(window: dict) -> dict:
+        sub_problem = window_problem(problem, window["dates"], len(dates))
+        return ShiftScheduleModel(sub_problem).solve(window_timeout, window_workers)
+
+    with ThreadPoolExecutor(max_workers=parallel + 1) as executor:
+        global_future = None
+        if options.get("compare_global"):
+            global_problem = replace(problem, solver={})
+            global_future = executor.submit(
+                lambda: ShiftScheduleModel(global_problem).solve(
+                    timeout_seconds, window_workers
+                )
+            )
+        window_futures = [executor.submit(solve_window, window) for window in plan]
+        window_results = [future.result() for future in window_futures]
+        windows_time = time.perf_counter() - started
+
+        # Stitch: every window keeps the assignments on its core dates
+        stitched = set()
+        for window, result in zip(plan, window_results, strict=True):
+            core = set(window["core"])
+            stitched.update(
+                (a["employee_id"], a["shift_id"])
+                for a in result["assignments"]
+                if a["date"] in core
+            )
+        stitched = frozenset(stitched)
+
+        matrices = ScheduleMatrices(problem)
+        assigned, _ = matrices.assignment_matrix(stitched)
+        stitched_evaluation = matrices.evaluate(assigned, max_reported=None)
+        violators = frozenset(
+            violation["employee_id"]
+            for kind in EMPLOYEE_VIOLATIONS
+            for violation in stitched_evaluation["violations"][kind]
+        )
+        boundary = max(overlap_days, 1)
+        boundary_dates = frozenset(
+            date
+            for window in plan[1:]
+            for date in dates[
+                max(window["start"] - boundary, 0) : window["start"] + boundary
+            ]
+        )
+        # A window that found no schedule is solved again as part of the repair
+        boundary_dates |= frozenset(
+            date
+            for window, result in zip(plan, window_results, strict=True)
+            if result["objective_value"] is None
+            for date in window["core"]
+        )
+
+        # Repair: the stitched schedule with boundaries and violators re-opened
+        repair_problem = replace(
+            problem,
+            change_penalty=0,
+            affected_dates=boundary_dates,
+            affected_employees=violators,
+            solver={},
+        )
+        repair_model = ShiftScheduleModel(repair_problem, stitched)
+        repair_timeout = max(timeout_seconds - (time.perf_counter() - started), 1.0)
+        result = repair_model.solve(repair_timeout, num_workers)
+        repair_time = result["wall_time"]
+        diff = result.pop("diff", None)
+
+        global_result = global_future.result() if global_future is not None else None
+
+    result["wall_time"] = time.perf_counter() - started
+    result["decomposition"] = {
+        "window_days": window_days,
+        "overlap_days": overlap_days,
+        "parallel": parallel,
+        "windows_time": windows_time,
+        "windows": [
+            {
+                "first_date": window["core"][0],
+                "last_date": window["core"][-1],
+                "dates": len(window["dates"]),
+                "status": window_result["status"],
+                "objective_value": window_result["objective_value"],
+                "wall_time": window_result["wall_time"],
+                "model": window_result["model"],
+            }
+            for window, window_result in zip(plan, window_results, strict=True)
+        ],
+        "stitched": {
+            "objective_value": stitched_evaluation["objective_value"],
+            "valid": stitched_evaluation["valid"],
+            "violation_counts": stitched_evaluation["violation_counts"],
+        },
+        "repair": {
+            "status": result["status"],
+            "wall_time": repair_time,
+            "affected_dates": len(boundary_dates),
+            "affected_employees": len(violators),
+            "changed": len(diff["added"]) + len(diff["removed"]) if diff else None,
+            "frozen": repair_model.frozen,
+        },
+    }
+    if global_result is not None:
+        result["decomposition"]["global"] = {
+            key: global_result[key]
+            for key in ("status", "objective_value", "best_bound", "wall_time")
+        }
+        result["decomposition"]["gap"] = _gap(
+            global_result["objective_value"], result["objective_value"]
+        )
+    return result
+
+
+def _gap(global_objective: float | None, objective: float | None) -> float | None:
+    """Relative objective lost by decomposing (negative if it did better)"""
+    if global_objective is None or objective is None:
+        return None
+    return (global_objective - objective) / max(abs(global_objective), 1)
@@ -0,0 +1,311 @@
+"""Vectorized scoring and validation of shift schedules.
+
+``ScheduleMatrices`` compiles a ``ScheduleProblem`` into dense employee × shift
+NumPy matrices (availability and preference score) once; ``evaluate`` then
+checks an assignment matrix against them with whole-array operations:
+
+* coverage gaps and overstaffing per shift
+* hard-constraint violations: unavailable employees, more than
+  ``max_shifts_per_day`` on one date, more than an employee's shift limit,
+  less than ``min_rest_hours`` between two shifts, more than
+  ``max_shifts_per_week`` in an ISO week, overstaffed shifts and assignments
+  naming unknown employees or shifts
+* preference score, the solver's objective and per-employee load
+
+Used by the EvaluateSchedule RPC / ``POST /evaluate`` and to verify every
+solver result before it is returned.
+"""
+
+import time
+from typing import TYPE_CHECKING
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from scheduling import ScheduleProblem
+
+# Longest list of individual gaps/violations included in a report
+MAX_REPORTED = 100
+
+# Codes for employee fields: empty, and a value no shift has
+EMPTY = -1
+NO_MATCH = -2
+
+
+def _codes(values: list[str]) -> tuple[np.ndarray, dict[str, int]]:
+    vocabulary: dict[str, int] = {}
+    codes = np.fromiter(
+        (vocabulary.setdefault(value, len(vocabulary)) for value in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+    return codes, vocabulary
+
+
+def _lookup(values: list[str], vocabulary: dict[str, int]) -> np.ndarray:
+    return np.fromiter(
+        (vocabulary.get(value, NO_MATCH) if value else EMPTY for value in values),
+        dtype=np.int32,
+        count=len(values),
+    )
+
+
+class ScheduleMatrices:
+    def __init__(self, problem: "ScheduleProblem"):
+        started = time.perf_counter()
+        self.problem = problem
+        employees, shifts = problem.employees, problem.shifts
+        self.employee_index = {e.employee_id: i for i, e in enumerate(employees)}
+        self.shift_index = {s.shift_id: i for i, s in enumerate(shifts)}
+
+        shift_type, types = _codes([s.shift_type for s in shifts])
+        self.shift_day, dates = _codes([s.date for s in shifts])
+        self.dates = list(dates)
+        self.required = np.fromiter(
+            (s.required for s in shifts), dtype=np.int32, count=len(shifts)
+        )
+
+        unavailable_time = _lookup([e.unavailable_shift_time for e in employees], types)
+        unavailable_date = _lookup([e.unavailable_shift_date for e in employees], dates)
+        preferred_time = _lookup([e.preferred_shift_time for e in employees], types)
+        preferred_date = _lookup([e.preferred_shift_date for e in employees], dates)
+
+        # Same rule as ScheduleProblem.is_unavailable, for all pairs at once
+        time_matches = (unavailable_time[:, None] == EMPTY) | (
+            unavailable_time[:, None] == shift_type[None, :]
+        )
+        date_matches = (unavailable_date[:, None] == EMPTY) | (
+            unavailable_date[:, None] == self.shift_day[None, :]
+        )
+        has_rule = (unavailable_time != EMPTY) | (unavailable_date != EMPTY)
+        self.available = ~(has_rule[:, None] & time_matches & date_matches)
+
+        # Built in place in int32: mixing the bool masks with Python ints
+        # would allocate int64 temporaries
+        self.preference = (preferred_time[:, None] == shift_type[None, :]).astype(
+            np.int32
+        )
+        self.preference *= problem.preferred_shift_weight
+        date_preference = (preferred_date[:, None] == self.shift_day[None, :]).astype(
+            np.int32
+        )
+        date_preference *= problem.preferred_date_weight
+        self.preference += date_preference
+
+        limits = [problem.max_shifts_for(e) for e in employees]
+        self.max_shifts = np.fromiter(
+            (-1 if limit is None else limit for limit in limits),
+            dtype=np.int64,
+            count=len(limits),
+        )
+
+        # Shift start/end hours and ISO weeks, only for the rules that use them
+        self.start = self.end = self.shift_week = None
+        if problem.min_rest_hours is not None:
+            hours = np.array([s.hours() for s in shifts], dtype=np.float64)
+            hours = hours.reshape(len(shifts), 2)
+            self.start, self.end = hours[:, 0], hours[:, 1]
+        if problem.max_shifts_per_week is not None:
+            self.shift_week, weeks = _codes([s.week() for s in shifts])
+            self.weeks = list(weeks)
+        self.compile_time = time.perf_counter() - started
+
+    @property
+    def shape(self) -> tuple[int, int]:
+        return self.available.shape
+
+    def assignment_matrix(
+        self, pairs: frozenset[tuple[str, str]]
+    ) -> tuple[np.ndarray, list[tuple[str, str]]]:
+        """Boolean employee × shift matrix, plus pairs naming unknown IDs"""
+        rows, columns, unknown = [], [], []
+        for employee_id, shift_id in pairs:
+            e = self.employee_index.get(employee_id)
+            s = self.shift_index.get(shift_id)
+            if e is None or s is None:
+                unknown.append((employee_id, shift_id))
+            else:
+                rows.append(e)
+                columns.append(s)
+        assigned = np.zeros(self.shape, dtype=bool)
+        assigned[rows, columns] = True
+        return assigned, sorted(unknown)
+
+    def evaluate(
+        self,
+        assigned: np.ndarray,
+        unknown: list[tuple[str, str]] = (),
+        max_reported: int | None = MAX_REPORTED,
+    ) -> dict:
+        """Score an assignment matrix; ``max_reported=None`` lists every violation"""
+        started = time.perf_counter()
+        problem = self.problem
+        employees, shifts = problem.employees, problem.shifts
+
+        n_employees, n_shifts = self.shape
+        n_days = len(self.dates)
+
+        # Assignments are sparse: one pass over the matrix for the flat indices
+        # of assigned pairs (much faster than 2-D nonzero), then everything
+        # else is gathers and bincounts over those
+        assigned_flat = np.flatnonzero(assigned)
+        e_idx, s_idx = np.divmod(assigned_flat, n_shifts)
+
+        # Coverage per shift
+        staffed = np.bincount(s_idx, minlength=n_shifts)
+        missing = np.maximum(self.required - staffed, 0)
+        overstaffed = np.maximum(staffed - self.required, 0)
+
+        # Hard constraints
+        blocked = ~self.available.ravel()[assigned_flat]
+        unavailable_e, unavailable_s = e_idx[blocked], s_idx[blocked]
+
+        per_day = np.bincount(
+            e_idx * n_days + self.shift_day[s_idx], minlength=n_employees * n_days
+        ).reshape(n_employees, n_days)
+        over_day_e, over_day_d = np.nonzero(per_day > problem.max_shifts_per_day)
+
+        load = np.bincount(e_idx, minlength=n_employees)
+        over_limit = np.nonzero((self.max_shifts >= 0) & (load > self.max_shifts))[0]
+
+        # Rest: consecutive shifts of an employee, ordered by start time
+        rest_e = rest_first = rest_second = np.empty(0, dtype=np.int64)
+        if self.start is not None:
+            order = np.lexsort((self.start[s_idx], e_idx))
+            ordered_e, ordered_s = e_idx[order], s_idx[order]
+            too_close = (ordered_e[1:] == ordered_e[:-1]) & (
+                self.start[ordered_s[1:]]
+                < self.end[ordered_s[:-1]] + problem.min_rest_hours
+            )
+            pairs = np.flatnonzero(too_close)
+            rest_e = ordered_e[pairs]
+            rest_first, rest_second = ordered_s[pairs], ordered_s[pairs + 1]
+
+        over_week_e = over_week_w = np.empty(0, dtype=np.int64)
+        if self.shift_week is not None:
+            per_week = np.bincount(
+                e_idx * len(self.weeks) + self.shift_week[s_idx],
+                minlength=n_employees * len(self.weeks),
+            ).reshape(n_employees, len(self.weeks))
+            over_week_e, over_week_w = np.nonzero(
+                per_week > problem.max_shifts_per_week
+            )
+
+        preference_score = int(self.preference.ravel()[assigned_flat].sum())
+        total_missing = int(missing.sum())
+
+        gap_shifts = np.nonzero(missing)[0]
+        overstaffed_shifts = np.nonzero(overstaffed)[0]
+        violation_counts = {
+            "unavailable": len(unavailable_e),
+            "max_shifts_per_day": len(over_day_e),
+            "max_shifts": len(over_limit),
+            "min_rest": len(rest_e),
+            "max_shifts_per_week": len(over_week_e),
+            "overstaffed": len(overstaffed_shifts),
+            "unknown": len(unknown),
+        }
+        evaluation = {
+            "valid": not any(violation_counts.values()),
+            "objective_value": preference_score
+            - problem.understaffing_penalty * total_missing,
+            "preference_score": preference_score,
+            "coverage": {
+                "required": int(self.required.sum()),
+                "assigned": len(assigned_flat),
+                "missing": total_missing,
+                "shifts_with_gaps": len(gap_shifts),
+            },
+            "coverage_gaps": [
+                {
+                    "shift_id": shifts[s].shift_id,
+                    "date": shifts[s].date,
+                    "shift_type": shifts[s].shift_type,
+                    "missing": int(missing[s]),
+                }
+                for s in gap_shifts[:max_reported]
+            ],
+            "violation_counts": violation_counts,
+            "violations": {
+                "unavailable": [
+                    {
+                        "employee_id": employees[e].employee_id,
+                        "shift_id": shifts[s].shift_id,
+                    }
+                    for e, s in zip(
+                        unavailable_e[:max_reported],
+                        unavailable_s[:max_reported],
+                        strict=True,
+                    )
+                ],
+                "max_shifts_per_day": [
+                    {
+                        "employee_id": employees[e].employee_id,
+                        "date": self.dates[d],
+                        "shifts": int(per_day[e, d]),
+                    }
+                    for e, d in zip(
+                        over_day_e[:max_reported],
+                        over_day_d[:max_reported],
+                        strict=True,
+                    )
+                ],
+                "max_shifts": [
+                    {
+                        "employee_id": employees[e].employee_id,
+                        "shifts": int(load[e]),
+                        "limit": int(self.max_shifts[e]),
+                    }
+                    for e in over_limit[:max_reported]
+                ],
+                "min_rest": [
+                    {
+                        "employee_id": employees[e].employee_id,
+                        "shift_id": shifts[first].shift_id,
+                        "next_shift_id": shifts[second].shift_id,
+                        "rest_hours": float(self.start[second] - self.end[first]),
+                    }
+                    for e, first, second in zip(
+                        rest_e[:max_reported],
+                        rest_first[:max_reported],
+                        rest_second[:max_reported],
+                        strict=True,
+                    )
+                ],
+                "max_shifts_per_week": [
+                    {
+                        "employee_id": employees[e].employee_id,
+                        "week": self.weeks[w],
+                        "shifts": int(per_week[e, w]),
+                    }
+                    for e, w in zip(
+                        over_week_e[:max_reported],
+                        over_week_w[:max_reported],
+                        strict=True,
+                    )
+                ],
+                "overstaffed": [
+                    {
+                        "shift_id": shifts[s].shift_id,
+                        "extra": int(overstaffed[s]),
+                    }
+                    for s in overstaffed_shifts[:max_reported]
+                ],
+                "unknown": [
+                    {"employee_id": employee_id, "shift_id": shift_id}
+                    for employee_id, shift_id in unknown[:max_reported]
+                ],
+            },
+            "load": {
+                "min": int(load.min()) if len(load) else 0,
+                "max": int(load.max()) if len(load) else 0,
+                "mean": float(load.mean()) if len(load) else 0.0,
+                "per_employee": {
+                    employee.employee_id: int(count)
+                    for employee, count in zip(employees, load, strict=True)
+                },
+            },
+        }
+        evaluation["compile_time"] = self.compile_time
+        evaluation["evaluate_time"] = time.perf_counter() - started
+        return evaluation
@@ -0,0 +1,61 @@
+"""In-process fan-out of job status transitions to WatchJob / SSE watchers.
+
+The job store calls ``JobEvents.publish`` on every create and update, so a
+watcher hears about transitions made in this process immediately. Jobs updated
+by another replica (shared SQLite store) are picked up by polling the store
+every ``poll_interval`` seconds while no event arrives.
+"""
+
+import asyncio
+from collections.abc import AsyncIterator
+
+from job_store import TERMINAL_STATUSES, JobRecord
+
+
+class JobEvents:
+    def __init__(self, poll_interval: float = 1.0):
+        self.poll_interval = poll_interval
+        self._watchers: dict[str, set[asyncio.Queue]] = {}
+
+    @property
+    def watchers(self) -> int:
+        return sum(len(queues) for queues in self._watchers.values())
+
+    def publish(self, record: JobRecord):
+        queues = self._watchers.get(record.job_id)
+        if not queues:
+            return
+        snapshot = record.to_dict()
+        for queue in queues:
+            queue.put_nowait(snapshot)
+
+    async def watch(self, store, job_id: str) -> AsyncIterator[dict]:
+        """Yield the job's current state, then each status change until it finishes.
+
+        Yields nothing if the job does not exist.
+        """
+        queue: asyncio.Queue = asyncio.Queue()
+        self._watchers.setdefault(job_id, set()).add(queue)
+        try:
+            # Subscribed before reading, so no transition can slip in between
+            record = store.get(job_id)
+            if record is None:
+                return
+            job = record.to_dict()
+            yield job
+            while job["status"] not in TERMINAL_STATUSES:
+                try:
+                    update = await asyncio.wait_for(queue.get(), self.poll_interval)
+                except TimeoutError:
+                    record = store.get(job_id)
+                    if record is None:
+                        return
+                    update = record.to_dict()
+                if update["status"] != job["status"]:
+                    yield update
+                job = update
+        finally:
+            queues = self._watchers[job_id]
+            queues.discard(queue)
+            if not queues:
+                del self._watchers[job_id]
@@ -0,0 +1,181 @@
+"""Per-job profiles of a solve's phases.
+
+A job submitted with ``profile`` set (or picked by ``PROFILE_SAMPLE_RATE``)
+runs in its solver process under ``capture()``. Each phase marked with
+``phase()`` gets its own ``cProfile`` profile, its wall time and the peak of
+the memory traced by ``tracemalloc`` while it ran:
+
+* ``parse``: decoding the problem JSON or protobuf and the warm start
+* ``build``: building the CP-SAT model
+* ``solve``: the search (CP-SAT runs in native threads, so its own time shows
+  up as the one ``solve`` call)
+* ``verify``: re-checking the result with the evaluator
+* ``encode``: serializing the result
+
+Outside ``capture()``, ``phase()`` returns a shared no-op context manager, so
+jobs that are not profiled run no profiler and trace no allocations.
+
+The captured profile is stored with the job as marshalled data. ``pstats_data``
+turns it into a file in the format ``cProfile`` writes, which ``pstats``,
+snakeviz and similar tools load; ``summary`` is the JSON view.
+"""
+
+import cProfile
+import marshal
+import pstats
+import time
+import tracemalloc
+from collections.abc import Iterator
+from contextlib import contextmanager, nullcontext
+
+PHASES = ("parse", "build", "solve", "verify", "encode")
+
+# Bump when the marshalled layout changes
+PROFILE_VERSION = 1
+
+# The profile being captured in this process, if any
+_profile: "JobProfile | None" = None
+_NOT_PROFILED = nullcontext()
+
+
+class JobProfile:
+    """Profiles of the phases run under ``capture()``"""
+
+    def __init__(self):
+        self.phases: dict[str, dict] = {}
+        self._active = False
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        if self._active:
+            # Only one profiler runs at a time: a nested phase is part of the
+            # one around it
+            yield
+            return
+        self._active = True
+        profiler = cProfile.Profile()
+        tracemalloc.reset_peak()
+        before, _ = tracemalloc.get_traced_memory()
+        started = time.perf_counter()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            seconds = time.perf_counter() - started
+            after, peak = tracemalloc.get_traced_memory()
+            self._active = False
+            profiler.create_stats()
+            self.phases[name] = {
+                "seconds": seconds,
+                "peak_memory_bytes": peak,
+                # Still held at the end of the phase
+                "allocated_bytes": after - before,
+                "stats": profiler.stats,
+            }
+
+    def dumps(self) -> bytes:
+        return marshal.dumps({"version": PROFILE_VERSION, "phases": self.phases})
+
+
+@contextmanager
+def capture(enabled: bool) -> Iterator[JobProfile | None]:
+    """Profile the phases run in this block, if `enabled`"""
+    global _profile
+    if not enabled:
+        yield None
+        return
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    _profile = JobProfile()
+    try:
+        yield _profile
+    finally:
+        _profile = None
+        if not tracing:
+            tracemalloc.stop()
+
+
+def phase(name: str):
+    """Context manager marking a phase of the solve being profiled"""
+    if _profile is None:
+        return _NOT_PROFILED
+    return _profile.phase(name)
+
+
+def load(data: bytes) -> dict[str, dict]:
+    """A stored profile's phases, in the order they ran"""
+    try:
+        profile = marshal.loads(data)
+    except (EOFError, ValueError, TypeError) as e:
+        raise ValueError(f"Unreadable profile: {e}") from e
+    if not isinstance(profile, dict) or profile.get("version") != PROFILE_VERSION:
+        raise ValueError("Unsupported profile version")
+    return profile["phases"]
+
+
+class _RawStats:
+    """What ``pstats.Stats`` loads from besides a file: a ``create_stats()``
+    method and the raw ``stats`` dict"""
+
+    def __init__(self, stats: dict):
+        self.stats = stats
+
+    def create_stats(self):
+        pass
+
+
+def _stats(phases: dict[str, dict], names: list[str]) -> pstats.Stats:
+    # Copied: add() merges into the first phase's dict
+    stats = pstats.Stats(_RawStats(dict(phases[names[0]]["stats"])))
+    for name in names[1:]:
+        stats.add(_RawStats(phases[name]["stats"]))
+    return stats
+
+
+def pstats_data(data: bytes, phase_name: str | None = None) -> bytes:
+    """The profile of one phase, or of all phases merged, as a .pstats file"""
+    phases = load(data)
+    names = list(phases)
+    if phase_name is not None:
+        if phase_name not in phases:
+            raise KeyError(phase_name)
+        names = [phase_name]
+    if not names:
+        return marshal.dumps({})
+    # The file format Stats.dump_stats() writes
+    return marshal.dumps(_stats(phases, names).stats)
+
+
+def summary(data: bytes, top: int = 20) -> dict:
+    """Per phase: time, memory and the `top` functions by cumulative time"""
+    phases = load(data)
+    result = []
+    for name, captured in phases.items():
+        stats = _stats(phases, [name]).sort_stats(pstats.SortKey.CUMULATIVE)
+        functions = []
+        for function in stats.fcn_list[:top]:
+            primitive_calls, calls, total_time, cumulative_time, _ = stats.stats[
+                function
+            ]
+            functions.append(
+                {
+                    "function": pstats.func_std_string(function),
+                    "calls": calls,
+                    "primitive_calls": primitive_calls,
+                    "total_time": total_time,
+                    "cumulative_time": cumulative_time,
+                }
+            )
+        result.append(
+            {
+                "phase": name,
+                "seconds": captured["seconds"],
+                "peak_memory_bytes": captured["peak_memory_bytes"],
+                "allocated_bytes": captured["allocated_bytes"],
+                "function_calls": stats.total_calls,
+                "top_functions": functions,
+            }
+        )
+    return {"phases": result}
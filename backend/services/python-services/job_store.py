@@ -0,0 +1,686 @@
+"""Job state storage.
+
+Two interchangeable backends, selected by ``make_job_store(url)``:
+
+* ``JobStore`` (``memory://``) keeps jobs in this process only.
+* ``SqliteJobStore`` (``sqlite:///path/to/jobs.db``) persists jobs in a SQLite
+  database in WAL mode, so every API process that opens the same file (replicas
+  on one host or a shared volume) sees the same jobs, and queued jobs survive
+  a restart.
+
+In memory, jobs are kept as compact ``__slots__`` records in a single dict, so
+lookups are O(1). The request payload (``constraints_json``/``objectives_json``
+or a serialized ``ScheduleProblem``, often several MB for real rosters) is
+stored once per job and dropped as soon as the solver no longer needs it.
+Finished jobs are evicted after ``ttl_seconds`` or, least recently used first,
+whenever the store grows beyond ``max_bytes``. Jobs that are still queued or
+running are never evicted.
+"""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import time
+from collections import Counter, OrderedDict
+from collections.abc import Callable
+
+logger = logging.getLogger(__name__)
+
+MEMORY_URL = "memory://"
+SQLITE_URL = "sqlite://"
+
+TERMINAL_STATUSES = frozenset({"completed", "failed", "cancelled"})
+
+# Rough per-record overhead (object, slots, dict entry, id string)
+RECORD_OVERHEAD_BYTES = 400
+
+
+class JobPayload:
+    __slots__ = (
+        "constraints_json",
+        "objectives_json",
+        "base_assignment_json",
+        "problem",
+        "base_solution",
+        "profile",
+        "priority",
+    )
+
+    def __init__(
+        self,
+        constraints_json: str,
+        objectives_json: str,
+        base_assignment_json: str = "",
+        problem: bytes = b"",
+        base_solution: bytes = b"",
+        profile: bool = False,
+        priority: int = 0,
+    ):
+        self.constraints_json = constraints_json
+        self.objectives_json = objectives_json
+        # Previous schedule to warm-start from
+        self.base_assignment_json = base_assignment_json
+        # Serialized ScheduleProblem / ScheduleSolution of a typed request
+        self.problem = problem
+        self.base_solution = base_solution
+        # Capture a profile of the solve (see job_profile.py)
+        self.profile = profile
+        # Broker / solver pool priority of the job's class (see admission.py)
+        self.priority = priority
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            len(self.constraints_json)
+            + len(self.objectives_json)
+            + len(self.base_assignment_json)
+            + len(self.problem)
+            + len(self.base_solution)
+        )
+
+
+class JobRecord:
+    __slots__ = (
+        "job_id",
+        "status",
+        "problem_type",
+        "timeout_seconds",
+        "created_at",
+        "completed_at",
+        "result_json",
+        "solution",
+        "error_message",
+        "problem_id",
+        "profile",
+        "payload",
+        "nbytes",
+    )
+
+    def __init__(
+        self,
+        job_id: str,
+        problem_type: str,
+        timeout_seconds: int,
+        payload: JobPayload | None,
+        created_at: int | None = None,
+        problem_id: str = "",
+    ):
+        self.job_id = job_id
+        self.status = "queued"
+        self.problem_type = problem_type
+        self.timeout_seconds = timeout_seconds
+        self.created_at = created_at if created_at is not None else int(time.time())
+        self.completed_at: int | None = None
+        self.result_json: str | None = None
+        # Serialized ScheduleSolution, for typed problems
+        self.solution: bytes | None = None
+        self.error_message: str | None = None
+        # Stored problem a typed job solved (its solution's indices refer to it)
+        self.problem_id = problem_id
+        # Marshalled profile of a profiled job's solve (see job_profile.py)
+        self.profile: bytes | None = None
+        self.payload = payload
+        self.nbytes = 0
+
+    @property
+    def finished(self) -> bool:
+        return self.status in TERMINAL_STATUSES
+
+    def measure(self) -> int:
+        return (
+            RECORD_OVERHEAD_BYTES
+            + (self.payload.nbytes if self.payload is not None else 0)
+            + len(self.result_json or "")
+            + len(self.solution or b"")
+            + len(self.error_message or "")
+            + len(self.problem_id)
+            + len(self.profile or b"")
+        )
+
+    def to_dict(self, include_result: bool = True) -> dict:
+        job = {
+            "job_id": self.job_id,
+            "status": self.status,
+            "problem_type": self.problem_type,
+            "timeout_seconds": self.timeout_seconds,
+            "created_at": self.created_at,
+            "error_message": self.error_message,
+            "completed_at": self.completed_at,
+            "problem_id": self.problem_id or None,
+            "profiled": self.profile is not None,
+        }
+        if include_result:
+            job["result_json"] = self.result_json
+            job["solution"] = self.solution
+        return job
+
+
+def make_job_store(
+    url: str, ttl_seconds: float = 3600, max_bytes: int = 256 * 1024 * 1024
+):
+    if url.startswith(SQLITE_URL):
+        return SqliteJobStore(url.removeprefix(SQLITE_URL), ttl_seconds=ttl_seconds)
+    return JobStore(ttl_seconds=ttl_seconds, max_bytes=max_bytes)
+
+
+class JobStore:
+    # Whether other processes see the jobs (and can apply their results)
+    shared = False
+
+    def __init__(
+        self,
+        ttl_seconds: float = 3600,
+        max_bytes: int = 256 * 1024 * 1024,
+        sweep_interval: float = 60,
+    ):
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.sweep_interval = sweep_interval
+        self.evicted = 0
+        # Called with every created or updated record
+        self.listeners: list[Callable[[JobRecord], None]] = []
+
+        self._jobs: dict[str, JobRecord] = {}
+        # Finished jobs in least-recently-used order (eviction candidates)
+        self._finished: OrderedDict[str, None] = OrderedDict()
+        self._status_counts: Counter[str] = Counter()
+        # Stored problem ID -> jobs referring to it
+        self._problem_refs: Counter[str] = Counter()
+        self._bytes = 0
+        self._last_sweep = time.monotonic()
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __contains__(self, job_id: str) -> bool:
+        return job_id in self._jobs
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    def stats(self) -> dict:
+        return {
+            "jobs": len(self._jobs),
+            "finished": len(self._finished),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "evicted": self.evicted,
+        }
+
+    def count_by_status(self) -> dict[str, int]:
+        return {status: count for status, count in self._status_counts.items() if count}
+
+    def references_problem(self, problem_id: str) -> bool:
+        """Whether a job in the store solved the stored problem `problem_id`"""
+        return self._problem_refs[problem_id] > 0
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    def create(
+        self,
+        job_id: str,
+        problem_type: str,
+        constraints_json: str,
+        objectives_json: str,
+        timeout_seconds: int,
+        base_assignment_json: str = "",
+        problem: bytes = b"",
+        base_solution: bytes = b"",
+        problem_id: str = "",
+        profile: bool = False,
+        priority: int = 0,
+    ) -> JobRecord:
+        record = JobRecord(
+            job_id,
+            problem_type,
+            timeout_seconds,
+            JobPayload(
+                constraints_json,
+                objectives_json,
+                base_assignment_json,
+                problem,
+                base_solution,
+                profile,
+                priority,
+            ),
+            problem_id=problem_id,
+        )
+        self._jobs[job_id] = record
+        self._status_counts[record.status] += 1
+        if problem_id:
+            self._problem_refs[problem_id] += 1
+        self._remeasure(record)
+        self._maybe_sweep()
+        self._notify(record)
+        return record
+
+    def get(self, job_id: str) -> JobRecord | None:
+        record = self._jobs.get(job_id)
+        if record is not None and job_id in self._finished:
+            self._finished.move_to_end(job_id)
+        return record
+
+    def update(self, job_id: str, **fields) -> JobRecord | None:
+        """Set record fields; a terminal status also drops the payload"""
+        record = self._jobs.get(job_id)
+        if record is None:
+            return None
+        previous = record.status
+        for key, value in fields.items():
+            setattr(record, key, value)
+        if record.status != previous:
+            self._status_counts[previous] -= 1
+            self._status_counts[record.status] += 1
+        if record.finished:
+            record.payload = None
+            if record.completed_at is None:
+                record.completed_at = int(time.time())
+            self._finished[job_id] = None
+            self._finished.move_to_end(job_id)
+        self._remeasure(record)
+        self._evict_over_budget()
+        self._notify(record)
+        return record
+
+    def release_payload(self, job_id: str):
+        """Drop the payload once it has been handed to a solver"""
+        record = self._jobs.get(job_id)
+        if record is not None and record.payload is not None:
+            record.payload = None
+            self._remeasure(record)
+
+    def list(
+        self, status: str | None = None, limit: int = 50, offset: int = 0
+    ) -> tuple[list[JobRecord], int]:
+        """Newest jobs first, optionally filtered by status, plus the total"""
+        jobs = [
+            record
+            for record in reversed(self._jobs.values())
+            if status is None or record.status == status
+        ]
+        return jobs[offset : offset + limit], len(jobs)
+
+    def evict_expired(self, now: float | None = None) -> int:
+        now = time.time() if now is None else now
+        expired = [
+            job_id
+            for job_id in self._finished
+            if now - self._jobs[job_id].completed_at > self.ttl_seconds
+        ]
+        for job_id in expired:
+            self._evict(job_id)
+        return len(expired)
+
+    def _notify(self, record: JobRecord):
+        for listener in self.listeners:
+            listener(record)
+
+    def _remeasure(self, record: JobRecord):
+        nbytes = record.measure()
+        self._bytes += nbytes - record.nbytes
+        record.nbytes = nbytes
+
+    def _evict(self, job_id: str):
+        record = self._jobs.pop(job_id)
+        self._finished.pop(job_id, None)
+        self._status_counts[record.status] -= 1
+        if record.problem_id:
+            self._problem_refs[record.problem_id] -= 1
+            if not self._problem_refs[record.problem_id]:
+                del self._problem_refs[record.problem_id]
+        self._bytes -= record.nbytes
+        self.evicted += 1
+
+    def _evict_over_budget(self):
+        while self._bytes > self.max_bytes and self._finished:
+            self._evict(next(iter(self._finished)))
+
+    def _maybe_sweep(self):
+        now = time.monotonic()
+        if now - self._last_sweep >= self.sweep_interval:
+            self._last_sweep = now
+            self.evict_expired()
+        self._evict_over_budget()
+
+
+class SqliteJobStore:
+    """Job store persisted in SQLite (WAL mode).
+
+    Writes are buffered and flushed in one transaction every
+    ``flush_interval`` seconds from a worker thread, so bursts of status
+    updates cost one fsync instead of one each and never block the event
+    loop. ``get()`` sees this process's unflushed writes; other processes see
+    them after the next flush. Terminal states are sticky: an upsert never
+    overwrites a job another process already marked completed or failed.
+
+    Payloads are not persisted. They stay in this process until the solver has
+    them, like in ``JobStore``; a job queued through RabbitMQ carries its
+    payload in the task message.
+    """
+
+    shared = True
+
+    SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS jobs (
+            job_id TEXT PRIMARY KEY,
+            status TEXT NOT NULL,
+            problem_type TEXT NOT NULL,
+            timeout_seconds INTEGER NOT NULL,
+            created_at INTEGER NOT NULL,
+            completed_at INTEGER,
+            result_json TEXT,
+            error_message TEXT,
+            solution BLOB,
+            problem_id TEXT,
+            profile BLOB
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS jobs_status ON jobs (status, created_at)",
+        "CREATE INDEX IF NOT EXISTS jobs_created ON jobs (created_at)",
+        "CREATE INDEX IF NOT EXISTS jobs_completed ON jobs (completed_at)",
+    )
+    COLUMNS = (
+        "job_id",
+        "status",
+        "problem_type",
+        "timeout_seconds",
+        "created_at",
+        "completed_at",
+        "result_json",
+        "error_message",
+        "solution",
+        "problem_id",
+        "profile",
+    )
+    UPSERT = f"""
+        INSERT INTO jobs ({", ".join(COLUMNS)})
+        VALUES ({", ".join("?" * len(COLUMNS))})
+        ON CONFLICT (job_id) DO UPDATE SET
+            status = excluded.status,
+            completed_at = excluded.completed_at,
+            result_json = excluded.result_json,
+            error_message = excluded.error_message,
+            solution = excluded.solution,
+            profile = excluded.profile
+        WHERE jobs.status NOT IN ({", ".join(f"'{s}'" for s in TERMINAL_STATUSES)})
+    """
+
+    def __init__(
+        self,
+        path: str,
+        ttl_seconds: float = 3600,
+        flush_interval: float = 0.05,
+        batch_size: int = 500,
+        sweep_interval: float = 60,
+    ):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.flush_interval = flush_interval
+        self.batch_size = batch_size
+        self.sweep_interval = sweep_interval
+        self.evicted = 0
+        self.flushes = 0
+        # Called with every created or updated record
+        self.listeners: list[Callable[[JobRecord], None]] = []
+
+        # Reads happen on the event loop, writes in a worker thread; WAL lets
+        # them run concurrently on separate connections
+        self._reader = self._connect()
+        self._writer = self._connect()
+        with self._writer:
+            for statement in self.SCHEMA:
+                self._writer.execute(statement)
+            self._migrate()
+
+        self._payloads: dict[str, JobPayload] = {}
+        # Records changed in this process and not yet committed
+        self._pending: dict[str, JobRecord] = {}
+        self._flushing: dict[str, JobRecord] = {}
+        self._has_pending = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+
+    def _migrate(self):
+        """Add columns (and their indexes) introduced after a database was created"""
+        existing = {row[1] for row in self._writer.execute("PRAGMA table_info(jobs)")}
+        for column, kind in (
+            ("solution", "BLOB"),
+            ("problem_id", "TEXT"),
+            ("profile", "BLOB"),
+        ):
+            if column not in existing:
+                self._writer.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        self._writer.execute(
+            "CREATE INDEX IF NOT EXISTS jobs_problem ON jobs (problem_id)"
+        )
+
+    def _connect(self) -> sqlite3.Connection:
+        # Each connection is only used by one thread at a time, but not
+        # necessarily the one that opened it (the store is built at import)
+        connection = sqlite3.connect(self.path, timeout=10, check_same_thread=False)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    def __len__(self) -> int:
+        return self._reader.execute("SELECT COUNT(*) FROM jobs").fetchone()[0]
+
+    def __contains__(self, job_id: str) -> bool:
+        return self.get(job_id) is not None
+
+    @property
+    def nbytes(self) -> int:
+        return sum(
+            os.path.getsize(path)
+            for path in (self.path, f"{self.path}-wal")
+            if os.path.exists(path)
+        )
+
+    def stats(self) -> dict:
+        return {
+            "jobs": len(self),
+            "pending_writes": len(self._pending) + len(self._flushing),
+            "bytes": self.nbytes,
+            "evicted": self.evicted,
+            "flushes": self.flushes,
+        }
+
+    def count_by_status(self) -> dict[str, int]:
+        """Committed jobs by status (uses the status index)"""
+        return dict(
+            self._reader.execute(
+                "SELECT status, COUNT(*) FROM jobs GROUP BY status"
+            ).fetchall()
+        )
+
+    def references_problem(self, problem_id: str) -> bool:
+        """Whether a job in the store solved the stored problem `problem_id`"""
+        if any(
+            record.problem_id == problem_id
+            for record in (*self._pending.values(), *self._flushing.values())
+        ):
+            return True
+        row = self._reader.execute(
+            "SELECT 1 FROM jobs WHERE problem_id = ? LIMIT 1", (problem_id,)
+        ).fetchone()
+        return row is not None
+
+    async def start(self):
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        self._flush(self._take_pending())
+        self._reader.close()
+        self._writer.close()
+
+    def create(
+        self,
+        job_id: str,
+        problem_type: str,
+        constraints_json: str,
+        objectives_json: str,
+        timeout_seconds: int,
+        base_assignment_json: str = "",
+        problem: bytes = b"",
+        base_solution: bytes = b"",
+        problem_id: str = "",
+        profile: bool = False,
+        priority: int = 0,
+    ) -> JobRecord:
+        payload = JobPayload(
+            constraints_json,
+            objectives_json,
+            base_assignment_json,
+            problem,
+            base_solution,
+            profile,
+            priority,
+        )
+        record = JobRecord(
+            job_id, problem_type, timeout_seconds, payload, problem_id=problem_id
+        )
+        self._payloads[job_id] = payload
+        self._mark_dirty(record)
+        self._notify(record)
+        return record
+
+    def get(self, job_id: str) -> JobRecord | None:
+        record = self._pending.get(job_id) or self._flushing.get(job_id)
+        if record is not None:
+            return record
+        row = self._reader.execute(
+            f"SELECT {', '.join(self.COLUMNS)} FROM jobs WHERE job_id = ?",
+            (job_id,),
+        ).fetchone()
+        return self._from_row(row) if row is not None else None
+
+    def update(self, job_id: str, **fields) -> JobRecord | None:
+        """Set record fields; a terminal status also drops the payload"""
+        record = self.get(job_id)
+        if record is None:
+            return None
+        for key, value in fields.items():
+            setattr(record, key, value)
+        if record.finished:
+            record.payload = None
+            self._payloads.pop(job_id, None)
+            if record.completed_at is None:
+                record.completed_at = int(time.time())
+        self._mark_dirty(record)
+        self._notify(record)
+        return record
+
+    def release_payload(self, job_id: str):
+        """Drop the payload once it has been handed to a solver"""
+        self._payloads.pop(job_id, None)
+        record = self._pending.get(job_id) or self._flushing.get(job_id)
+        if record is not None:
+            record.payload = None
+
+    def list(
+        self, status: str | None = None, limit: int = 50, offset: int = 0
+    ) -> tuple[list[JobRecord], int]:
+        """Newest jobs first, optionally filtered by status, plus the total"""
+        where, params = ("WHERE status = ?", (status,)) if status else ("", ())
+        total = self._reader.execute(
+            f"SELECT COUNT(*) FROM jobs {where}", params
+        ).fetchone()[0]
+        rows = self._reader.execute(
+            f"SELECT {', '.join(self.COLUMNS)} FROM jobs {where} "
+            "ORDER BY created_at DESC, rowid DESC LIMIT ? OFFSET ?",
+            (*params, limit, offset),
+        ).fetchall()
+        return [self._from_row(row) for row in rows], total
+
+    def evict_expired(self, now: float | None = None) -> int:
+        now = time.time() if now is None else now
+        with self._writer:
+            cursor = self._writer.execute(
+                "DELETE FROM jobs WHERE completed_at < ?", (now - self.ttl_seconds,)
+            )
+        self.evicted += cursor.rowcount
+        return cursor.rowcount
+
+    def _notify(self, record: JobRecord):
+        for listener in self.listeners:
+            listener(record)
+
+    def _from_row(self, row: tuple) -> JobRecord:
+        job = dict(zip(self.COLUMNS, row, strict=True))
+        record = JobRecord(
+            job["job_id"],
+            job["problem_type"],
+            job["timeout_seconds"],
+            self._payloads.get(job["job_id"]),
+            created_at=job["created_at"],
+            problem_id=job["problem_id"] or "",
+        )
+        record.status = job["status"]
+        record.completed_at = job["completed_at"]
+        record.result_json = job["result_json"]
+        record.error_message = job["error_message"]
+        record.solution = job["solution"]
+        record.profile = job["profile"]
+        return record
+
+    def _mark_dirty(self, record: JobRecord):
+        self._pending[record.job_id] = record
+        if self._flusher is None:
+            # No event loop driving flushes (scripts, tests): write through
+            self._flush(self._take_pending())
+        else:
+            self._has_pending.set()
+
+    def _take_pending(self) -> dict[str, JobRecord]:
+        batch = dict(self._pending)
+        self._pending.clear()
+        return batch
+
+    def _flush(self, batch: dict[str, JobRecord]):
+        if not batch:
+            return
+        rows = [
+            tuple(getattr(record, column) for column in self.COLUMNS)
+            for record in batch.values()
+        ]
+        with self._writer:
+            self._writer.executemany(self.UPSERT, rows)
+        self.flushes += 1
+
+    async def _run(self):
+        last_sweep = time.monotonic()
+        while True:
+            await self._has_pending.wait()
+            self._has_pending.clear()
+            # Let a burst of updates accumulate into one transaction
+            if len(self._pending) < self.batch_size:
+                await asyncio.sleep(self.flush_interval)
+            self._flushing = self._take_pending()
+            try:
+                await asyncio.to_thread(self._flush, self._flushing)
+            except sqlite3.Error as e:
+                logger.error(f"Job store flush failed, retrying: {e}")
+                for job_id, record in self._flushing.items():
+                    self._pending.setdefault(job_id, record)
+                self._has_pending.set()
+                await asyncio.sleep(self.flush_interval)
+            finally:
+                self._flushing = {}
+
+            if time.monotonic() - last_sweep >= self.sweep_interval:
+                last_sweep = time.monotonic()
+                try:
+                    await asyncio.to_thread(self.evict_expired)
+                except sqlite3.Error as e:
+                    logger.error(f"Job store TTL sweep failed: {e}")
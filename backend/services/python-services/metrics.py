@@ -0,0 +1,244 @@
+"""Prometheus metrics for the API service and the solver workers.
+
+Request-path metrics are recorded as they happen, and each costs one
+histogram/counter update on a pre-resolved label child:
+
+* ``RpcMetricsInterceptor`` times every gRPC call and counts it by status
+  code (``grpc_server_handling_seconds`` / ``grpc_server_handled_total``).
+* ``AsyncPublisher`` observes the publish-to-confirm latency per queue.
+* ``SolverPool`` observes solve durations by problem type and outcome, and
+  the size of each CP-SAT model it builds.
+* ``CompletionService`` observes each completion's time to first token and
+  counts completion requests by source (model call, coalesced or cached)
+  and generations cancelled mid-stream.
+* ``AdmissionController`` observes how long admitted jobs wait for a solver
+  per priority class, and counts jobs rejected by the limit they hit.
+
+State that is cheaper to read than to track (job store size, jobs by status,
+publish buffer, solver pool occupancy, admitted jobs, broker queue depth) is
+collected by ``ServiceCollector`` when ``/metrics`` is scraped. Solver workers
+running ``worker.py`` expose their own metrics on ``WORKER_METRICS_PORT``.
+"""
+
+import asyncio
+import time
+from collections.abc import Callable
+
+import grpc
+from prometheus_client import Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+RPC_LATENCY = Histogram(
+    "grpc_server_handling_seconds",
+    "Time to handle a gRPC call (to the end of the stream for streaming RPCs)",
+    ["grpc_method"],
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10),
+)
+RPC_HANDLED = Counter(
+    "grpc_server_handled_total",
+    "gRPC calls completed, by status code",
+    ["grpc_method", "grpc_code"],
+)
+PUBLISH_LATENCY = Histogram(
+    "amqp_publish_confirm_seconds",
+    "Time from publish() to the broker's confirm, including buffering",
+    ["queue"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 5),
+)
+SOLVE_DURATION = Histogram(
+    "solver_solve_seconds",
+    "Time a solve held a solver process",
+    ["problem_type", "outcome"],
+    buckets=(0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+MODEL_VARIABLES = Histogram(
+    "solver_model_variables",
+    "Variables per CP-SAT model",
+    ["problem_type"],
+    buckets=(100, 1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000),
+)
+MODEL_CONSTRAINTS = Histogram(
+    "solver_model_constraints",
+    "Constraints per CP-SAT model",
+    ["problem_type"],
+    buckets=(100, 1_000, 10_000, 50_000, 100_000, 500_000, 1_000_000, 5_000_000),
+)
+COMPLETION_TIME_TO_FIRST_TOKEN = Histogram(
+    "completion_time_to_first_token_seconds",
+    "Time from a completion request to its first generated token",
+    ["model"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30),
+)
+COMPLETION_CANCELLED = Counter(
+    "completion_cancelled_total",
+    "Generations stopped because every caller waiting for them went away",
+    ["model"],
+)
+COMPLETION_REQUESTS = Counter(
+    "completion_requests_total",
+    "Completion requests by how they were answered: a new model call, "
+    "following an identical one in progress, or from the cache",
+    ["model", "source"],
+)
+JOB_QUEUE_WAIT = Histogram(
+    "job_queue_wait_seconds",
+    "Time from a job's admission to a solver starting on it",
+    ["priority"],
+    buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60, 120, 300, 600),
+)
+JOBS_REJECTED = Counter(
+    "jobs_rejected_total",
+    "Jobs turned away by admission control, by the limit they hit",
+    ["priority", "limit"],
+)
+
+
+def observe_model(problem_type: str, model: dict | None):
+    if model:
+        MODEL_VARIABLES.labels(problem_type).observe(model["variables"])
+        MODEL_CONSTRAINTS.labels(problem_type).observe(model["constraints"])
+
+
+class RpcMetricsInterceptor(grpc.aio.ServerInterceptor):
+    """Latency histogram and status-code counter for every gRPC method"""
+
+    def __init__(self):
+        self._latency: dict[str, Histogram] = {}
+        self._handled: dict[tuple[str, str], Counter] = {}
+
+    async def intercept_service(self, continuation, handler_call_details):
+        handler = await continuation(handler_call_details)
+        if handler is None:
+            return None
+        method = handler_call_details.method.rsplit("/", 1)[-1]
+        if handler.unary_unary:
+            return grpc.unary_unary_rpc_method_handler(
+                self._call(method, handler.unary_unary),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.stream_unary:
+            return grpc.stream_unary_rpc_method_handler(
+                self._call(method, handler.stream_unary),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        if handler.unary_stream:
+            return grpc.unary_stream_rpc_method_handler(
+                self._stream(method, handler.unary_stream),
+                request_deserializer=handler.request_deserializer,
+                response_serializer=handler.response_serializer,
+            )
+        return grpc.stream_stream_rpc_method_handler(
+            self._stream(method, handler.stream_stream),
+            request_deserializer=handler.request_deserializer,
+            response_serializer=handler.response_serializer,
+        )
+
+    def _call(self, method: str, behavior: Callable):
+        async def call(request, context):
+            started = time.perf_counter()
+            error = None
+            try:
+                return await behavior(request, context)
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                self._record(method, started, context, error)
+
+        return call
+
+    def _stream(self, method: str, behavior: Callable):
+        async def stream(request, context):
+            started = time.perf_counter()
+            error = None
+            try:
+                async for response in behavior(request, context):
+                    yield response
+            except BaseException as e:
+                error = e
+                raise
+            finally:
+                self._record(method, started, context, error)
+
+        return stream
+
+    def _record(self, method: str, started: float, context, error):
+        latency = self._latency.get(method)
+        if latency is None:
+            latency = self._latency[method] = RPC_LATENCY.labels(method)
+        latency.observe(time.perf_counter() - started)
+
+        code = context.code()
+        if isinstance(error, asyncio.CancelledError):
+            name = "CANCELLED"
+        elif isinstance(code, grpc.StatusCode):
+            # Set by context.abort() or context.set_code()
+            name = code.name
+        else:
+            name = "UNKNOWN" if error is not None else "OK"
+        handled = self._handled.get((method, name))
+        if handled is None:
+            handled = self._handled[method, name] = RPC_HANDLED.labels(method, name)
+        handled.inc()
+
+
+class ServiceCollector(Collector):
+    """Gauges read from the service's components at scrape time"""
+
+    def __init__(
+        self, job_store, publisher, solver_pool, admission, queue_depths: dict
+    ):
+        self.job_store = job_store
+        self.publisher = publisher
+        self.solver_pool = solver_pool
+        self.admission = admission
+        # queue name -> last sampled broker depth (see main.py)
+        self.queue_depths = queue_depths
+
+    def collect(self):
+        stats = self.job_store.stats()
+        yield GaugeMetricFamily(
+            "job_store_jobs", "Jobs in the job store", stats["jobs"]
+        )
+        yield GaugeMetricFamily(
+            "job_store_bytes", "Job store size in bytes", stats["bytes"]
+        )
+        by_status = GaugeMetricFamily("jobs", "Jobs by status", labels=["status"])
+        for status, count in sorted(self.job_store.count_by_status().items()):
+            by_status.add_metric([status], count)
+        yield by_status
+
+        yield GaugeMetricFamily(
+            "amqp_publish_buffered",
+            "Messages waiting for the broker in the publish buffer",
+            self.publisher.buffered,
+        )
+        depth = GaugeMetricFamily(
+            "amqp_queue_messages",
+            "Messages ready in a broker queue (sampled)",
+            labels=["queue"],
+        )
+        for queue, messages in sorted(self.queue_depths.items()):
+            depth.add_metric([queue], messages)
+        yield depth
+
+        yield GaugeMetricFamily(
+            "solver_pool_running", "Solves running", self.solver_pool.running
+        )
+        yield GaugeMetricFamily(
+            "solver_pool_waiting",
+            "Solves waiting for a solver process",
+            self.solver_pool.waiting,
+        )
+
+        active = GaugeMetricFamily(
+            "admission_active_jobs",
+            "Admitted jobs queued or running, by priority class",
+            labels=["priority"],
+        )
+        for priority, count in self.admission.active_by_priority().items():
+            active.add_metric([priority], count)
+        yield active
@@ -0,0 +1,370 @@
+"""Typed protobuf scheduling payloads.
+
+A ``ScheduleProblem`` message is the compact alternative to
+``constraints_json``/``objectives_json``: dates and shift types are sent once
+in string tables and referred to by index, and a ``ScheduleSolution`` lists
+assignments and coverage gaps as packed employee/shift indices instead of one
+JSON object per assignment. The API, the queue and the job store carry both as
+opaque bytes; only the solver process decodes the problem and encodes the
+solution.
+"""
+
+import json
+import os
+import sys
+import time
+from collections.abc import Callable
+
+from google.protobuf.message import DecodeError
+
+sys.path.append(os.path.join(os.path.dirname(__file__), "proto"))
+
+import service_pb2  # type: ignore  # noqa: E402
+
+import job_profile  # noqa: E402
+from scheduling import (  # noqa: E402
+    SHIFT_SCHEDULING,
+    Employee,
+    ScheduleProblem,
+    Shift,
+    parse_assignments,
+    solve_problem,
+    solver_options,
+)
+
+# Result keys with a field of their own in ScheduleSolution; the rest of a
+# result goes to details_json
+SOLUTION_FIELDS = frozenset(
+    {
+        "status",
+        "objective_value",
+        "best_bound",
+        "wall_time",
+        "assignments",
+        "coverage_gaps",
+    }
+)
+
+
+def _parse(message, data: bytes, name: str):
+    try:
+        message.ParseFromString(data)
+    except DecodeError as e:
+        raise ValueError(f"Invalid {name}: {e}") from e
+    return message
+
+
+def _lookup(table, index: int, name: str):
+    if index >= len(table):
+        raise ValueError(f"{name} index {index} out of range ({len(table)} entries)")
+    return table[index]
+
+
+def _optional_entry(message, field: str, table, name: str) -> str:
+    if not message.HasField(field):
+        return ""
+    return _lookup(table, getattr(message, field), name)
+
+
+def _optional(message, field: str, convert=int):
+    return convert(getattr(message, field)) if message.HasField(field) else None
+
+
+def decode_problem(data: bytes) -> ScheduleProblem:
+    """ScheduleProblem message -> ScheduleProblem.
+
+    Employees and shifts keep their message order, so the indices of a
+    ScheduleSolution refer to ``problem.employees``/``problem.shifts``.
+    """
+    message = _parse(service_pb2.ScheduleProblem(), data, "ScheduleProblem")
+    dates, shift_types = list(message.dates), list(message.shift_types)
+
+    employees = []
+    for row in message.employees:
+        if not row.employee_id:
+            raise ValueError("Employee without employee_id")
+        employees.append(
+            Employee(
+                employee_id=row.employee_id,
+                name=row.name,
+                initials=row.initials,
+                preferred_shift_time=_optional_entry(
+                    row, "preferred_shift_type", shift_types, "shift type"
+                ),
+                preferred_shift_date=_optional_entry(
+                    row, "preferred_date", dates, "date"
+                ),
+                unavailable_shift_time=_optional_entry(
+                    row, "unavailable_shift_type", shift_types, "shift type"
+                ),
+                unavailable_shift_date=_optional_entry(
+                    row, "unavailable_date", dates, "date"
+                ),
+                max_shifts=_optional(row, "max_shifts"),
+            )
+        )
+    if not employees:
+        raise ValueError("problem must list at least one employee")
+    if len({employee.employee_id for employee in employees}) != len(employees):
+        raise ValueError("problem lists an employee_id more than once")
+
+    shifts = []
+    for row in message.shifts:
+        if not row.shift_id:
+            raise ValueError("Shift without shift_id")
+        shifts.append(
+            Shift(
+                shift_id=row.shift_id,
+                date=_lookup(dates, row.date, "date"),
+                shift_type=_lookup(shift_types, row.shift_type, "shift type"),
+                time=row.time,
+                required=row.required,
+                duration_hours=(
+                    row.duration_hours if row.HasField("duration_hours") else 8.0
+                ),
+            )
+        )
+    if not shifts:
+        raise ValueError("problem must list at least one shift")
+    if len({shift.shift_id for shift in shifts}) != len(shifts):
+        raise ValueError("problem lists a shift_id more than once")
+
+    try:
+        solver = json.loads(message.solver_json) if message.solver_json else {}
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid solver_json: {e}") from e
+
+    max_per_day = _optional(message, "max_shifts_per_day")
+    preferred_shift_weight = _optional(message, "preferred_shift_weight")
+    preferred_date_weight = _optional(message, "preferred_date_weight")
+    understaffing_penalty = _optional(message, "understaffing_penalty")
+    change_penalty = _optional(message, "change_penalty")
+    return ScheduleProblem(
+        employees=employees,
+        shifts=shifts,
+        max_shifts_per_employee=_optional(message, "max_shifts_per_employee"),
+        max_shifts_per_day=max_per_day if max_per_day is not None else 1,
+        preferred_shift_weight=(
+            preferred_shift_weight if preferred_shift_weight is not None else 1
+        ),
+        preferred_date_weight=(
+            preferred_date_weight if preferred_date_weight is not None else 2
+        ),
+        understaffing_penalty=(
+            understaffing_penalty if understaffing_penalty is not None else 100
+        ),
+        change_penalty=change_penalty if change_penalty is not None else 1,
+        affected_dates=frozenset(
+            _lookup(dates, i, "date") for i in message.affected_dates
+        ),
+        affected_employees=frozenset(
+            _lookup(employees, i, "employee").employee_id
+            for i in message.affected_employees
+        ),
+        min_rest_hours=_optional(message, "min_rest_hours", float),
+        max_shifts_per_week=_optional(message, "max_shifts_per_week"),
+        solver=solver_options(solver),
+    )
+
+
+def encode_problem(problem: ScheduleProblem) -> bytes:
+    """ScheduleProblem -> serialized ScheduleProblem message"""
+    dates: dict[str, int] = {}
+    shift_types: dict[str, int] = {}
+
+    def index(table: dict[str, int], value: str) -> int:
+        return table.setdefault(value, len(table))
+
+    message = service_pb2.ScheduleProblem()
+    for shift in problem.shifts:
+        message.shifts.add(
+            shift_id=shift.shift_id,
+            date=index(dates, shift.date),
+            shift_type=index(shift_types, shift.shift_type),
+            time=shift.time,
+            required=shift.required,
+        )
+        if shift.duration_hours != 8.0:
+            message.shifts[-1].duration_hours = shift.duration_hours
+    employee_index = {}
+    for employee in problem.employees:
+        row = message.employees.add(
+            employee_id=employee.employee_id,
+            name=employee.name,
+            initials=employee.initials,
+        )
+        # Preferences naming no shift type or date still round-trip: they
+        # get a table entry of their own that no shift refers to
+        if employee.preferred_shift_time:
+            row.preferred_shift_type = index(shift_types, employee.preferred_shift_time)
+        if employee.preferred_shift_date:
+            row.preferred_date = index(dates, employee.preferred_shift_date)
+        if employee.unavailable_shift_time:
+            row.unavailable_shift_type = index(
+                shift_types, employee.unavailable_shift_time
+            )
+        if employee.unavailable_shift_date:
+            row.unavailable_date = index(dates, employee.unavailable_shift_date)
+        if employee.max_shifts is not None:
+            row.max_shifts = employee.max_shifts
+        employee_index.setdefault(employee.employee_id, len(employee_index))
+    unknown = problem.affected_employees - employee_index.keys()
+    if unknown:
+        raise ValueError(f"affected_employees not in the problem: {sorted(unknown)}")
+    message.affected_dates.extend(
+        index(dates, date) for date in sorted(problem.affected_dates)
+    )
+    message.affected_employees.extend(
+        sorted(employee_index[e] for e in problem.affected_employees)
+    )
+    message.dates.extend(dates)
+    message.shift_types.extend(shift_types)
+
+    if problem.max_shifts_per_employee is not None:
+        message.max_shifts_per_employee = problem.max_shifts_per_employee
+    if problem.max_shifts_per_week is not None:
+        message.max_shifts_per_week = problem.max_shifts_per_week
+    if problem.min_rest_hours is not None:
+        message.min_rest_hours = problem.min_rest_hours
+    message.max_shifts_per_day = problem.max_shifts_per_day
+    message.preferred_shift_weight = problem.preferred_shift_weight
+    message.preferred_date_weight = problem.preferred_date_weight
+    message.understaffing_penalty = problem.understaffing_penalty
+    message.change_penalty = problem.change_penalty
+    if problem.solver:
+        message.solver_json = json.dumps(problem.solver)
+    return message.SerializeToString()
+
+
+def encode_solution(problem: ScheduleProblem, result: dict) -> bytes:
+    """Solver result (or incumbent) -> serialized ScheduleSolution message"""
+    employee_index = {e.employee_id: i for i, e in enumerate(problem.employees)}
+    shift_index = {s.shift_id: i for i, s in enumerate(problem.shifts)}
+    message = service_pb2.ScheduleSolution(
+        status=result["status"], wall_time=result.get("wall_time") or 0.0
+    )
+    if result.get("objective_value") is not None:
+        message.objective_value = result["objective_value"]
+    if result.get("best_bound") is not None:
+        message.best_bound = result["best_bound"]
+    for assignment in result.get("assignments", []):
+        message.assigned_employees.append(employee_index[assignment["employee_id"]])
+        message.assigned_shifts.append(shift_index[assignment["shift_id"]])
+    for gap in result.get("coverage_gaps", []):
+        message.gap_shifts.append(shift_index[gap["shift_id"]])
+        message.gap_missing.append(gap["missing"])
+    details = {
+        key: value for key, value in result.items() if key not in SOLUTION_FIELDS
+    }
+    if details:
+        message.details_json = json.dumps(details)
+    return message.SerializeToString()
+
+
+def _pairs(problem: ScheduleProblem, message) -> list[tuple[Employee, Shift]]:
+    if len(message.assigned_employees) != len(message.assigned_shifts):
+        raise ValueError("assigned_employees and assigned_shifts differ in length")
+    return [
+        (
+            _lookup(problem.employees, e, "employee"),
+            _lookup(problem.shifts, s, "shift"),
+        )
+        for e, s in zip(
+            message.assigned_employees, message.assigned_shifts, strict=True
+        )
+    ]
+
+
+def decode_solution(problem: ScheduleProblem, data: bytes) -> dict:
+    """Serialized ScheduleSolution -> the JSON result shape of the same solve"""
+    message = _parse(service_pb2.ScheduleSolution(), data, "ScheduleSolution")
+    if len(message.gap_shifts) != len(message.gap_missing):
+        raise ValueError("gap_shifts and gap_missing differ in length")
+    result = {
+        "status": message.status,
+        "objective_value": _optional(message, "objective_value", float),
+        "best_bound": _optional(message, "best_bound", float),
+        "wall_time": message.wall_time,
+        "assignments": [
+            {
+                "shift_id": shift.shift_id,
+                "date": shift.date,
+                "time": shift.time,
+                "shift_type": shift.shift_type,
+                "employee_id": employee.employee_id,
+                "employee_name": employee.name,
+            }
+            for employee, shift in _pairs(problem, message)
+        ],
+        "coverage_gaps": [
+            {
+                "shift_id": shift.shift_id,
+                "date": shift.date,
+                "shift_type": shift.shift_type,
+                "missing": missing,
+            }
+            for shift, missing in (
+                (_lookup(problem.shifts, s, "shift"), missing)
+                for s, missing in zip(
+                    message.gap_shifts, message.gap_missing, strict=True
+                )
+            )
+        ],
+    }
+    if message.details_json:
+        result.update(json.loads(message.details_json))
+    return result
+
+
+def solution_assignments(
+    problem: ScheduleProblem, data: bytes
+) -> frozenset[tuple[str, str]]:
+    """(employee_id, shift_id) pairs of a serialized ScheduleSolution"""
+    message = _parse(service_pb2.ScheduleSolution(), data, "ScheduleSolution")
+    return frozenset(
+        (employee.employee_id, shift.shift_id)
+        for employee, shift in _pairs(problem, message)
+    )
+
+
+def solve_result(
+    problem_type: str,
+    problem_bytes: bytes,
+    timeout_seconds: float,
+    num_workers: int = 0,
+    base_solution: bytes = b"",
+    base_assignment_json: str = "",
+    on_incumbent: Callable[[bytes], None] | None = None,
+) -> tuple[ScheduleProblem, dict]:
+    """Solve a typed problem; returns the decoded problem and the result
+    (process-pool entry point, see solver_pool.py)
+
+    `on_incumbent` receives each reported intermediate result, serialized.
+    """
+    if problem_type != SHIFT_SCHEDULING:
+        raise ValueError(
+            f"Unsupported problem_type '{problem_type}' for a typed problem, "
+            f"expected: {SHIFT_SCHEDULING}"
+        )
+    started = time.perf_counter()
+    with job_profile.phase("parse"):
+        problem = decode_problem(problem_bytes)
+        base = None
+        if base_solution:
+            base = solution_assignments(problem, base_solution)
+        elif base_assignment_json:
+            base = parse_assignments(base_assignment_json)
+    parse_time = time.perf_counter() - started
+    result = solve_problem(
+        problem,
+        timeout_seconds,
+        num_workers,
+        base,
+        (
+            (lambda incumbent: on_incumbent(encode_solution(problem, incumbent)))
+            if on_incumbent is not None
+            else None
+        ),
+    )
+    result["parse_time"] = parse_time
+    return problem, result
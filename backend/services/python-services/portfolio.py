@@ -0,0 +1,338 @@
+"""Portfolio solving, anytime incumbents and early stopping.
+
+``Incumbents`` tracks the best solution of one or more concurrent CP-SAT
+searches over the same model. A solution callback offers it every solution as
+it is found; a monitor thread reports the latest improvement to
+``on_improvement`` at most once per ``solver.progress_interval`` seconds (the
+API stores it on the running job) and every search is stopped once
+
+* the best solution is within ``solver.relative_gap`` of the best proven
+  bound, or
+* no better solution has been found for ``solver.no_improvement_seconds``.
+
+With ``constraints["solver"]["mode"] == "portfolio"`` several differently
+configured CP-SAT strategies (``solver.strategies``: a list of
+``{"name": ..., <SatParameters field>: value}``, default
+``DEFAULT_STRATEGIES``) race on the model on threads, one search worker each,
+sharing one ``Incumbents``: a bound proven by one strategy closes the gap for
+a solution found by another, and the first to prove optimality stops the rest.
+"""
+
+import os
+import threading
+import time
+from collections.abc import Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+
+from ortools.sat import sat_parameters_pb2
+from ortools.sat.python import cp_model
+
+from scheduling import STATUS_NAMES, ShiftScheduleModel
+
+# Seconds between two incumbent reports
+PROGRESS_INTERVAL = 1.0
+
+# Improvements kept in the result's incumbent history
+MAX_HISTORY = 100
+
+DEFAULT_STRATEGIES = (
+    {"name": "default"},
+    {"name": "no_lp", "linearization_level": 0},
+    {"name": "full_lp", "linearization_level": 2},
+    {"name": "core", "optimize_with_core": True},
+)
+
+# Statuses that settle the problem for every strategy
+PROVEN = frozenset({"optimal", "infeasible", "model_invalid"})
+
+
+class _SolutionCallback(cp_model.CpSolverSolutionCallback):
+    def __init__(
+        self, incumbents: "Incumbents", schedule_model: ShiftScheduleModel, name: str
+    ):
+        super().__init__()
+        self.incumbents = incumbents
+        self.schedule_model = schedule_model
+        self.name = name
+
+    def on_solution_callback(self):
+        self.incumbents.offer(
+            self.objective_value,
+            self.best_objective_bound,
+            self,
+            self.schedule_model,
+            self.name,
+        )
+
+
+class Incumbents:
+    """Best solution and bound found so far, shared by concurrent searches"""
+
+    def __init__(
+        self,
+        on_improvement: Callable[[dict], None] | None = None,
+        relative_gap: float | None = None,
+        no_improvement_seconds: float | None = None,
+        progress_interval: float = PROGRESS_INTERVAL,
+    ):
+        if relative_gap is not None and relative_gap < 0:
+            raise ValueError("solver.relative_gap must be >= 0")
+        if no_improvement_seconds is not None and no_improvement_seconds <= 0:
+            raise ValueError("solver.no_improvement_seconds must be > 0")
+        if progress_interval <= 0:
+            raise ValueError("solver.progress_interval must be > 0")
+        self.on_improvement = on_improvement
+        self.relative_gap = relative_gap
+        self.no_improvement_seconds = no_improvement_seconds
+        self.progress_interval = progress_interval
+
+        self.started = time.perf_counter()
+        self.objective: float | None = None
+        self.bound: float | None = None
+        self.best: dict | None = None
+        self.improvements = 0
+        self.time_to_best: float | None = None
+        self.history: list[dict] = []
+        self.stop_reason: str | None = None
+
+        self._lock = threading.Lock()
+        self._solvers: set[cp_model.CpSolver] = set()
+        self._reported = 0
+        self._done = threading.Event()
+
+    @classmethod
+    def from_options(
+        cls, options: dict, on_improvement: Callable[[dict], None] | None = None
+    ) -> "Incumbents":
+        try:
+            relative_gap = options.get("relative_gap")
+            no_improvement = options.get("no_improvement_seconds")
+            return cls(
+                on_improvement,
+                relative_gap=float(relative_gap) if relative_gap is not None else None,
+                no_improvement_seconds=(
+                    float(no_improvement) if no_improvement is not None else None
+                ),
+                progress_interval=float(
+                    options.get("progress_interval", PROGRESS_INTERVAL)
+                ),
+            )
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"Invalid solver options: {e}") from e
+
+    @property
+    def gap(self) -> float | None:
+        """Relative distance between the best solution and the best bound"""
+        if self.objective is None or self.bound is None:
+            return None
+        return max(self.bound - self.objective, 0) / max(abs(self.objective), 1)
+
+    def solve(
+        self, schedule_model: ShiftScheduleModel, solver: cp_model.CpSolver, name: str
+    ) -> int:
+        """Run `solver` on the model, reporting to and stoppable by this tracker"""
+        solver.best_bound_callback = self._offer_bound
+        with self._lock:
+            if self.stop_reason is not None:
+                # Another search already finished it; return straight away
+                solver.parameters.max_time_in_seconds = 0
+            self._solvers.add(solver)
+        try:
+            status = solver.solve(
+                schedule_model.model, _SolutionCallback(self, schedule_model, name)
+            )
+        finally:
+            with self._lock:
+                self._solvers.discard(solver)
+        if STATUS_NAMES.get(status) in PROVEN:
+            with self._lock:
+                if self._solvers:
+                    self._stop(STATUS_NAMES[status])
+        return status
+
+    def offer(
+        self,
+        objective: float,
+        bound: float,
+        values: cp_model.CpSolverSolutionCallback,
+        schedule_model: ShiftScheduleModel,
+        name: str,
+    ):
+        """Record a solution if it beats the best one (from a solution callback)"""
+        with self._lock:
+            self._update_bound(bound)
+            if self.objective is None or objective > self.objective:
+                elapsed = time.perf_counter() - self.started
+                assignments, coverage_gaps = schedule_model.solution(values)
+                self.objective = objective
+                self.improvements += 1
+                self.time_to_best = elapsed
+                self.best = {
+                    "status": "feasible",
+                    "objective_value": objective,
+                    "strategy": name,
+                    "assignments": assignments,
+                    "coverage_gaps": coverage_gaps,
+                }
+                if len(self.history) < MAX_HISTORY:
+                    self.history.append(
+                        {
+                            "time": elapsed,
+                            "objective_value": objective,
+                            "best_bound": self.bound,
+                            "strategy": name,
+                        }
+                    )
+            self._check_gap()
+
+    def _offer_bound(self, bound: float):
+        with self._lock:
+            self._update_bound(bound)
+            self._check_gap()
+
+    def _update_bound(self, bound: float):
+        # The objective is maximized: the best bound is the lowest upper bound
+        if self.bound is None or bound < self.bound:
+            self.bound = bound
+
+    def _check_gap(self):
+        if self.relative_gap is not None and self.gap is not None:
+            if self.gap <= self.relative_gap:
+                self._stop("relative_gap")
+
+    def _stop(self, reason: str):
+        if self.stop_reason is None:
+            self.stop_reason = reason
+        for solver in self._solvers:
+            solver.stop_search()
+
+    @contextmanager
+    def monitoring(self) -> Iterator[None]:
+        """Report incumbents and watch for stagnation while the block runs"""
+        if self.on_improvement is None and self.no_improvement_seconds is None:
+            yield
+            return
+        thread = threading.Thread(target=self._monitor, daemon=True)
+        thread.start()
+        try:
+            yield
+        finally:
+            self._done.set()
+            thread.join()
+
+    def _monitor(self):
+        interval = self.progress_interval
+        if self.no_improvement_seconds is not None:
+            interval = min(interval, self.no_improvement_seconds / 10)
+        while not self._done.wait(interval):
+            self._report()
+            with self._lock:
+                if (
+                    self.no_improvement_seconds is not None
+                    and self.time_to_best is not None
+                    and time.perf_counter() - self.started - self.time_to_best
+                    >= self.no_improvement_seconds
+                ):
+                    self._stop("no_improvement")
+
+    def _report(self):
+        if self.on_improvement is None:
+            return
+        with self._lock:
+            if self.improvements == self._reported:
+                return
+            self._reported = self.improvements
+            incumbent = {
+                **self.best,
+                "best_bound": self.bound,
+                "gap": self.gap,
+                "wall_time": time.perf_counter() - self.started,
+                "improvements": self.improvements,
+            }
+        self.on_improvement(incumbent)
+
+    def summary(self) -> dict:
+        return {
+            "improvements": self.improvements,
+            "time_to_best": self.time_to_best,
+            "gap": self.gap,
+            "stop_reason": self.stop_reason,
+            "history": self.history,
+        }
+
+
+def strategies(options: dict) -> list[tuple[str, sat_parameters_pb2.SatParameters]]:
+    """Named CP-SAT parameter sets from ``solver.strategies``"""
+    configured = options.get("strategies") or DEFAULT_STRATEGIES
+    if not isinstance(configured, list | tuple):
+        raise ValueError("solver.strategies must be a list")
+    parsed = []
+    for i, strategy in enumerate(configured):
+        if not isinstance(strategy, dict):
+            raise ValueError("solver.strategies must be a list of objects")
+        name = str(strategy.get("name") or f"strategy_{i}")
+        fields = {key: value for key, value in strategy.items() if key != "name"}
+        try:
+            parameters = sat_parameters_pb2.SatParameters(**fields)
+        except (TypeError, ValueError) as e:
+            raise ValueError(
+                f"Invalid CP-SAT parameters for strategy {name}: {e}"
+            ) from e
+        parsed.append((name, parameters))
+    return parsed
+
+
+def solve_portfolio(
+    schedule_model: ShiftScheduleModel,
+    timeout_seconds: float,
+    num_workers: int,
+    incumbents: Incumbents,
+) -> dict:
+    started = time.perf_counter()
+    configured = strategies(schedule_model.problem.solver)
+    workers = max(1, (num_workers or os.cpu_count() or 1) // len(configured))
+
+    def run(strategy: tuple[str, sat_parameters_pb2.SatParameters]) -> dict:
+        name, parameters = strategy
+        return schedule_model.solve(
+            timeout_seconds,
+            workers,
+            parameters=parameters,
+            incumbents=incumbents,
+            strategy=name,
+        )
+
+    with ThreadPoolExecutor(max_workers=len(configured)) as executor:
+        results = list(executor.map(run, configured))
+
+    winner = max(
+        range(len(results)),
+        key=lambda i: (
+            results[i]["status"] in PROVEN,
+            results[i]["objective_value"] is not None,
+            results[i]["objective_value"] or 0,
+        ),
+    )
+    result = dict(results[winner])
+    if result["objective_value"] is not None and incumbents.bound is not None:
+        # A strategy stopped early may have proven a better bound than the winner
+        result["best_bound"] = min(result["best_bound"], incumbents.bound)
+        if result["best_bound"] <= result["objective_value"]:
+            result["status"] = "optimal"
+    result["wall_time"] = time.perf_counter() - started
+    result["portfolio"] = {
+        "winner": configured[winner][0],
+        "workers_per_strategy": workers,
+        "strategies": [
+            {
+                "name": name,
+                "status": strategy_result["status"],
+                "objective_value": strategy_result["objective_value"],
+                "best_bound": strategy_result["best_bound"],
+                "wall_time": strategy_result["wall_time"],
+            }
+            for (name, _), strategy_result in zip(configured, results, strict=True)
+        ],
+    }
+    return result
@@ -0,0 +1,95 @@
+"""Employee symmetry classes: interchangeable employees solved as one.
+
+Employees whose availability, preferences and shift limit match are
+interchangeable: swapping two of them in any schedule gives a schedule with
+the same objective that breaks the same rules. A one-boolean-per-employee
+model searches all of those permutations. ``employee_classes`` groups such
+employees. A preference or unavailability that matches none of the problem's
+shifts, or a preference with weight 0, counts as none.
+
+With ``mode`` CLASSES the model has one integer per (class, shift) pair, how
+many of the class work the shift, instead of one boolean per member. That is
+exact for the per-day, per-week and total shift limits: counts within the
+class's share of each (members × the limit) can always be handed out to named
+members within their own limits, and ``expand`` does that.
+
+It is OFF, one boolean per employee, when that does not hold:
+
+* with a minimum rest time, which member takes which shift matters. CP-SAT
+  detects the interchangeable members itself; ordering them by load in the
+  model as well made these solves slower, not faster.
+* a warm start penalizes changes per employee, so no two employees are
+  interchangeable.
+* with ``constraints["solver"]["presolve"] = false``.
+"""
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from scheduling import Employee, ScheduleProblem
+
+CLASSES = "classes"
+OFF = "off"
+
+
+def mode(problem: "ScheduleProblem", base: frozenset | None = None) -> str:
+    if base is not None or not problem.solver.get("presolve", True):
+        return OFF
+    if problem.min_rest_hours is not None:
+        return OFF
+    return CLASSES
+
+
+def employee_classes(problem: "ScheduleProblem") -> list[tuple[int, ...]]:
+    """Indices of interchangeable employees, in order of first appearance"""
+    shift_types = {shift.shift_type for shift in problem.shifts}
+    dates = {shift.date for shift in problem.shifts}
+    slots = {(shift.date, shift.shift_type) for shift in problem.shifts}
+
+    def profile(employee: "Employee") -> tuple:
+        preferred_time = employee.preferred_shift_time
+        if not problem.preferred_shift_weight or preferred_time not in shift_types:
+            preferred_time = ""
+        preferred_date = employee.preferred_shift_date
+        if not problem.preferred_date_weight or preferred_date not in dates:
+            preferred_date = ""
+        unavailable_time = employee.unavailable_shift_time
+        unavailable_date = employee.unavailable_shift_date
+        if unavailable_time and unavailable_date:
+            blocks_any = (unavailable_date, unavailable_time) in slots
+        else:
+            blocks_any = unavailable_time in shift_types or unavailable_date in dates
+        if not blocks_any:
+            unavailable_time = unavailable_date = ""
+        return (
+            preferred_time,
+            preferred_date,
+            unavailable_time,
+            unavailable_date,
+            problem.max_shifts_for(employee),
+        )
+
+    classes: dict[tuple, list[int]] = {}
+    for e, employee in enumerate(problem.employees):
+        classes.setdefault(profile(employee), []).append(e)
+    return [tuple(members) for members in classes.values()]
+
+
+def expand(
+    problem: "ScheduleProblem", members: tuple[int, ...], counts: dict[int, int]
+) -> list[tuple[int, int]]:
+    """Hand a class's staff counts (shift index -> members on it) out to its
+    members; returns (employee, shift) index pairs.
+
+    The shift places, in date order, go round the members one each in turn.
+    Any run of consecutive places gives each member their share of it
+    rounded down or up, and a day, a week and the whole schedule are such
+    runs: nobody exceeds the class's per-day, per-week or total limit unless
+    the counts do. A shift takes at most one place per member because it
+    needs no more of them than the class has.
+    """
+    places = sorted(
+        (s for s, count in counts.items() for _ in range(count)),
+        key=lambda s: (problem.shifts[s].date, s),
+    )
+    return [(members[i % len(members)], s) for i, s in enumerate(places)]
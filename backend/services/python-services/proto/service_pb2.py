@@ -19,7 +19,7 @@ _sym_db = _symbol_database.Default()
 
 
 DESCRIPTOR = _descriptor_pool.Default().AddSerializedFile(
-    b'\n\rservice.proto\x12\x0corchestrator"\x1e\n\x0bPingRequest\x12\x0f\n\x07message\x18\x01 \x01(\t"2\n\x0cPingResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x03"F\n\x11\x43ompletionRequest\x12\x0e\n\x06prompt\x18\x01 \x01(\t\x12\r\n\x05model\x18\x02 \x01(\t\x12\x12\n\nmax_tokens\x18\x03 \x01(\x05"L\n\x12\x43ompletionResponse\x12\x12\n\ncompletion\x18\x01 \x01(\t\x12\x13\n\x0btokens_used\x18\x02 \x01(\x05\x12\r\n\x05model\x18\x03 \x01(\t"w\n\x13OptimizationRequest\x12\x14\n\x0cproblem_type\x18\x01 \x01(\t\x12\x18\n\x10\x63onstraints_json\x18\x02 \x01(\t\x12\x17\n\x0fobjectives_json\x18\x03 \x01(\t\x12\x17\n\x0ftimeout_seconds\x18\x04 \x01(\x05"b\n\x14OptimizationResponse\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x13\n\x0bresult_json\x18\x03 \x01(\t\x12\x15\n\rerror_message\x18\x04 \x01(\t""\n\x10JobStatusRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t"\x89\x01\n\x11JobStatusResponse\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x13\n\x0bresult_json\x18\x03 \x01(\t\x12\x15\n\rerror_message\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\x03\x12\x14\n\x0c\x63ompleted_at\x18\x06 \x01(\x03\x32\xcb\x02\n\tAIService\x12=\n\x04Ping\x12\x19.orchestrator.PingRequest\x1a\x1a.orchestrator.PingResponse\x12R\n\rGetCompletion\x12\x1f.orchestrator.CompletionRequest\x1a .orchestrator.CompletionResponse\x12Z\n\x11SolveOptimization\x12!.orchestrator.OptimizationRequest\x1a".orchestrator.OptimizationResponse\x12O\n\x0cGetJobStatus\x12\x1e.orchestrator.JobStatusRequest\x1a\x1f.orchestrator.JobStatusResponseB?Z=https://github.com/Tshogun/Scheduling_Agent_Prod/shared/protob\x06proto3'
+    b'\n\rservice.proto\x12\x0corchestrator"\x1e\n\x0bPingRequest\x12\x0f\n\x07message\x18\x01 \x01(\t"2\n\x0cPingResponse\x12\x0f\n\x07message\x18\x01 \x01(\t\x12\x11\n\ttimestamp\x18\x02 \x01(\x03"F\n\x11\x43ompletionRequest\x12\x0e\n\x06prompt\x18\x01 \x01(\t\x12\r\n\x05model\x18\x02 \x01(\t\x12\x12\n\nmax_tokens\x18\x03 \x01(\x05"\\\n\x12\x43ompletionResponse\x12\x12\n\ncompletion\x18\x01 \x01(\t\x12\x13\n\x0btokens_used\x18\x02 \x01(\x05\x12\r\n\x05model\x18\x03 \x01(\t\x12\x0e\n\x06\x63\x61\x63hed\x18\x04 \x01(\x08"j\n\x0f\x43ompletionChunk\x12\x0c\n\x04text\x18\x01 \x01(\t\x12\x15\n\rfinish_reason\x18\x02 \x01(\t\x12\x13\n\x0btokens_used\x18\x03 \x01(\x05\x12\r\n\x05model\x18\x04 \x01(\t\x12\x0e\n\x06\x63\x61\x63hed\x18\x05 \x01(\x08"\x89\x02\n\x13OptimizationRequest\x12\x14\n\x0cproblem_type\x18\x01 \x01(\t\x12\x18\n\x10\x63onstraints_json\x18\x02 \x01(\t\x12\x17\n\x0fobjectives_json\x18\x03 \x01(\t\x12\x17\n\x0ftimeout_seconds\x18\x04 \x01(\x05\x12\x13\n\x0b\x62\x61se_job_id\x18\x05 \x01(\t\x12\x1c\n\x14\x62\x61se_assignment_json\x18\x06 \x01(\t\x12\x0f\n\x07problem\x18\x07 \x01(\x0c\x12\x15\n\rbase_solution\x18\x08 \x01(\x0c\x12\x12\n\nproblem_id\x18\t \x01(\t\x12\x0f\n\x07profile\x18\n \x01(\x08\x12\x10\n\x08priority\x18\x0b \x01(\t"t\n\x14OptimizationResponse\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x13\n\x0bresult_json\x18\x03 \x01(\t\x12\x15\n\rerror_message\x18\x04 \x01(\t\x12\x10\n\x08solution\x18\x05 \x01(\x0c""\n\x10JobStatusRequest\x12\x0e\n\x06job_id\x18\x01 \x01(\t"\xac\x01\n\x11JobStatusResponse\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x0e\n\x06status\x18\x02 \x01(\t\x12\x13\n\x0bresult_json\x18\x03 \x01(\t\x12\x15\n\rerror_message\x18\x04 \x01(\t\x12\x12\n\ncreated_at\x18\x05 \x01(\x03\x12\x14\n\x0c\x63ompleted_at\x18\x06 \x01(\x03\x12\x10\n\x08solution\x18\x07 \x01(\x0c\x12\x0f\n\x07profile\x18\x08 \x01(\x0c"O\n\x18OptimizationBatchRequest\x12\x33\n\x08requests\x18\x01 \x03(\x0b\x32!.orchestrator.OptimizationRequest"R\n\x19OptimizationBatchResponse\x12\x35\n\tresponses\x18\x01 \x03(\x0b\x32".orchestrator.OptimizationResponse"(\n\x15JobStatusBatchRequest\x12\x0f\n\x07job_ids\x18\x01 \x03(\t"K\n\x16JobStatusBatchResponse\x12\x31\n\x08statuses\x18\x01 \x03(\x0b\x32\x1f.orchestrator.JobStatusResponse"u\n\x11\x45valuationRequest\x12\x14\n\x0cproblem_type\x18\x01 \x01(\t\x12\x18\n\x10\x63onstraints_json\x18\x02 \x01(\t\x12\x17\n\x0fobjectives_json\x18\x03 \x01(\t\x12\x17\n\x0f\x61ssignment_json\x18\x04 \x01(\t"S\n\x12\x45valuationResponse\x12\r\n\x05valid\x18\x01 \x01(\x08\x12\x17\n\x0f\x65valuation_json\x18\x02 \x01(\t\x12\x15\n\rerror_message\x18\x03 \x01(\t"\xc7\x02\n\x08\x45mployee\x12\x13\n\x0b\x65mployee_id\x18\x01 \x01(\t\x12\x0c\n\x04name\x18\x02 \x01(\t\x12\x10\n\x08initials\x18\x03 \x01(\t\x12!\n\x14preferred_shift_type\x18\x04 \x01(\rH\x00\x88\x01\x01\x12\x1b\n\x0epreferred_date\x18\x05 \x01(\rH\x01\x88\x01\x01\x12#\n\x16unavailable_shift_type\x18\x06 \x01(\rH\x02\x88\x01\x01\x12\x1d\n\x10unavailable_date\x18\x07 \x01(\rH\x03\x88\x01\x01\x12\x17\n\nmax_shifts\x18\x08 \x01(\x05H\x04\x88\x01\x01\x42\x17\n\x15_preferred_shift_typeB\x11\n\x0f_preferred_dateB\x19\n\x17_unavailable_shift_typeB\x13\n\x11_unavailable_dateB\r\n\x0b_max_shifts"\x8b\x01\n\x05Shift\x12\x10\n\x08shift_id\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61te\x18\x02 \x01(\r\x12\x12\n\nshift_type\x18\x03 \x01(\r\x12\x0c\n\x04time\x18\x04 \x01(\t\x12\x10\n\x08required\x18\x05 \x01(\r\x12\x1b\n\x0e\x64uration_hours\x18\x06 \x01(\x01H\x00\x88\x01\x01\x42\x11\n\x0f_duration_hours"\x9e\x05\n\x0fScheduleProblem\x12\r\n\x05\x64\x61tes\x18\x01 \x03(\t\x12\x13\n\x0bshift_types\x18\x02 \x03(\t\x12)\n\temployees\x18\x03 \x03(\x0b\x32\x16.orchestrator.Employee\x12#\n\x06shifts\x18\x04 \x03(\x0b\x32\x13.orchestrator.Shift\x12$\n\x17max_shifts_per_employee\x18\x05 \x01(\x05H\x00\x88\x01\x01\x12\x1f\n\x12max_shifts_per_day\x18\x06 \x01(\x05H\x01\x88\x01\x01\x12 \n\x13max_shifts_per_week\x18\x07 \x01(\x05H\x02\x88\x01\x01\x12\x1b\n\x0emin_rest_hours\x18\x08 \x01(\x01H\x03\x88\x01\x01\x12\x16\n\x0e\x61\x66\x66\x65\x63ted_dates\x18\t \x03(\r\x12\x1a\n\x12\x61\x66\x66\x65\x63ted_employees\x18\n \x03(\r\x12#\n\x16preferred_shift_weight\x18\x0b \x01(\x05H\x04\x88\x01\x01\x12"\n\x15preferred_date_weight\x18\x0c \x01(\x05H\x05\x88\x01\x01\x12"\n\x15understaffing_penalty\x18\r \x01(\x05H\x06\x88\x01\x01\x12\x1b\n\x0e\x63hange_penalty\x18\x0e \x01(\x05H\x07\x88\x01\x01\x12\x13\n\x0bsolver_json\x18\x0f \x01(\tB\x1a\n\x18_max_shifts_per_employeeB\x15\n\x13_max_shifts_per_dayB\x16\n\x14_max_shifts_per_weekB\x11\n\x0f_min_rest_hoursB\x19\n\x17_preferred_shift_weightB\x18\n\x16_preferred_date_weightB\x18\n\x16_understaffing_penaltyB\x11\n\x0f_change_penalty"\x83\x02\n\x10ScheduleSolution\x12\x0e\n\x06status\x18\x01 \x01(\t\x12\x1c\n\x0fobjective_value\x18\x02 \x01(\x01H\x00\x88\x01\x01\x12\x17\n\nbest_bound\x18\x03 \x01(\x01H\x01\x88\x01\x01\x12\x11\n\twall_time\x18\x04 \x01(\x01\x12\x1a\n\x12\x61ssigned_employees\x18\x05 \x03(\r\x12\x17\n\x0f\x61ssigned_shifts\x18\x06 \x03(\r\x12\x12\n\ngap_shifts\x18\x07 \x03(\r\x12\x13\n\x0bgap_missing\x18\x08 \x03(\r\x12\x14\n\x0c\x64\x65tails_json\x18\t \x01(\tB\x12\n\x10_objective_valueB\r\n\x0b_best_bound"V\n\x10OptimizationTask\x12\x0e\n\x06job_id\x18\x01 \x01(\t\x12\x32\n\x07request\x18\x02 \x01(\x0b\x32!.orchestrator.OptimizationRequest"\\\n\x0bRosterChunk\x12\x0c\n\x04\x66ile\x18\x01 \x01(\t\x12\x0c\n\x04\x64\x61ta\x18\x02 \x01(\x0c\x12\x18\n\x10\x63onstraints_json\x18\x03 \x01(\t\x12\x17\n\x0fobjectives_json\x18\x04 \x01(\t"\x85\x01\n\x14RosterUploadResponse\x12\x12\n\nproblem_id\x18\x01 \x01(\t\x12\x0f\n\x07\x63reated\x18\x02 \x01(\x08\x12\x11\n\temployees\x18\x03 \x01(\r\x12\x0e\n\x06shifts\x18\x04 \x01(\r\x12\x0e\n\x06\x65rrors\x18\x05 \x03(\t\x12\x15\n\rerror_message\x18\x06 \x01(\t2\xb1\x07\n\tAIService\x12=\n\x04Ping\x12\x19.orchestrator.PingRequest\x1a\x1a.orchestrator.PingResponse\x12R\n\rGetCompletion\x12\x1f.orchestrator.CompletionRequest\x1a .orchestrator.CompletionResponse\x12T\n\x10StreamCompletion\x12\x1f.orchestrator.CompletionRequest\x1a\x1d.orchestrator.CompletionChunk0\x01\x12Z\n\x11SolveOptimization\x12!.orchestrator.OptimizationRequest\x1a".orchestrator.OptimizationResponse\x12O\n\x0cGetJobStatus\x12\x1e.orchestrator.JobStatusRequest\x1a\x1f.orchestrator.JobStatusResponse\x12M\n\x08WatchJob\x12\x1e.orchestrator.JobStatusRequest\x1a\x1f.orchestrator.JobStatusResponse0\x01\x12i\n\x16SolveOptimizationBatch\x12&.orchestrator.OptimizationBatchRequest\x1a\'.orchestrator.OptimizationBatchResponse\x12^\n\x11GetJobStatusBatch\x12#.orchestrator.JobStatusBatchRequest\x1a$.orchestrator.JobStatusBatchResponse\x12U\n\x10\x45valuateSchedule\x12\x1f.orchestrator.EvaluationRequest\x1a .orchestrator.EvaluationResponse\x12O\n\x0cUploadRoster\x12\x19.orchestrator.RosterChunk\x1a".orchestrator.RosterUploadResponse(\x01\x12L\n\tCancelJob\x12\x1e.orchestrator.JobStatusRequest\x1a\x1f.orchestrator.JobStatusResponseB?Z=https://github.com/Tshogun/Scheduling_Agent_Prod/shared/protob\x06proto3'
 )
 
 _globals = globals()
@@ -37,15 +37,43 @@ if not _descriptor._USE_C_DESCRIPTORS:
     _globals["_COMPLETIONREQUEST"]._serialized_start = 115
     _globals["_COMPLETIONREQUEST"]._serialized_end = 185
     _globals["_COMPLETIONRESPONSE"]._serialized_start = 187
-    _globals["_COMPLETIONRESPONSE"]._serialized_end = 263
-    _globals["_OPTIMIZATIONREQUEST"]._serialized_start = 265
-    _globals["_OPTIMIZATIONREQUEST"]._serialized_end = 384
-    _globals["_OPTIMIZATIONRESPONSE"]._serialized_start = 386
-    _globals["_OPTIMIZATIONRESPONSE"]._serialized_end = 484
-    _globals["_JOBSTATUSREQUEST"]._serialized_start = 486
-    _globals["_JOBSTATUSREQUEST"]._serialized_end = 520
-    _globals["_JOBSTATUSRESPONSE"]._serialized_start = 523
-    _globals["_JOBSTATUSRESPONSE"]._serialized_end = 660
-    _globals["_AISERVICE"]._serialized_start = 663
-    _globals["_AISERVICE"]._serialized_end = 994
+    _globals["_COMPLETIONRESPONSE"]._serialized_end = 279
+    _globals["_COMPLETIONCHUNK"]._serialized_start = 281
+    _globals["_COMPLETIONCHUNK"]._serialized_end = 387
+    _globals["_OPTIMIZATIONREQUEST"]._serialized_start = 390
+    _globals["_OPTIMIZATIONREQUEST"]._serialized_end = 655
+    _globals["_OPTIMIZATIONRESPONSE"]._serialized_start = 657
+    _globals["_OPTIMIZATIONRESPONSE"]._serialized_end = 773
+    _globals["_JOBSTATUSREQUEST"]._serialized_start = 775
+    _globals["_JOBSTATUSREQUEST"]._serialized_end = 809
+    _globals["_JOBSTATUSRESPONSE"]._serialized_start = 812
+    _globals["_JOBSTATUSRESPONSE"]._serialized_end = 984
+    _globals["_OPTIMIZATIONBATCHREQUEST"]._serialized_start = 986
+    _globals["_OPTIMIZATIONBATCHREQUEST"]._serialized_end = 1065
+    _globals["_OPTIMIZATIONBATCHRESPONSE"]._serialized_start = 1067
+    _globals["_OPTIMIZATIONBATCHRESPONSE"]._serialized_end = 1149
+    _globals["_JOBSTATUSBATCHREQUEST"]._serialized_start = 1151
+    _globals["_JOBSTATUSBATCHREQUEST"]._serialized_end = 1191
+    _globals["_JOBSTATUSBATCHRESPONSE"]._serialized_start = 1193
+    _globals["_JOBSTATUSBATCHRESPONSE"]._serialized_end = 1268
+    _globals["_EVALUATIONREQUEST"]._serialized_start = 1270
+    _globals["_EVALUATIONREQUEST"]._serialized_end = 1387
+    _globals["_EVALUATIONRESPONSE"]._serialized_start = 1389
+    _globals["_EVALUATIONRESPONSE"]._serialized_end = 1472
+    _globals["_EMPLOYEE"]._serialized_start = 1475
+    _globals["_EMPLOYEE"]._serialized_end = 1802
+    _globals["_SHIFT"]._serialized_start = 1805
+    _globals["_SHIFT"]._serialized_end = 1944
+    _globals["_SCHEDULEPROBLEM"]._serialized_start = 1947
+    _globals["_SCHEDULEPROBLEM"]._serialized_end = 2617
+    _globals["_SCHEDULESOLUTION"]._serialized_start = 2620
+    _globals["_SCHEDULESOLUTION"]._serialized_end = 2879
+    _globals["_OPTIMIZATIONTASK"]._serialized_start = 2881
+    _globals["_OPTIMIZATIONTASK"]._serialized_end = 2967
+    _globals["_ROSTERCHUNK"]._serialized_start = 2969
+    _globals["_ROSTERCHUNK"]._serialized_end = 3061
+    _globals["_ROSTERUPLOADRESPONSE"]._serialized_start = 3064
+    _globals["_ROSTERUPLOADRESPONSE"]._serialized_end = 3197
+    _globals["_AISERVICE"]._serialized_start = 3200
+    _globals["_AISERVICE"]._serialized_end = 4145
 # @@protoc_insertion_point(module_scope)
@@ -48,6 +48,12 @@ class AIServiceStub:
             response_deserializer=service__pb2.CompletionResponse.FromString,
             _registered_method=True,
         )
+        self.StreamCompletion = channel.unary_stream(
+            "/orchestrator.AIService/StreamCompletion",
+            request_serializer=service__pb2.CompletionRequest.SerializeToString,
+            response_deserializer=service__pb2.CompletionChunk.FromString,
+            _registered_method=True,
+        )
         self.SolveOptimization = channel.unary_unary(
             "/orchestrator.AIService/SolveOptimization",
             request_serializer=service__pb2.OptimizationRequest.SerializeToString,
@@ -60,6 +66,42 @@ class AIServiceStub:
             response_deserializer=service__pb2.JobStatusResponse.FromString,
             _registered_method=True,
         )
+        self.WatchJob = channel.unary_stream(
+            "/orchestrator.AIService/WatchJob",
+            request_serializer=service__pb2.JobStatusRequest.SerializeToString,
+            response_deserializer=service__pb2.JobStatusResponse.FromString,
+            _registered_method=True,
+        )
+        self.SolveOptimizationBatch = channel.unary_unary(
+            "/orchestrator.AIService/SolveOptimizationBatch",
+            request_serializer=service__pb2.OptimizationBatchRequest.SerializeToString,
+            response_deserializer=service__pb2.OptimizationBatchResponse.FromString,
+            _registered_method=True,
+        )
+        self.GetJobStatusBatch = channel.unary_unary(
+            "/orchestrator.AIService/GetJobStatusBatch",
+            request_serializer=service__pb2.JobStatusBatchRequest.SerializeToString,
+            response_deserializer=service__pb2.JobStatusBatchResponse.FromString,
+            _registered_method=True,
+        )
+        self.EvaluateSchedule = channel.unary_unary(
+            "/orchestrator.AIService/EvaluateSchedule",
+            request_serializer=service__pb2.EvaluationRequest.SerializeToString,
+            response_deserializer=service__pb2.EvaluationResponse.FromString,
+            _registered_method=True,
+        )
+        self.UploadRoster = channel.stream_unary(
+            "/orchestrator.AIService/UploadRoster",
+            request_serializer=service__pb2.RosterChunk.SerializeToString,
+            response_deserializer=service__pb2.RosterUploadResponse.FromString,
+            _registered_method=True,
+        )
+        self.CancelJob = channel.unary_unary(
+            "/orchestrator.AIService/CancelJob",
+            request_serializer=service__pb2.JobStatusRequest.SerializeToString,
+            response_deserializer=service__pb2.JobStatusResponse.FromString,
+            _registered_method=True,
+        )
 
 
 class AIServiceServicer:
@@ -72,7 +114,18 @@ class AIServiceServicer:
         raise NotImplementedError("Method not implemented!")
 
     def GetCompletion(self, request, context):
-        """LLM completion"""
+        """LLM completion. Identical requests (prompt, model, max_tokens) are
+        answered from a cache or share one model call; RESOURCE_EXHAUSTED when
+        the model is too busy to start within the queue timeout.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def StreamCompletion(self, request, context):
+        """LLM completion streamed as it is generated; cancelling the call stops
+        the generation
+        """
         context.set_code(grpc.StatusCode.UNIMPLEMENTED)
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
@@ -89,6 +142,48 @@ class AIServiceServicer:
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def WatchJob(self, request, context):
+        """Stream job status transitions until the job completes, fails or is
+        cancelled
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def SolveOptimizationBatch(self, request, context):
+        """Queue several optimization problems in one call"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def GetJobStatusBatch(self, request, context):
+        """Get the status of several jobs in one call"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def EvaluateSchedule(self, request, context):
+        """Score and validate an assignment against a problem without solving"""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def UploadRoster(self, request_iterator, context):
+        """Upload employees.csv / shifts.csv in chunks; returns a problem_id for
+        OptimizationRequest.problem_id
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def CancelJob(self, request, context):
+        """Cancel a queued or running job. It ends "cancelled", keeping the best
+        schedule reported while it ran (if any); a finished job is left as it is.
+        """
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_AIServiceServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -102,6 +197,11 @@ def add_AIServiceServicer_to_server(servicer, server):
             request_deserializer=service__pb2.CompletionRequest.FromString,
             response_serializer=service__pb2.CompletionResponse.SerializeToString,
         ),
+        "StreamCompletion": grpc.unary_stream_rpc_method_handler(
+            servicer.StreamCompletion,
+            request_deserializer=service__pb2.CompletionRequest.FromString,
+            response_serializer=service__pb2.CompletionChunk.SerializeToString,
+        ),
         "SolveOptimization": grpc.unary_unary_rpc_method_handler(
             servicer.SolveOptimization,
             request_deserializer=service__pb2.OptimizationRequest.FromString,
@@ -112,6 +212,36 @@ def add_AIServiceServicer_to_server(servicer, server):
             request_deserializer=service__pb2.JobStatusRequest.FromString,
             response_serializer=service__pb2.JobStatusResponse.SerializeToString,
         ),
+        "WatchJob": grpc.unary_stream_rpc_method_handler(
+            servicer.WatchJob,
+            request_deserializer=service__pb2.JobStatusRequest.FromString,
+            response_serializer=service__pb2.JobStatusResponse.SerializeToString,
+        ),
+        "SolveOptimizationBatch": grpc.unary_unary_rpc_method_handler(
+            servicer.SolveOptimizationBatch,
+            request_deserializer=service__pb2.OptimizationBatchRequest.FromString,
+            response_serializer=service__pb2.OptimizationBatchResponse.SerializeToString,
+        ),
+        "GetJobStatusBatch": grpc.unary_unary_rpc_method_handler(
+            servicer.GetJobStatusBatch,
+            request_deserializer=service__pb2.JobStatusBatchRequest.FromString,
+            response_serializer=service__pb2.JobStatusBatchResponse.SerializeToString,
+        ),
+        "EvaluateSchedule": grpc.unary_unary_rpc_method_handler(
+            servicer.EvaluateSchedule,
+            request_deserializer=service__pb2.EvaluationRequest.FromString,
+            response_serializer=service__pb2.EvaluationResponse.SerializeToString,
+        ),
+        "UploadRoster": grpc.stream_unary_rpc_method_handler(
+            servicer.UploadRoster,
+            request_deserializer=service__pb2.RosterChunk.FromString,
+            response_serializer=service__pb2.RosterUploadResponse.SerializeToString,
+        ),
+        "CancelJob": grpc.unary_unary_rpc_method_handler(
+            servicer.CancelJob,
+            request_deserializer=service__pb2.JobStatusRequest.FromString,
+            response_serializer=service__pb2.JobStatusResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "orchestrator.AIService", rpc_method_handlers
@@ -184,6 +314,36 @@ class AIService:
             _registered_method=True,
         )
 
+    @staticmethod
+    def StreamCompletion(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/orchestrator.AIService/StreamCompletion",
+            service__pb2.CompletionRequest.SerializeToString,
+            service__pb2.CompletionChunk.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
     @staticmethod
     def SolveOptimization(
         request,
@@ -243,3 +403,183 @@ class AIService:
             metadata,
             _registered_method=True,
         )
+
+    @staticmethod
+    def WatchJob(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/orchestrator.AIService/WatchJob",
+            service__pb2.JobStatusRequest.SerializeToString,
+            service__pb2.JobStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def SolveOptimizationBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/orchestrator.AIService/SolveOptimizationBatch",
+            service__pb2.OptimizationBatchRequest.SerializeToString,
+            service__pb2.OptimizationBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def GetJobStatusBatch(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/orchestrator.AIService/GetJobStatusBatch",
+            service__pb2.JobStatusBatchRequest.SerializeToString,
+            service__pb2.JobStatusBatchResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def EvaluateSchedule(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/orchestrator.AIService/EvaluateSchedule",
+            service__pb2.EvaluationRequest.SerializeToString,
+            service__pb2.EvaluationResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def UploadRoster(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            "/orchestrator.AIService/UploadRoster",
+            service__pb2.RosterChunk.SerializeToString,
+            service__pb2.RosterUploadResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
+
+    @staticmethod
+    def CancelJob(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/orchestrator.AIService/CancelJob",
+            service__pb2.JobStatusRequest.SerializeToString,
+            service__pb2.JobStatusResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+            _registered_method=True,
+        )
@@ -0,0 +1,258 @@
+"""Asyncio AMQP publisher with a channel pool and batched publisher confirms.
+
+`publish()` never blocks the event loop: it appends the message to an
+in-memory buffer and returns a future that resolves once the broker has
+confirmed it. A pool of channel workers drains the buffer in batches, so many
+concurrent `SolveOptimization` calls share a single confirm round trip.
+
+While the broker is unreachable messages stay buffered (up to `max_buffer`)
+and the publisher reconnects with exponential backoff. Delivery is
+at-least-once: a message whose confirm was lost with the connection is
+published again after reconnecting.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+
+from amqp import BrokerError, BrokerUnavailable
+from metrics import PUBLISH_LATENCY
+
+logger = logging.getLogger(__name__)
+
+
+class PublishBufferFull(BrokerError):
+    pass
+
+
+class _Pending:
+    __slots__ = (
+        "routing_key",
+        "body",
+        "headers",
+        "priority",
+        "exchange",
+        "future",
+        "queued_at",
+    )
+
+    def __init__(self, routing_key, body, headers, priority, exchange, future):
+        self.routing_key = routing_key
+        self.body = body
+        self.headers = headers
+        self.priority = priority
+        self.exchange = exchange
+        self.future = future
+        self.queued_at = time.perf_counter()
+
+
+class AsyncPublisher:
+    def __init__(
+        self,
+        broker,
+        pool_size: int = 4,
+        batch_size: int = 100,
+        max_buffer: int = 10_000,
+        reconnect_delay: float = 0.5,
+        max_reconnect_delay: float = 30.0,
+        on_connect: Callable[[object], Awaitable[None]] | None = None,
+    ):
+        self.broker = broker
+        self.pool_size = pool_size
+        self.batch_size = batch_size
+        self.max_buffer = max_buffer
+        self.reconnect_delay = reconnect_delay
+        self.max_reconnect_delay = max_reconnect_delay
+        self.on_connect = on_connect
+
+        # True once the first connection succeeded; from then on messages are
+        # buffered across outages instead of being rejected
+        self.ever_connected = False
+        self.confirmed = 0
+        self.batches = 0
+
+        self._pending: deque[_Pending] = deque()
+        # Publish latency histogram per routing key
+        self._latency: dict = {}
+        self._has_pending = asyncio.Event()
+        self._connected = asyncio.Event()
+        self._channels: list = []
+        self._supervisor: asyncio.Task | None = None
+        self._closing = False
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    @property
+    def buffered(self) -> int:
+        return len(self._pending)
+
+    def start(self):
+        if self._supervisor is None:
+            self._supervisor = asyncio.create_task(self._run())
+
+    async def wait_connected(self, timeout: float | None = None) -> bool:
+        try:
+            await asyncio.wait_for(self._connected.wait(), timeout)
+        except TimeoutError:
+            return False
+        return True
+
+    async def queue_depth(self, queue: str) -> int | None:
+        """Messages ready in `queue` on the broker; None while disconnected"""
+        if not self._channels:
+            return None
+        try:
+            return await self._channels[0].message_count(queue)
+        except BrokerError:
+            return None
+
+    def publish(
+        self,
+        routing_key: str,
+        body: bytes,
+        headers: dict | None = None,
+        priority: int | None = None,
+        exchange: str = "",
+    ) -> asyncio.Future:
+        """Buffer a message; the returned future resolves on broker confirm.
+
+        Messages go to the queue `routing_key`, or with `exchange` to that
+        exchange (see amqp.CANCEL_EXCHANGE).
+        """
+        if self._closing:
+            raise BrokerUnavailable("publisher is closed")
+        if len(self._pending) >= self.max_buffer:
+            raise PublishBufferFull(
+                f"{len(self._pending)} messages waiting for the broker"
+            )
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append(
+            _Pending(routing_key, body, headers, priority, exchange, future)
+        )
+        self._has_pending.set()
+        return future
+
+    async def close(self, timeout: float = 5.0):
+        """Flush what can be flushed within `timeout`, then disconnect"""
+        if self._pending and self.connected:
+            futures = [item.future for item in self._pending]
+            await asyncio.wait(futures, timeout=timeout)
+        self._closing = True
+        if self._supervisor is not None:
+            self._supervisor.cancel()
+            await asyncio.gather(self._supervisor, return_exceptions=True)
+            self._supervisor = None
+        while self._pending:
+            item = self._pending.popleft()
+            if not item.future.done():
+                item.future.set_exception(BrokerUnavailable("publisher closed"))
+
+    # ------------------------------------------------------------------ #
+
+    async def _run(self):
+        delay = self.reconnect_delay
+        while not self._closing:
+            try:
+                connection = await self.broker.connect()
+                channels = [await connection.channel() for _ in range(self.pool_size)]
+                if self.on_connect is not None:
+                    await self.on_connect(channels[0])
+            except Exception as e:
+                logger.warning(f"AMQP connect failed ({e}), retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+                delay = min(delay * 2, self.max_reconnect_delay)
+                continue
+
+            delay = self.reconnect_delay
+            lost = asyncio.Event()
+            connection.add_close_callback(lost.set)
+            self.ever_connected = True
+            self._channels = channels
+            self._connected.set()
+            logger.info(f"AMQP publisher connected with {len(channels)} channels")
+
+            workers = [asyncio.create_task(self._channel_worker(ch)) for ch in channels]
+            watcher = asyncio.create_task(lost.wait())
+            try:
+                await asyncio.wait(
+                    [*workers, watcher], return_when=asyncio.FIRST_COMPLETED
+                )
+            finally:
+                self._connected.clear()
+                self._channels = []
+                for task in (*workers, watcher):
+                    task.cancel()
+                await asyncio.gather(*workers, watcher, return_exceptions=True)
+                try:
+                    await connection.close()
+                except Exception:
+                    pass
+            if not self._closing:
+                logger.warning(
+                    f"AMQP connection lost, {len(self._pending)} messages buffered"
+                )
+
+    async def _take_batch(self) -> list[_Pending]:
+        while not self._pending:
+            self._has_pending.clear()
+            await self._has_pending.wait()
+        size = min(self.batch_size, len(self._pending))
+        return [self._pending.popleft() for _ in range(size)]
+
+    def _requeue(self, items: list[_Pending]):
+        # Back to the front, keeping the original order
+        for item in reversed(items):
+            if not item.future.done():
+                self._pending.appendleft(item)
+        if self._pending:
+            self._has_pending.set()
+
+    def _observe(self, item: _Pending):
+        target = item.exchange or item.routing_key
+        latency = self._latency.get(target)
+        if latency is None:
+            latency = self._latency[target] = PUBLISH_LATENCY.labels(target)
+        latency.observe(time.perf_counter() - item.queued_at)
+
+    async def _channel_worker(self, channel):
+        while True:
+            batch = await self._take_batch()
+            try:
+                results = await asyncio.gather(
+                    *(
+                        channel.publish(
+                            item.routing_key,
+                            item.body,
+                            headers=item.headers,
+                            priority=item.priority,
+                            exchange=item.exchange,
+                        )
+                        for item in batch
+                    ),
+                    return_exceptions=True,
+                )
+            except asyncio.CancelledError:
+                self._requeue(batch)
+                raise
+
+            self.batches += 1
+            retry = []
+            for item, result in zip(batch, results, strict=True):
+                if item.future.done():
+                    continue
+                if isinstance(result, BrokerUnavailable):
+                    retry.append(item)
+                elif isinstance(result, BaseException):
+                    item.future.set_exception(result)
+                else:
+                    self.confirmed += 1
+                    self._observe(item)
+                    item.future.set_result(None)
+            if retry:
+                self._requeue(retry)
+                # Let the supervisor tear the connection down and reconnect
+                raise BrokerUnavailable("channel failed during publish")
@@ -0,0 +1,201 @@
+"""Content-addressed cache of solve results.
+
+A problem is identified by the SHA-256 of its canonical form: the problem
+type, the constraints and objectives re-serialized as sorted, compact JSON (so
+key order and whitespace don't matter), the timeout (a longer solve may find a
+better schedule) and the base schedule of a warm-started solve. A typed
+``ScheduleProblem`` / base ``ScheduleSolution`` is hashed as sent: re-encoding
+it canonically would mean decoding it in the API process. An uploaded
+roster is identified by its ``problem_id``, itself a content hash.
+
+``lookup`` answers a submission either with the job already solving the same
+problem (coalescing) or with a cached result. The cache follows job outcomes
+through the job store listener: completed results are kept, least recently
+used first out, within ``max_entries``/``max_bytes`` and for ``ttl_seconds``;
+failed jobs are forgotten so the problem is solved again next time. A job
+can also finish where this process's listener does not see it (another
+replica applied its result), so ``lookup`` reads the record of a job before
+coalescing onto it.
+"""
+
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+
+from job_store import JobRecord
+
+
+def _canonical(payload: str) -> str:
+    if not payload:
+        return ""
+    try:
+        return json.dumps(
+            json.loads(payload),
+            sort_keys=True,
+            separators=(",", ":"),
+            ensure_ascii=False,
+        )
+    except ValueError:
+        # Not JSON; the solver will reject it, but it still has an identity
+        return payload
+
+
+def problem_key(
+    problem_type: str,
+    constraints_json: str,
+    objectives_json: str,
+    timeout_seconds: int,
+    base_assignment_json: str = "",
+    problem: bytes = b"",
+    base_solution: bytes = b"",
+    problem_id: str = "",
+) -> str:
+    digest = hashlib.sha256()
+    for part in (
+        problem_type,
+        _canonical(constraints_json),
+        _canonical(objectives_json),
+        str(timeout_seconds),
+        _canonical(base_assignment_json),
+        problem_id,
+    ):
+        digest.update(part.encode())
+        digest.update(b"\0")
+    for part in (problem, base_solution):
+        # Length-prefixed: binary parts may contain the separator
+        digest.update(len(part).to_bytes(8, "big"))
+        digest.update(part)
+    return digest.hexdigest()
+
+
+class CachedResult:
+    __slots__ = ("job_id", "result_json", "solution", "stored_at")
+
+    def __init__(
+        self,
+        job_id: str,
+        result_json: str | None,
+        solution: bytes | None,
+        stored_at: float,
+    ):
+        self.job_id = job_id
+        self.result_json = result_json
+        self.solution = solution
+        self.stored_at = stored_at
+
+    @property
+    def nbytes(self) -> int:
+        return len(self.result_json or "") + len(self.solution or b"")
+
+
+class ResultCache:
+    def __init__(
+        self,
+        max_entries: int = 1000,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: float = 600,
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+
+        self._results: OrderedDict[str, CachedResult] = OrderedDict()
+        self._bytes = 0
+        # Problem key <-> job currently solving it
+        self._inflight: dict[str, str] = {}
+        self._inflight_keys: dict[str, str] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._results),
+            "bytes": self._bytes,
+            "inflight": len(self._inflight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+        }
+
+    def lookup(
+        self, key: str, job_record: Callable[[str], JobRecord | None]
+    ) -> tuple[str | None, CachedResult | None]:
+        """Return (job ID solving this problem, None) or (None, cached result).
+
+        `job_record` reads a job from the job store.
+        """
+        job_id = self._inflight.get(key)
+        if job_id is not None:
+            record = job_record(job_id)
+            if record is not None and not record.finished:
+                self.coalesced += 1
+                return job_id, None
+            # Finished unseen by the listener, or gone from the store
+            self._settle(job_id, record)
+
+        cached = self._results.get(key)
+        if cached is not None:
+            if time.monotonic() - cached.stored_at <= self.ttl_seconds:
+                self._results.move_to_end(key)
+                self.hits += 1
+                return None, cached
+            self._drop(key)
+        self.misses += 1
+        return None, None
+
+    def track(self, key: str, job_id: str):
+        """Remember that `job_id` is solving the problem `key`"""
+        if self.enabled:
+            self._inflight[key] = job_id
+            self._inflight_keys[job_id] = key
+
+    def on_job_update(self, record: JobRecord):
+        """Job store listener: cache results of tracked jobs as they finish"""
+        if record.finished:
+            self._settle(record.job_id, record)
+
+    def _settle(self, job_id: str, record: JobRecord | None):
+        """Stop tracking `job_id`, caching its result if it completed"""
+        key = self._inflight_keys.pop(job_id, None)
+        if key is None:
+            return
+        if self._inflight.get(key) == job_id:
+            del self._inflight[key]
+        if (
+            record is not None
+            and record.status == "completed"
+            and (record.result_json is not None or record.solution is not None)
+        ):
+            self._store(
+                key,
+                CachedResult(
+                    record.job_id,
+                    record.result_json,
+                    record.solution,
+                    time.monotonic(),
+                ),
+            )
+
+    def _store(self, key: str, cached: CachedResult):
+        if cached.nbytes > self.max_bytes:
+            return
+        if key in self._results:
+            self._drop(key)
+        self._results[key] = cached
+        self._bytes += cached.nbytes
+        while self._results and (
+            len(self._results) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            self._drop(next(iter(self._results)))
+
+    def _drop(self, key: str):
+        cached = self._results.pop(key)
+        self._bytes -= cached.nbytes
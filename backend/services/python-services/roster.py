@@ -0,0 +1,470 @@
+"""Streaming roster ingest and the store of uploaded problems.
+
+``RosterParser`` turns ``employees.csv``/``shifts.csv`` (the frontend's files)
+into a ``ScheduleProblem`` as they arrive in chunks: every complete line is
+parsed and validated straight away, so a multi-MB upload is never held as
+text and every bad row is reported with its line number. Rows may be split
+anywhere between chunks; quoted fields cannot contain newlines.
+
+An accepted problem is stored serialized (a ``ScheduleProblem`` message) in
+``ProblemStore`` under its ``problem_id``, the SHA-256 of that serialization,
+so uploading the same roster twice stores it once. Solve requests then send
+the ``problem_id`` instead of the roster. Problems unused for ``ttl_seconds``
+are dropped, least recently used first once the store outgrows ``max_bytes``,
+except those of jobs still in the job store (``in_use``): a completed typed
+job's solution is indices into its problem, so its schedule views need it.
+
+``make_problem_store(url)`` takes the job store's URL. In memory a problem
+lives in the process that received it. With ``sqlite://`` (``SqliteProblemStore``)
+problems are also persisted in the job store's database, so every replica
+opening it can solve a roster uploaded to another, and uploads survive a
+restart; the in-memory store then only holds the recently used ones.
+"""
+
+import asyncio
+import csv
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING
+
+from job_store import SQLITE_URL
+
+logger = logging.getLogger(__name__)
+
+if TYPE_CHECKING:
+    # Imported where used: the solver stack loads after the service is up
+    from scheduling import Employee, ScheduleProblem, Shift
+
+EMPLOYEES = "employees"
+SHIFTS = "shifts"
+
+# Row errors reported back; the rest are only counted
+MAX_ERRORS = 50
+
+
+class RosterError(ValueError):
+    """The roster has invalid rows; ``errors`` lists them"""
+
+    def __init__(self, errors: list[str], total: int):
+        more = f" (and {total - len(errors)} more)" if total > len(errors) else ""
+        super().__init__(f"{total} invalid roster rows{more}: {errors[0]}")
+        self.errors = errors
+        self.total = total
+
+
+class _CsvStream:
+    """One CSV file parsed line by line as its chunks arrive"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.header: list[str] | None = None
+        self.line = 0
+        self._partial = b""
+
+    def feed(self, data: bytes) -> Iterator[tuple[int, dict]]:
+        lines = (self._partial + data).split(b"\n")
+        self._partial = lines.pop()
+        return self._rows(lines)
+
+    def close(self) -> Iterator[tuple[int, dict]]:
+        lines, self._partial = [self._partial], b""
+        return self._rows(lines)
+
+    def _rows(self, lines: list[bytes]) -> Iterator[tuple[int, dict]]:
+        for raw in lines:
+            self.line += 1
+            try:
+                text = raw.decode("utf-8-sig" if self.line == 1 else "utf-8")
+            except UnicodeDecodeError as e:
+                raise ValueError(f"{self.name}.csv line {self.line}: {e}") from e
+            if not text.strip():
+                continue
+            values = next(csv.reader([text]))
+            if self.header is None:
+                self.header = [value.strip() for value in values]
+                continue
+            yield self.line, dict(zip(self.header, values, strict=False))
+
+
+class RosterParser:
+    """Builds a ScheduleProblem from CSV chunks of the two roster files"""
+
+    def __init__(self, constraints_json: str = "", objectives_json: str = ""):
+        self.constraints_json = constraints_json
+        self.objectives_json = objectives_json
+        self.nbytes = 0
+        self.errors: list[str] = []
+        self.error_count = 0
+
+        self._files = {name: _CsvStream(name) for name in (EMPLOYEES, SHIFTS)}
+        self._employees: dict[str, Employee] = {}
+        # shifts.csv repeats a shift once per assigned employee; keep the first
+        self._shifts: dict[str, Shift] = {}
+
+    def feed(self, file: str, data: bytes):
+        stream = self._files.get(file)
+        if stream is None:
+            raise ValueError(
+                f"Unknown roster file '{file}', expected {EMPLOYEES} or {SHIFTS}"
+            )
+        self.nbytes += len(data)
+        self._add(stream, stream.feed(data))
+
+    def finish(self) -> "ScheduleProblem":
+        from scheduling import ScheduleProblem
+
+        for stream in self._files.values():
+            self._add(stream, stream.close())
+        if not self._employees:
+            self._error(f"{EMPLOYEES}.csv has no employee rows")
+        if not self._shifts:
+            self._error(f"{SHIFTS}.csv has no shift rows")
+        if self.error_count:
+            raise RosterError(self.errors, self.error_count)
+
+        try:
+            constraints = json.loads(self.constraints_json or "{}")
+            objectives = json.loads(self.objectives_json or "{}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid problem JSON: {e}") from e
+        if EMPLOYEES in constraints or SHIFTS in constraints:
+            raise ValueError(
+                "constraints_json of a roster upload must not list employees "
+                "or shifts; they come from the CSV files"
+            )
+        return ScheduleProblem.from_rows(
+            list(self._employees.values()),
+            list(self._shifts.values()),
+            constraints,
+            objectives,
+        )
+
+    def _add(self, stream: _CsvStream, rows: Iterator[tuple[int, dict]]):
+        from scheduling import Employee, Shift
+
+        for line, row in rows:
+            try:
+                if stream.name == EMPLOYEES:
+                    employee = Employee.from_row(row)
+                    if employee.employee_id in self._employees:
+                        raise ValueError(f"duplicate employee {employee.employee_id}")
+                    self._employees[employee.employee_id] = employee
+                else:
+                    shift = Shift.from_row(row)
+                    shift.start()
+                    self._shifts.setdefault(shift.shift_id, shift)
+            except ValueError as e:
+                self._error(f"{stream.name}.csv line {line}: {e}")
+
+    def _error(self, message: str):
+        self.error_count += 1
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append(message)
+
+
+class StoredProblem:
+    __slots__ = ("problem", "employees", "shifts", "used_at")
+
+    def __init__(self, problem: bytes, employees: int, shifts: int, used_at: float):
+        self.problem = problem
+        self.employees = employees
+        self.shifts = shifts
+        self.used_at = used_at
+
+
+def problem_id(problem: bytes) -> str:
+    return hashlib.sha256(problem).hexdigest()
+
+
+class ProblemStore:
+    def __init__(
+        self,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: float = 24 * 3600,
+        in_use: Callable[[str], bool] | None = None,
+    ):
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        # Whether a stored job refers to a problem, which is then kept
+        self.in_use = in_use
+        self.uploads = 0
+        self.deduplicated = 0
+        self.evicted = 0
+
+        self._problems: OrderedDict[str, StoredProblem] = OrderedDict()
+        self._bytes = 0
+
+    def __contains__(self, problem_id: str) -> bool:
+        return self.get(problem_id) is not None
+
+    async def start(self):
+        pass
+
+    async def close(self):
+        pass
+
+    def stats(self) -> dict:
+        return {
+            "problems": len(self._problems),
+            "bytes": self._bytes,
+            "max_bytes": self.max_bytes,
+            "uploads": self.uploads,
+            "deduplicated": self.deduplicated,
+            "evicted": self.evicted,
+        }
+
+    def add(self, data: bytes, employees: int = 0, shifts: int = 0) -> tuple[str, bool]:
+        """Store a serialized problem; returns (problem_id, whether it was new).
+
+        `employees`/`shifts` are informational, 0 for a problem that was
+        never decoded here (one sent inline with a solve request).
+        """
+        key = problem_id(data)
+        self.uploads += 1
+        if self.get(key) is not None:
+            self.deduplicated += 1
+            return key, False
+        if len(data) > self.max_bytes:
+            raise ValueError(
+                f"Problem of {len(data)} bytes exceeds the store's "
+                f"{self.max_bytes} bytes"
+            )
+        self._keep(key, StoredProblem(data, employees, shifts, time.monotonic()))
+        return key, True
+
+    def get(self, problem_id: str) -> StoredProblem | None:
+        stored = self._problems.get(problem_id)
+        if stored is None:
+            return None
+        now = time.monotonic()
+        if now - stored.used_at > self.ttl_seconds and not self._pinned(problem_id):
+            self._drop(problem_id)
+            return None
+        stored.used_at = now
+        self._problems.move_to_end(problem_id)
+        return stored
+
+    async def fetch(self, problem_id: str) -> StoredProblem | None:
+        """``get``, reading the problem from storage if it has any"""
+        return self.get(problem_id)
+
+    def _keep(self, problem_id: str, stored: StoredProblem):
+        self._problems[problem_id] = stored
+        self._bytes += len(stored.problem)
+        self._evict()
+
+    def _pinned(self, problem_id: str) -> bool:
+        return self.in_use is not None and self.in_use(problem_id)
+
+    def _evict(self):
+        now = time.monotonic()
+        for key, stored in list(self._problems.items()):
+            if (
+                self._bytes <= self.max_bytes
+                and now - stored.used_at <= self.ttl_seconds
+            ):
+                break
+            if not self._pinned(key):
+                self._drop(key)
+
+    def _drop(self, problem_id: str):
+        stored = self._problems.pop(problem_id)
+        self._bytes -= len(stored.problem)
+        self.evicted += 1
+
+
+def make_problem_store(
+    url: str,
+    max_bytes: int = 256 * 1024 * 1024,
+    ttl_seconds: float = 24 * 3600,
+    in_use: Callable[[str], bool] | None = None,
+) -> ProblemStore:
+    """Problem store next to the job store at `url` (see make_job_store)"""
+    if url.startswith(SQLITE_URL):
+        return SqliteProblemStore(
+            url.removeprefix(SQLITE_URL), max_bytes=max_bytes, ttl_seconds=ttl_seconds
+        )
+    return ProblemStore(max_bytes=max_bytes, ttl_seconds=ttl_seconds, in_use=in_use)
+
+
+class SqliteProblemStore(ProblemStore):
+    """Problems persisted in a SQLite database, recently used ones in memory.
+
+    Like ``SqliteJobStore`` this keeps database I/O off the event loop.
+    ``add`` and ``get`` only touch memory: new problems and refreshed
+    ``used_at`` times (at most every ``touch_interval`` seconds per problem)
+    are written in one transaction every ``flush_interval`` seconds from a
+    worker thread, and ``fetch`` reads a problem missing from memory in one.
+    Problems unused for ``ttl_seconds`` that no job in the ``jobs`` table
+    refers to are deleted after a flush, at most every ``sweep_interval``
+    seconds. The in-memory copies are only a cache and are dropped regardless.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS problems (
+            problem_id TEXT PRIMARY KEY,
+            problem BLOB NOT NULL,
+            employees INTEGER NOT NULL,
+            shifts INTEGER NOT NULL,
+            used_at INTEGER NOT NULL
+        )
+    """
+    # A job in the job store (same database) solved the problem
+    IN_USE = "EXISTS (SELECT 1 FROM jobs WHERE jobs.problem_id = problems.problem_id)"
+
+    def __init__(
+        self,
+        path: str,
+        max_bytes: int = 256 * 1024 * 1024,
+        ttl_seconds: float = 24 * 3600,
+        touch_interval: float = 60,
+        flush_interval: float = 0.05,
+        sweep_interval: float = 60,
+    ):
+        super().__init__(max_bytes=max_bytes, ttl_seconds=ttl_seconds)
+        self.path = path
+        self.touch_interval = touch_interval
+        self.flush_interval = flush_interval
+        self.sweep_interval = sweep_interval
+        # Problem ID -> when this process last refreshed its used_at
+        self._touched: dict[str, float] = {}
+        # Writes not yet committed: new problems, and used_at refreshes
+        self._inserts: dict[str, tuple] = {}
+        self._touches: dict[str, int] = {}
+        self._has_pending = asyncio.Event()
+        self._flusher: asyncio.Task | None = None
+        # Flushes and fetches run in worker threads, one at a time
+        self._lock = threading.Lock()
+        self._db = sqlite3.connect(path, timeout=10, check_same_thread=False)
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute("PRAGMA synchronous=NORMAL")
+        with self._db:
+            self._db.execute(self.SCHEMA)
+
+    async def start(self):
+        if self._flusher is None:
+            self._flusher = asyncio.create_task(self._run())
+
+    async def close(self):
+        if self._flusher is not None:
+            self._flusher.cancel()
+            await asyncio.gather(self._flusher, return_exceptions=True)
+            self._flusher = None
+        self._flush(*self._take_pending())
+        self._db.close()
+
+    def add(self, data: bytes, employees: int = 0, shifts: int = 0) -> tuple[str, bool]:
+        key, created = super().add(data, employees, shifts)
+        if created:
+            self._inserts[key] = (key, data, employees, shifts, int(time.time()))
+            self._touched[key] = time.monotonic()
+            self._mark_dirty()
+        return key, created
+
+    def get(self, problem_id: str) -> StoredProblem | None:
+        """A problem held in memory; see ``fetch`` for the others"""
+        stored = super().get(problem_id)
+        if stored is not None:
+            self._touch(problem_id)
+        return stored
+
+    async def fetch(self, problem_id: str) -> StoredProblem | None:
+        stored = self.get(problem_id)
+        if stored is not None:
+            return stored
+        row = await asyncio.to_thread(self._select, problem_id)
+        if row is None:
+            return None
+        # Fetched concurrently by another request meanwhile?
+        stored = self.get(problem_id)
+        if stored is None:
+            stored = StoredProblem(*row, time.monotonic())
+            self._keep(problem_id, stored)
+            self._touch(problem_id)
+        return stored
+
+    def _select(self, problem_id: str) -> tuple | None:
+        with self._lock:
+            return self._db.execute(
+                "SELECT problem, employees, shifts FROM problems "
+                f"WHERE problem_id = ? AND (used_at >= ? OR {self.IN_USE})",
+                (problem_id, time.time() - self.ttl_seconds),
+            ).fetchone()
+
+    def _touch(self, problem_id: str):
+        now = time.monotonic()
+        if now - self._touched.get(problem_id, 0) < self.touch_interval:
+            return
+        self._touched[problem_id] = now
+        self._touches[problem_id] = int(time.time())
+        self._mark_dirty()
+
+    def _mark_dirty(self):
+        if self._flusher is None:
+            # No event loop driving flushes (scripts, tests): write through
+            self._flush(*self._take_pending())
+        else:
+            self._has_pending.set()
+
+    def _take_pending(self) -> tuple[list[tuple], list[tuple]]:
+        inserts = list(self._inserts.values())
+        touches = [(used_at, key) for key, used_at in self._touches.items()]
+        self._inserts.clear()
+        self._touches.clear()
+        return inserts, touches
+
+    def _flush(self, inserts: list[tuple], touches: list[tuple]):
+        if not inserts and not touches:
+            return
+        with self._lock, self._db:
+            self._db.executemany(
+                "INSERT INTO problems VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (problem_id) DO UPDATE SET used_at = excluded.used_at",
+                inserts,
+            )
+            self._db.executemany(
+                "UPDATE problems SET used_at = ? WHERE problem_id = ?", touches
+            )
+
+    def _sweep(self):
+        with self._lock, self._db:
+            self._db.execute(
+                f"DELETE FROM problems WHERE used_at < ? AND NOT {self.IN_USE}",
+                (time.time() - self.ttl_seconds,),
+            )
+
+    async def _run(self):
+        last_sweep = time.monotonic()
+        while True:
+            await self._has_pending.wait()
+            self._has_pending.clear()
+            # Let a burst of writes accumulate into one transaction
+            await asyncio.sleep(self.flush_interval)
+            inserts, touches = self._take_pending()
+            try:
+                await asyncio.to_thread(self._flush, inserts, touches)
+            except sqlite3.Error as e:
+                logger.error(f"Problem store flush failed, retrying: {e}")
+                for row in inserts:
+                    self._inserts.setdefault(row[0], row)
+                for used_at, key in touches:
+                    self._touches.setdefault(key, used_at)
+                self._has_pending.set()
+                await asyncio.sleep(self.flush_interval)
+
+            if time.monotonic() - last_sweep >= self.sweep_interval:
+                last_sweep = time.monotonic()
+                try:
+                    await asyncio.to_thread(self._sweep)
+                except sqlite3.Error as e:
+                    logger.error(f"Problem store TTL sweep failed: {e}")
+
+    def _drop(self, problem_id: str):
+        super()._drop(problem_id)
+        self._touched.pop(problem_id, None)
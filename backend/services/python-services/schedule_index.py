@@ -0,0 +1,240 @@
+"""Indexed, paginated views of a completed schedule.
+
+A finished job's schedule is one blob (``result_json``, or the typed
+``solution`` with its problem). ``ScheduleIndex`` groups its assignments and
+coverage gaps by date and by employee once, so ``/schedules/{job_id}`` views
+answer a page or a date range with a bisect and a slice instead of every
+client downloading and scanning the whole schedule.
+
+A completed job never changes, so its ETag follows from the job ID and
+completion time alone: a conditional GET whose ``If-None-Match`` matches is
+answered 304 before any index is looked up. Indexes are built on first use,
+off the event loop, and the ``max_entries`` most recently used are kept.
+"""
+
+import asyncio
+import hashlib
+import json
+from bisect import bisect_left, bisect_right
+from collections import OrderedDict, defaultdict
+from collections.abc import Awaitable, Callable
+from datetime import date
+
+from job_store import JobRecord
+
+# Bump when the shape of the views changes, so clients don't keep stale pages
+INDEX_VERSION = 1
+
+
+def schedule_etag(job: JobRecord) -> str:
+    digest = hashlib.sha256(
+        f"{INDEX_VERSION}:{job.job_id}:{job.completed_at}".encode()
+    ).hexdigest()
+    return f'"{digest[:32]}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    # If-None-Match uses the weak comparison
+    return "*" in tags or etag in (tag.removeprefix("W/") for tag in tags)
+
+
+def parse_date(value: str | None, name: str) -> str | None:
+    """Validate an ISO date filter; shift dates compare as ISO strings"""
+    if value is None:
+        return None
+    try:
+        return date.fromisoformat(value).isoformat()
+    except ValueError as e:
+        raise ValueError(f"Invalid {name} date '{value}', expected YYYY-MM-DD") from e
+
+
+class ScheduleIndex:
+    """A schedule's assignments and coverage gaps by date and by employee"""
+
+    __slots__ = (
+        "status",
+        "objective_value",
+        "assignments",
+        "dates",
+        "employees",
+        "_by_date",
+        "_gaps_by_date",
+        "_by_employee",
+        "_employee_dates",
+    )
+
+    def __init__(self, result: dict):
+        self.status = result.get("status")
+        self.objective_value = result.get("objective_value")
+        assignments = sorted(
+            result.get("assignments", []),
+            key=lambda a: (a["date"], a.get("time", ""), a["shift_id"]),
+        )
+        self.assignments = len(assignments)
+
+        by_date: defaultdict[str, list[dict]] = defaultdict(list)
+        gaps_by_date: defaultdict[str, list[dict]] = defaultdict(list)
+        by_employee: defaultdict[str, list[dict]] = defaultdict(list)
+        names: dict[str, str] = {}
+        for assignment in assignments:
+            by_date[assignment["date"]].append(assignment)
+            by_employee[assignment["employee_id"]].append(assignment)
+            names.setdefault(
+                assignment["employee_id"], assignment.get("employee_name", "")
+            )
+        for gap in result.get("coverage_gaps", []):
+            gaps_by_date[gap["date"]].append(gap)
+
+        self.dates = sorted(by_date.keys() | gaps_by_date.keys())
+        self.employees = [
+            {
+                "employee_id": employee_id,
+                "employee_name": names[employee_id],
+                "shifts": len(by_employee[employee_id]),
+            }
+            for employee_id in sorted(by_employee)
+        ]
+        self._by_date = dict(by_date)
+        self._gaps_by_date = dict(gaps_by_date)
+        self._by_employee = dict(by_employee)
+        # Per employee, the dates of their assignments (sorted) for bisecting
+        self._employee_dates = {
+            employee_id: [a["date"] for a in shifts]
+            for employee_id, shifts in by_employee.items()
+        }
+
+    def summary(self) -> dict:
+        """What a view needs to lay itself out: dates and employees"""
+        return {
+            "status": self.status,
+            "objective_value": self.objective_value,
+            "assignments": self.assignments,
+            "coverage_gaps": sum(len(gaps) for gaps in self._gaps_by_date.values()),
+            "dates": self.dates,
+            "employees": self.employees,
+        }
+
+    def by_date(
+        self, start: str | None, end: str | None, offset: int, limit: int
+    ) -> tuple[list[dict], int]:
+        """A page of dates within [start, end], plus how many dates match"""
+        lo = bisect_left(self.dates, start) if start else 0
+        hi = bisect_right(self.dates, end) if end else len(self.dates)
+        total = max(hi - lo, 0)
+        page = self.dates[min(lo + offset, hi) : min(lo + offset + limit, hi)]
+        return [
+            {
+                "date": day,
+                "assignments": self._by_date.get(day, []),
+                "coverage_gaps": self._gaps_by_date.get(day, []),
+            }
+            for day in page
+        ], total
+
+    def by_employee(
+        self,
+        employee_ids: list[str] | None,
+        start: str | None,
+        end: str | None,
+        offset: int,
+        limit: int,
+    ) -> tuple[list[dict], int]:
+        """A page of employees with their assignments within [start, end]"""
+        employees = self.employees
+        if employee_ids:
+            wanted = set(employee_ids)
+            employees = [e for e in employees if e["employee_id"] in wanted]
+        page = []
+        for employee in employees[offset : offset + limit]:
+            employee_id = employee["employee_id"]
+            dates = self._employee_dates[employee_id]
+            lo = bisect_left(dates, start) if start else 0
+            hi = bisect_right(dates, end) if end else len(dates)
+            page.append(
+                {
+                    "employee_id": employee_id,
+                    "employee_name": employee["employee_name"],
+                    "assignments": self._by_employee[employee_id][lo:hi],
+                }
+            )
+        return page, len(employees)
+
+
+def build_index(
+    result_json: str | None, solution: bytes | None, problem: bytes | None
+) -> ScheduleIndex:
+    """Index a job's result: JSON, or a typed solution decoded with its problem"""
+    if solution:
+        import payloads
+
+        if problem is None:
+            raise LookupError("The problem of this typed schedule is no longer stored")
+        result = payloads.decode_solution(payloads.decode_problem(problem), solution)
+    else:
+        result = json.loads(result_json or "{}")
+    return ScheduleIndex(result)
+
+
+class ScheduleIndexes:
+    """Indexes of recently viewed schedules, keyed by ETag"""
+
+    def __init__(self, max_entries: int = 50):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.builds = 0
+
+        self._indexes: OrderedDict[str, ScheduleIndex] = OrderedDict()
+        # Builds in progress, shared by concurrent requests for one schedule
+        self._building: dict[str, asyncio.Task] = {}
+
+    def stats(self) -> dict:
+        return {
+            "indexes": len(self._indexes),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "builds": self.builds,
+        }
+
+    async def get(
+        self, job: JobRecord, problem: Callable[[str], Awaitable[bytes | None]]
+    ) -> ScheduleIndex:
+        """The index of a completed job; `problem` looks up a stored problem"""
+        etag = schedule_etag(job)
+        index = self._indexes.get(etag)
+        if index is not None:
+            self.hits += 1
+            self._indexes.move_to_end(etag)
+            return index
+        building = self._building.get(etag)
+        if building is not None:
+            self.hits += 1
+        else:
+            # Its own task, so a cancelled request does not cancel the build
+            # that concurrent requests for the schedule are waiting on
+            building = asyncio.create_task(self._build(etag, job, problem))
+            self._building[etag] = building
+            building.add_done_callback(lambda _: self._building.pop(etag, None))
+            # Retrieved here so a failure nobody awaited isn't logged as lost
+            building.add_done_callback(
+                lambda task: task.cancelled() or task.exception()
+            )
+        return await asyncio.shield(building)
+
+    async def _build(
+        self,
+        etag: str,
+        job: JobRecord,
+        problem: Callable[[str], Awaitable[bytes | None]],
+    ) -> ScheduleIndex:
+        data = await problem(job.problem_id) if job.solution else None
+        index = await asyncio.to_thread(
+            build_index, job.result_json, job.solution, data
+        )
+        self.builds += 1
+        self._indexes[etag] = index
+        while len(self._indexes) > self.max_entries:
+            self._indexes.popitem(last=False)
+        return index
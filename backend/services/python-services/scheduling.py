@@ -0,0 +1,755 @@
+"""Shift-scheduling domain model and OR-Tools CP-SAT engine.
+
+The input format mirrors the ``employees.csv``/``shifts.csv`` files used by the
+frontend: ``constraints_json`` carries the employee and shift rows plus hard
+limits, ``objectives_json`` carries the soft-objective weights.
+
+A solve can be warm-started from a previous schedule (``base_assignment_json``:
+a result's JSON or its ``assignments`` list). The base assignments become
+solution hints, changes against them are penalized (``change_penalty``), and
+if ``affected_dates``/``affected_employees`` are given every assignment
+outside them is frozen, so a small edit re-solves only the part it touches.
+
+Interchangeable employees are solved as classes (see ``presolve.py``): one
+count per class and shift instead of a boolean per employee, expanded back
+into named assignments.
+
+Everything in this module is plain Python/OR-Tools so it can be executed inside
+a worker process (see ``solver_pool.py``). ``stop_searches()`` stops every
+CP-SAT search running in the process from another thread; that is how the
+pool cancels a solve or holds it to its resource limits.
+"""
+
+import json
+import threading
+import time
+from collections import Counter, defaultdict
+from collections.abc import Callable
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING
+
+from ortools.sat import sat_parameters_pb2
+from ortools.sat.python import cp_model
+
+import job_profile
+import presolve
+from evaluator import ScheduleMatrices
+
+if TYPE_CHECKING:
+    from portfolio import Incumbents
+
+SHIFT_SCHEDULING = "shift_scheduling"
+
+# constraints["solver"]["mode"]: one model over the whole horizon, overlapping
+# time windows solved in parallel (see decomposition.py), or several CP-SAT
+# strategies racing on the same model (see portfolio.py)
+GLOBAL = "global"
+DECOMPOSE = "decompose"
+PORTFOLIO = "portfolio"
+SOLVER_MODES = (GLOBAL, DECOMPOSE, PORTFOLIO)
+
+EPOCH = datetime(1970, 1, 1)
+
+# CP-SAT searches running in this process, for stop_searches()
+_searches: set[cp_model.CpSolver] = set()
+_searches_lock = threading.Lock()
+_searches_stopped = False
+
+STATUS_NAMES = {
+    cp_model.OPTIMAL: "optimal",
+    cp_model.FEASIBLE: "feasible",
+    cp_model.INFEASIBLE: "infeasible",
+    cp_model.MODEL_INVALID: "model_invalid",
+    cp_model.UNKNOWN: "unknown",
+}
+
+
+def _text(row: dict, key: str) -> str:
+    value = row.get(key)
+    return str(value).strip() if value is not None else ""
+
+
+def stop_searches():
+    """Stop every search running in this process, and every search started
+    until resume_searches(); each returns the best solution it has found"""
+    global _searches_stopped
+    with _searches_lock:
+        _searches_stopped = True
+        for solver in _searches:
+            solver.stop_search()
+
+
+def resume_searches():
+    global _searches_stopped
+    with _searches_lock:
+        _searches_stopped = False
+
+
+def parse_assignments(base_assignment_json: str) -> frozenset[tuple[str, str]]:
+    """(employee_id, shift_id) pairs of a previous result or assignment list"""
+    try:
+        base = json.loads(base_assignment_json)
+    except json.JSONDecodeError as e:
+        raise ValueError(f"Invalid assignment JSON: {e}") from e
+    if isinstance(base, dict):
+        base = base.get("assignments")
+    if not isinstance(base, list):
+        raise ValueError("Assignment JSON must be a result or a list of assignments")
+    return frozenset(
+        (_text(row, "employee_id"), _text(row, "shift_id"))
+        for row in base
+        if isinstance(row, dict)
+    )
+
+
+def solver_options(solver: dict) -> dict:
+    """Validate constraints["solver"]"""
+    if not isinstance(solver, dict):
+        raise ValueError("solver options must be an object")
+    if solver.get("mode", GLOBAL) not in SOLVER_MODES:
+        raise ValueError(
+            f"Unknown solver mode '{solver['mode']}', "
+            f"expected one of: {', '.join(SOLVER_MODES)}"
+        )
+    if not isinstance(solver.get("presolve", True), bool):
+        raise ValueError("solver.presolve must be true or false")
+    return solver
+
+
+@dataclass(frozen=True, slots=True)
+class Employee:
+    employee_id: str
+    name: str = ""
+    initials: str = ""
+    preferred_shift_time: str = ""
+    preferred_shift_date: str = ""
+    unavailable_shift_time: str = ""
+    unavailable_shift_date: str = ""
+    max_shifts: int | None = None
+
+    @classmethod
+    def from_row(cls, row: dict) -> "Employee":
+        employee_id = _text(row, "employee_id")
+        if not employee_id:
+            raise ValueError(f"Employee row without employee_id: {row}")
+        max_shifts = row.get("max_shifts")
+        return cls(
+            employee_id=employee_id,
+            name=_text(row, "employee_name"),
+            initials=_text(row, "employee_initials"),
+            preferred_shift_time=_text(row, "preferred_shift_time"),
+            preferred_shift_date=_text(row, "preferred_shift_date"),
+            unavailable_shift_time=_text(row, "unavailable_shift_time"),
+            unavailable_shift_date=_text(row, "unavailable_shift_date"),
+            max_shifts=int(max_shifts) if max_shifts not in (None, "") else None,
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class Shift:
+    shift_id: str
+    date: str
+    shift_type: str
+    time: str = ""
+    required: int = 1
+    duration_hours: float = 8.0
+
+    @classmethod
+    def from_row(cls, row: dict) -> "Shift":
+        shift_id = _text(row, "shift_id")
+        date = _text(row, "date")
+        shift_type = _text(row, "shift_type")
+        if not (shift_id and date and shift_type):
+            raise ValueError(f"Shift row needs shift_id, date and shift_type: {row}")
+        required = row.get("required")
+        required = int(required) if required not in (None, "") else 1
+        if required < 0:
+            raise ValueError(f"Shift {shift_id} has negative required staff")
+        duration = row.get("duration_hours")
+        return cls(
+            shift_id=shift_id,
+            date=date,
+            shift_type=shift_type,
+            time=_text(row, "time"),
+            required=required,
+            duration_hours=float(duration) if duration not in (None, "") else 8.0,
+        )
+
+    def start(self) -> datetime:
+        try:
+            return datetime.fromisoformat(f"{self.date}T{self.time or '00:00'}")
+        except ValueError as e:
+            raise ValueError(f"Shift {self.shift_id} has an invalid date/time") from e
+
+    def hours(self) -> tuple[float, float]:
+        """Start and end as hours since the epoch"""
+        start = (self.start() - EPOCH) / timedelta(hours=1)
+        return start, start + self.duration_hours
+
+    def week(self) -> str:
+        """ISO week the shift starts in, e.g. 2025-W03"""
+        return self.start().strftime("%G-W%V")
+
+
+@dataclass
+class ScheduleProblem:
+    employees: list[Employee]
+    shifts: list[Shift]
+    max_shifts_per_employee: int | None = None
+    max_shifts_per_day: int = 1
+    preferred_shift_weight: int = 1
+    preferred_date_weight: int = 2
+    understaffing_penalty: int = 100
+    change_penalty: int = 1
+    affected_dates: frozenset[str] = frozenset()
+    affected_employees: frozenset[str] = frozenset()
+    # Hours off between the end of one shift and the start of the next
+    min_rest_hours: float | None = None
+    # Shifts per employee per ISO week
+    max_shifts_per_week: int | None = None
+    # How to solve it: {"mode": "global" | "decompose" | "portfolio",
+    # "presolve": true | false, ...}
+    solver: dict = field(default_factory=dict)
+
+    @classmethod
+    def from_json(
+        cls, constraints_json: str, objectives_json: str = ""
+    ) -> "ScheduleProblem":
+        try:
+            constraints = json.loads(constraints_json or "{}")
+            objectives = json.loads(objectives_json or "{}")
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid problem JSON: {e}") from e
+        return cls.from_dict(constraints, objectives)
+
+    @classmethod
+    def from_dict(cls, constraints: dict, objectives: dict) -> "ScheduleProblem":
+        employees = [Employee.from_row(row) for row in constraints.get("employees", [])]
+        if not employees:
+            raise ValueError("constraints_json must list at least one employee")
+
+        # shifts.csv repeats rows for the same shift_id; keep the first occurrence
+        shifts: dict[str, Shift] = {}
+        for row in constraints.get("shifts", []):
+            shift = Shift.from_row(row)
+            shifts.setdefault(shift.shift_id, shift)
+        if not shifts:
+            raise ValueError("constraints_json must list at least one shift")
+
+        return cls.from_rows(employees, list(shifts.values()), constraints, objectives)
+
+    @classmethod
+    def from_rows(
+        cls,
+        employees: list[Employee],
+        shifts: list[Shift],
+        constraints: dict,
+        objectives: dict,
+    ) -> "ScheduleProblem":
+        """Parsed employees and shifts plus the remaining limits and weights"""
+        max_per_employee = constraints.get("max_shifts_per_employee")
+        min_rest_hours = constraints.get("min_rest_hours")
+        max_per_week = constraints.get("max_shifts_per_week")
+        solver = solver_options(constraints.get("solver") or {})
+        return cls(
+            employees=employees,
+            shifts=shifts,
+            max_shifts_per_employee=(
+                int(max_per_employee) if max_per_employee is not None else None
+            ),
+            max_shifts_per_day=int(constraints.get("max_shifts_per_day", 1)),
+            preferred_shift_weight=int(objectives.get("preferred_shift_weight", 1)),
+            preferred_date_weight=int(objectives.get("preferred_date_weight", 2)),
+            understaffing_penalty=int(objectives.get("understaffing_penalty", 100)),
+            change_penalty=int(objectives.get("change_penalty", 1)),
+            affected_dates=frozenset(
+                str(date) for date in constraints.get("affected_dates", [])
+            ),
+            affected_employees=frozenset(
+                str(employee_id)
+                for employee_id in constraints.get("affected_employees", [])
+            ),
+            min_rest_hours=(
+                float(min_rest_hours) if min_rest_hours is not None else None
+            ),
+            max_shifts_per_week=int(max_per_week) if max_per_week is not None else None,
+            solver=solver,
+        )
+
+    def is_unavailable(self, employee: Employee, shift: Shift) -> bool:
+        """An employee is blocked for a shift type on a date, or either alone"""
+        if not (employee.unavailable_shift_time or employee.unavailable_shift_date):
+            return False
+        time_matches = (
+            not employee.unavailable_shift_time
+            or employee.unavailable_shift_time == shift.shift_type
+        )
+        date_matches = (
+            not employee.unavailable_shift_date
+            or employee.unavailable_shift_date == shift.date
+        )
+        return time_matches and date_matches
+
+    def preference_score(self, employee: Employee, shift: Shift) -> int:
+        score = 0
+        if employee.preferred_shift_time == shift.shift_type:
+            score += self.preferred_shift_weight
+        if employee.preferred_shift_date == shift.date:
+            score += self.preferred_date_weight
+        return score
+
+    def max_shifts_for(self, employee: Employee) -> int | None:
+        if employee.max_shifts is not None:
+            return employee.max_shifts
+        return self.max_shifts_per_employee
+
+    def is_frozen(self, employee: Employee, shift: Shift) -> bool:
+        """Outside the affected dates/employees of an incremental re-solve"""
+        if not (self.affected_dates or self.affected_employees):
+            return False
+        return (
+            shift.date not in self.affected_dates
+            and employee.employee_id not in self.affected_employees
+        )
+
+
+class ShiftScheduleModel:
+    """CP-SAT model: how many of each group of employees work each shift.
+
+    A group is a class of interchangeable employees when ``presolve.mode``
+    is CLASSES, else a single employee: then there is one boolean per
+    (available employee, shift) pair.
+    """
+
+    def __init__(
+        self,
+        problem: ScheduleProblem,
+        base: frozenset[tuple[str, str]] | None = None,
+    ):
+        self.problem = problem
+        self.base = base
+        self.model = cp_model.CpModel()
+        self.presolve = presolve.mode(problem, base)
+        # Employee indices solved together
+        self.groups = (
+            presolve.employee_classes(problem)
+            if self.presolve == presolve.CLASSES
+            else [(e,) for e in range(len(problem.employees))]
+        )
+        # (group, shift) -> how many of the group work the shift
+        self.assign: dict[tuple[int, int], cp_model.IntVar] = {}
+        self.shortfall: dict[int, cp_model.IntVar] = {}
+        self.frozen = 0
+        self._build()
+
+    def _build(self):
+        problem = self.problem
+        model = self.model
+
+        for g, members in enumerate(self.groups):
+            employee = problem.employees[members[0]]
+            for s, shift in enumerate(problem.shifts):
+                if problem.is_unavailable(employee, shift):
+                    continue
+                if len(members) == 1:
+                    self.assign[g, s] = model.new_bool_var(f"x_{g}_{s}")
+                else:
+                    self.assign[g, s] = model.new_int_var(
+                        0, min(len(members), shift.required), f"x_{g}_{s}"
+                    )
+
+        by_shift: dict[int, list[cp_model.IntVar]] = defaultdict(list)
+        by_group: dict[int, list[cp_model.IntVar]] = defaultdict(list)
+        by_group_day: dict[tuple[int, str], list[cp_model.IntVar]] = defaultdict(list)
+        for (g, s), var in self.assign.items():
+            by_shift[s].append(var)
+            by_group[g].append(var)
+            by_group_day[g, problem.shifts[s].date].append(var)
+
+        # Coverage: staff each shift up to `required`, paying for any shortfall
+        for s, shift in enumerate(problem.shifts):
+            short = model.new_int_var(0, shift.required, f"short_{s}")
+            self.shortfall[s] = short
+            model.add(sum(by_shift[s]) + short == shift.required)
+
+        # A group's limits are its members' limits times its size
+        for (g, _), day_vars in by_group_day.items():
+            if len(day_vars) > problem.max_shifts_per_day:
+                size = len(self.groups[g])
+                model.add(sum(day_vars) <= problem.max_shifts_per_day * size)
+
+        for g, members in enumerate(self.groups):
+            limit = problem.max_shifts_for(problem.employees[members[0]])
+            if limit is not None and len(by_group[g]) > limit:
+                model.add(sum(by_group[g]) <= limit * len(members))
+
+        if problem.max_shifts_per_week is not None:
+            weeks = [shift.week() for shift in problem.shifts]
+            by_group_week: dict[tuple[int, str], list] = defaultdict(list)
+            for (g, s), var in self.assign.items():
+                by_group_week[g, weeks[s]].append(var)
+            for (g, _), week_vars in by_group_week.items():
+                if len(week_vars) > problem.max_shifts_per_week:
+                    size = len(self.groups[g])
+                    model.add(sum(week_vars) <= problem.max_shifts_per_week * size)
+
+        # Only with a group per employee (see presolve.mode)
+        if problem.min_rest_hours is not None:
+            self._add_rest(by_group)
+
+        preference = []
+        for (g, s), var in self.assign.items():
+            employee = problem.employees[self.groups[g][0]]
+            score = problem.preference_score(employee, problem.shifts[s])
+            if score:
+                preference.append(score * var)
+        penalty = problem.understaffing_penalty * sum(self.shortfall.values())
+        objective = sum(preference) - penalty
+        if self.base is not None:
+            objective -= problem.change_penalty * self._warm_start()
+        model.maximize(objective)
+
+    def _add_rest(self, by_employee: dict[int, list[cp_model.IntVar]]):
+        """At most one shift per employee in any span shorter than the rest time.
+
+        For each of an employee's shifts, that shift and every later-starting
+        one that begins before it ends plus ``min_rest_hours`` are mutually
+        exclusive; this also covers the Evening -> next day's Night boundary
+        that the per-day limit cannot see.
+        """
+        hours = [shift.hours() for shift in self.problem.shifts]
+        rest = self.problem.min_rest_hours
+        employee_shifts: dict[int, list[tuple[float, float, cp_model.IntVar]]] = (
+            defaultdict(list)
+        )
+        for (e, s), var in self.assign.items():
+            employee_shifts[e].append((*hours[s], var))
+        for shifts in employee_shifts.values():
+            shifts.sort(key=lambda item: item[0])
+            for i, (_, end, var) in enumerate(shifts):
+                clashing = [var]
+                for start, _, other in shifts[i + 1 :]:
+                    if start >= end + rest:
+                        break
+                    clashing.append(other)
+                if len(clashing) > 1:
+                    self.model.add_at_most_one(clashing)
+
+    def _warm_start(self) -> cp_model.LinearExpr:
+        """Hint (and freeze) the base schedule; returns the number of changes"""
+        problem = self.problem
+        changes = []
+        for (g, s), var in self.assign.items():
+            employee, shift = problem.employees[self.groups[g][0]], problem.shifts[s]
+            was_assigned = (employee.employee_id, shift.shift_id) in self.base
+            self.model.add_hint(var, int(was_assigned))
+            if problem.is_frozen(employee, shift):
+                self.model.add(var == int(was_assigned))
+                self.frozen += 1
+            else:
+                changes.append(1 - var if was_assigned else var)
+        return sum(changes)
+
+    def solve(
+        self,
+        timeout_seconds: float,
+        num_workers: int = 0,
+        parameters: sat_parameters_pb2.SatParameters | None = None,
+        incumbents: "Incumbents | None" = None,
+        strategy: str = "",
+    ) -> dict:
+        """Solve with optional extra CP-SAT `parameters`.
+
+        With `incumbents`, every improving solution is offered to it as it is
+        found, and it may stop the search early.
+        """
+        solver = cp_model.CpSolver()
+        solver.parameters.max_time_in_seconds = float(timeout_seconds)
+        if num_workers:
+            solver.parameters.num_workers = num_workers
+        if parameters is not None:
+            solver.parameters.MergeFrom(parameters)
+
+        with _searches_lock:
+            if _searches_stopped:
+                solver.parameters.max_time_in_seconds = 0
+            _searches.add(solver)
+        try:
+            if incumbents is not None:
+                status = incumbents.solve(self, solver, strategy)
+            else:
+                status = solver.solve(self.model)
+        finally:
+            with _searches_lock:
+                _searches.discard(solver)
+        result = {
+            "status": STATUS_NAMES.get(status, "unknown"),
+            "objective_value": None,
+            "best_bound": None,
+            "wall_time": solver.wall_time,
+            "assignments": [],
+            "coverage_gaps": [],
+            "model": self.stats(),
+        }
+        if status not in (cp_model.OPTIMAL, cp_model.FEASIBLE):
+            return result
+
+        result["objective_value"] = solver.objective_value
+        result["best_bound"] = solver.best_objective_bound
+        result["assignments"], result["coverage_gaps"] = self.solution(solver)
+        if self.base is not None:
+            result["diff"] = self._diff(result["assignments"])
+        return result
+
+    def solution(self, values) -> tuple[list[dict], list[dict]]:
+        """Assignments and coverage gaps of the solution held by `values`.
+
+        `values` is a solved ``CpSolver`` or a solution callback.
+        """
+        problem = self.problem
+        by_group: dict[int, list[tuple[int, cp_model.IntVar]]] = defaultdict(list)
+        for (g, s), var in self.assign.items():
+            by_group[g].append((s, var))
+        pairs = []
+        for g, shift_vars in by_group.items():
+            members = self.groups[g]
+            if len(members) == 1:
+                pairs.extend(
+                    (members[0], s)
+                    for s, var in shift_vars
+                    if values.boolean_value(var)
+                )
+            else:
+                counts = {s: values.value(var) for s, var in shift_vars}
+                pairs.extend(presolve.expand(problem, members, counts))
+
+        assignments = []
+        for e, s in sorted(pairs, key=lambda pair: pair[::-1]):
+            employee, shift = problem.employees[e], problem.shifts[s]
+            assignments.append(
+                {
+                    "shift_id": shift.shift_id,
+                    "date": shift.date,
+                    "time": shift.time,
+                    "shift_type": shift.shift_type,
+                    "employee_id": employee.employee_id,
+                    "employee_name": employee.name,
+                }
+            )
+        coverage_gaps = []
+        for s, short in self.shortfall.items():
+            missing = values.value(short)
+            if missing:
+                shift = problem.shifts[s]
+                coverage_gaps.append(
+                    {
+                        "shift_id": shift.shift_id,
+                        "date": shift.date,
+                        "shift_type": shift.shift_type,
+                        "missing": missing,
+                    }
+                )
+        return assignments, coverage_gaps
+
+    def _diff(self, assignments: list[dict]) -> dict:
+        """Assignments added and removed relative to the base schedule"""
+        current = {(a["employee_id"], a["shift_id"]) for a in assignments}
+        removed = sorted(self.base - current, key=lambda pair: pair[::-1])
+        return {
+            "added": [
+                a
+                for a in assignments
+                if (a["employee_id"], a["shift_id"]) not in self.base
+            ],
+            "removed": [
+                {"shift_id": shift_id, "employee_id": employee_id}
+                for employee_id, shift_id in removed
+            ],
+            "unchanged": len(current & self.base),
+            "frozen": self.frozen,
+        }
+
+    def stats(self) -> dict:
+        proto = self.model.proto
+        shifts_available = Counter(g for g, _ in self.assign)
+        return {
+            "variables": len(proto.variables),
+            "constraints": len(proto.constraints),
+            "presolve": {
+                "mode": self.presolve,
+                "groups": len(self.groups),
+                "assignment_variables": len(self.assign),
+                # What one boolean per employee would have taken
+                "employee_shift_pairs": sum(
+                    len(self.groups[g]) * n for g, n in shifts_available.items()
+                ),
+            },
+        }
+
+
+def solve_shift_schedule(
+    constraints_json: str,
+    objectives_json: str,
+    timeout_seconds: float,
+    num_workers: int = 0,
+    base_assignment_json: str = "",
+    on_incumbent: Callable[[dict], None] | None = None,
+) -> dict:
+    """Solve a shift-scheduling problem given as JSON"""
+    started = time.perf_counter()
+    with job_profile.phase("parse"):
+        problem = ScheduleProblem.from_json(constraints_json, objectives_json)
+        base = parse_assignments(base_assignment_json) if base_assignment_json else None
+    parse_time = time.perf_counter() - started
+    result = solve_problem(problem, timeout_seconds, num_workers, base, on_incumbent)
+    result["parse_time"] = parse_time
+    return result
+
+
+def solve_problem(
+    problem: ScheduleProblem,
+    timeout_seconds: float,
+    num_workers: int = 0,
+    base: frozenset[tuple[str, str]] | None = None,
+    on_incumbent: Callable[[dict], None] | None = None,
+) -> dict:
+    """Solve a parsed problem, warm-started from `base` if given.
+
+    `on_incumbent` is called with each improved intermediate result, at most
+    once per ``solver.progress_interval`` seconds (not in decompose mode).
+    """
+    # Imported here: these modules build on this one
+    from decomposition import solve_decomposed
+    from portfolio import Incumbents, solve_portfolio
+
+    started = time.perf_counter()
+    mode = problem.solver.get("mode", GLOBAL)
+    if mode == DECOMPOSE:
+        if base is not None:
+            raise ValueError("Warm starts are not supported with solver mode decompose")
+        # Window models are built inside the parallel solve
+        with job_profile.phase("solve"):
+            result = solve_decomposed(problem, timeout_seconds, num_workers)
+    else:
+        incumbents = Incumbents.from_options(problem.solver, on_incumbent)
+        with job_profile.phase("build"):
+            schedule_model = ShiftScheduleModel(problem, base)
+        build_time = time.perf_counter() - started
+        with incumbents.monitoring(), job_profile.phase("solve"):
+            if mode == PORTFOLIO:
+                result = solve_portfolio(
+                    schedule_model, timeout_seconds, num_workers, incumbents
+                )
+            else:
+                result = schedule_model.solve(
+                    timeout_seconds, num_workers, incumbents=incumbents, strategy=mode
+                )
+        result["build_time"] = build_time
+        result["incumbents"] = incumbents.summary()
+    if result["objective_value"] is not None:
+        with job_profile.phase("verify"):
+            result["evaluation"] = _verify(problem, result)
+    return result
+
+
+def _verify(problem: ScheduleProblem, result: dict) -> dict:
+    """Re-check a solver result with the evaluator before it is returned"""
+    matrices = ScheduleMatrices(problem)
+    assigned, unknown = matrices.assignment_matrix(
+        frozenset((a["employee_id"], a["shift_id"]) for a in result["assignments"])
+    )
+    evaluation = matrices.evaluate(assigned, unknown)
+    reported_missing = sum(gap["missing"] for gap in result["coverage_gaps"])
+    if not evaluation["valid"] or evaluation["coverage"]["missing"] != reported_missing:
+        raise ValueError(
+            "Solver result failed verification: "
+            f"{evaluation['violation_counts']}, "
+            f"{evaluation['coverage']['missing']} staff missing "
+            f"(solver reported {reported_missing})"
+        )
+    return {
+        "valid": True,
+        "preference_score": evaluation["preference_score"],
+        "load": {key: evaluation["load"][key] for key in ("min", "max", "mean")},
+    }
+
+
+# problem_type -> solver entry point
+SOLVERS = {
+    SHIFT_SCHEDULING: solve_shift_schedule,
+}
+
+
+def solve(
+    problem_type: str,
+    constraints_json: str,
+    objectives_json: str,
+    timeout_seconds: float,
+    num_workers: int = 0,
+    base_assignment_json: str = "",
+    on_incumbent: Callable[[str], None] | None = None,
+) -> str:
+    """Solve a problem and return the result as JSON (process-pool entry point)
+
+    `on_incumbent` receives the JSON of each reported intermediate result.
+    """
+    return json.dumps(
+        solve_result(
+            problem_type,
+            constraints_json,
+            objectives_json,
+            timeout_seconds,
+            num_workers,
+            base_assignment_json,
+            on_incumbent,
+        )
+    )
+
+
+def solve_result(
+    problem_type: str,
+    constraints_json: str,
+    objectives_json: str,
+    timeout_seconds: float,
+    num_workers: int = 0,
+    base_assignment_json: str = "",
+    on_incumbent: Callable[[str], None] | None = None,
+) -> dict:
+    """``solve()`` without serializing the result"""
+    solver = SOLVERS.get(problem_type)
+    if solver is None:
+        raise ValueError(
+            f"Unsupported problem_type '{problem_type}', "
+            f"expected one of: {', '.join(sorted(SOLVERS))}"
+        )
+    return solver(
+        constraints_json,
+        objectives_json,
+        timeout_seconds,
+        num_workers,
+        base_assignment_json,
+        (
+            (lambda incumbent: on_incumbent(json.dumps(incumbent)))
+            if on_incumbent is not None
+            else None
+        ),
+    )
+
+
+def evaluate(
+    problem_type: str,
+    constraints_json: str,
+    objectives_json: str,
+    assignment_json: str,
+) -> dict:
+    """Score and validate an assignment without solving"""
+    if problem_type != SHIFT_SCHEDULING:
+        raise ValueError(
+            f"Unsupported problem_type '{problem_type}', "
+            f"expected: {SHIFT_SCHEDULING}"
+        )
+    problem = ScheduleProblem.from_json(constraints_json, objectives_json)
+    matrices = ScheduleMatrices(problem)
+    assigned, unknown = matrices.assignment_matrix(parse_assignments(assignment_json))
+    return matrices.evaluate(assigned, unknown)
@@ -0,0 +1,543 @@
+"""Process pool that keeps CP-SAT solves off the asyncio event loop.
+
+Intermediate solutions travel back from the worker processes on one
+multiprocessing queue shared by the pool; a reader thread hands each to the
+``on_incumbent`` callback of the solve it belongs to, on the event loop.
+
+Solves waiting for a free solver process are started highest ``priority``
+first (see admission.py), then in the order they arrived.
+
+A solve given an ``on_profile`` callback runs under ``job_profile.capture()``
+and hands its marshalled profile to the callback before it returns.
+
+Cancelling the task awaiting a solve (``CancelJob``) or abandoning it at its
+deadline raises the solve's stop flag, shared with the worker processes. A
+watchdog thread next to each solve polls it and stops the CP-SAT searches, so
+the process is free again within moments rather than at the time limit.
+
+The watchdog also enforces per-solve limits: ``SOLVER_CPU_LIMIT_SECONDS`` of
+CPU time (all search threads together) and ``SOLVER_MEMORY_LIMIT_MB`` of
+resident memory for the solver process (Linux only). A solve over a limit is
+stopped and fails with ``SolverResourceError``. In case it doesn't stop (a
+model still being built), the kernel ends the process
+``CPU_LIMIT_GRACE_SECONDS`` past the CPU limit (RLIMIT_CPU).
+
+The solver stack (OR-Tools, NumPy) is only imported in the worker
+processes, as each starts; ``warm()`` starts them all ahead of the first
+solve.
+"""
+
+import asyncio
+import heapq
+import itertools
+import json
+import logging
+import math
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Awaitable, Callable
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+try:
+    import resource
+except ImportError:  # not on Windows
+    resource = None
+
+import job_profile
+from metrics import SOLVE_DURATION, observe_model
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TIMEOUT_SECONDS = 30
+# Extra time granted on top of timeout_seconds before a solve is abandoned
+TIMEOUT_GRACE_SECONDS = 5
+# Profiling slows the Python side of a solve (model build, encoding) several
+# times over; a profiled solve gets this much more before it is abandoned
+PROFILE_GRACE_SECONDS = 60
+# Seconds a cancelled or timed-out solve may take to stop before its slot is
+# released
+CANCEL_GRACE_SECONDS = 10
+# CPU seconds past SOLVER_CPU_LIMIT_SECONDS before the kernel ends the process
+CPU_LIMIT_GRACE_SECONDS = 30
+# Seconds between two checks of a running solve's stop flag and limits
+WATCH_INTERVAL = 0.05
+
+
+class SolverTimeoutError(Exception):
+    pass
+
+
+class SolverResourceError(Exception):
+    """A solve went over its CPU-time or memory limit"""
+
+
+# Worker-process side of the incumbent queue and the stop flags, set by the
+# pool initializer. Each solve holding a slot owns a flag; the parent stops a
+# solve by writing its solve ID there.
+_incumbent_queue = None
+_stop_flags = None
+
+
+def _init_worker(queue, stop_flags):
+    global _incumbent_queue, _stop_flags
+    _incumbent_queue = queue
+    _stop_flags = stop_flags
+    # Load the solver stack now rather than in the first solve
+    import payloads  # noqa: F401
+
+
+def _ready():
+    pass
+
+
+class _Control:
+    """How a worker process runs one solve; sent along with its arguments"""
+
+    __slots__ = (
+        "solve_id",
+        "token",
+        "profile",
+        "stop_flag",
+        "cpu_seconds",
+        "memory_bytes",
+    )
+
+    def __init__(
+        self,
+        solve_id: int,
+        token: int | None,
+        profile: bool,
+        stop_flag: int,
+        cpu_seconds: float,
+        memory_bytes: int,
+    ):
+        self.solve_id = solve_id
+        # Tags the solve's incumbents (None: not reported)
+        self.token = token
+        self.profile = profile
+        # Index of the solve's flag in the shared stop flags
+        self.stop_flag = stop_flag
+        self.cpu_seconds = cpu_seconds
+        self.memory_bytes = memory_bytes
+
+
+def _resident_bytes() -> int:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except OSError:
+        return 0
+
+
+class _Watchdog:
+    """Worker-process side of a solve: stops its searches once the parent
+    raises the stop flag or the solve goes over a limit (then failing it
+    with SolverResourceError)"""
+
+    def __init__(self, control: _Control):
+        self.control = control
+        self.exceeded: str | None = None
+        self._done = threading.Event()
+        self._thread = threading.Thread(target=self._watch, daemon=True)
+        self._cpu_rlimit = None
+
+    def __enter__(self) -> "_Watchdog":
+        import scheduling
+
+        scheduling.resume_searches()
+        self._cpu_started = time.process_time()
+        if self.control.cpu_seconds and resource is not None:
+            self._cpu_rlimit = resource.getrlimit(resource.RLIMIT_CPU)
+            usage = resource.getrusage(resource.RUSAGE_SELF)
+            soft, hard = self._cpu_rlimit
+            limit = math.ceil(
+                usage.ru_utime
+                + usage.ru_stime
+                + self.control.cpu_seconds
+                + CPU_LIMIT_GRACE_SECONDS
+            )
+            if hard != resource.RLIM_INFINITY:
+                limit = min(limit, hard)
+            resource.setrlimit(resource.RLIMIT_CPU, (limit, hard))
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._done.set()
+        self._thread.join()
+        if self._cpu_rlimit is not None:
+            resource.setrlimit(resource.RLIMIT_CPU, self._cpu_rlimit)
+        if self.exceeded is not None:
+            raise SolverResourceError(self.exceeded)
+
+    def _watch(self):
+        control = self.control
+        while not self._done.wait(WATCH_INTERVAL):
+            if _stop_flags[control.stop_flag] == control.solve_id:
+                break
+            cpu = time.process_time() - self._cpu_started
+            if control.cpu_seconds and cpu > control.cpu_seconds:
+                self.exceeded = (
+                    f"Solve exceeded its CPU-time limit of "
+                    f"{control.cpu_seconds:g} seconds"
+                )
+                break
+            if control.memory_bytes and _resident_bytes() > control.memory_bytes:
+                self.exceeded = (
+                    f"Solve exceeded its memory limit of "
+                    f"{control.memory_bytes // 2**20} MB"
+                )
+                break
+        else:
+            return
+        import scheduling
+
+        scheduling.stop_searches()
+
+
+def _reporter(token: int | None) -> Callable[[str | bytes], None] | None:
+    if token is None:
+        return None
+
+    def on_incumbent(result: str | bytes):
+        _incumbent_queue.put((token, result))
+
+    return on_incumbent
+
+
+def _solve(control: _Control, *args) -> tuple[str, dict | None, bytes | None]:
+    """Process-pool entry point; reports incumbents tagged with the control's
+    token.
+
+    Returns the result JSON, the model size (for the parent's metrics) and
+    the profile of the solve if the control asks for one.
+    """
+    import scheduling
+
+    with _Watchdog(control), job_profile.capture(control.profile) as captured:
+        result = scheduling.solve_result(*args, on_incumbent=_reporter(control.token))
+        with job_profile.phase("encode"):
+            result_json = json.dumps(result)
+    return (
+        result_json,
+        result.get("model"),
+        captured.dumps() if captured is not None else None,
+    )
+
+
+def _solve_typed(control: _Control, *args) -> tuple[bytes, dict | None, bytes | None]:
+    """Process-pool entry point for typed problems (see payloads.py)"""
+    import payloads
+
+    with _Watchdog(control), job_profile.capture(control.profile) as captured:
+        problem, result = payloads.solve_result(
+            *args, on_incumbent=_reporter(control.token)
+        )
+        with job_profile.phase("encode"):
+            solution = payloads.encode_solution(problem, result)
+    return (
+        solution,
+        result.get("model"),
+        captured.dumps() if captured is not None else None,
+    )
+
+
+def _discard(future: asyncio.Future):
+    """Retrieve an abandoned solve's outcome, which nobody else will"""
+    if not future.cancelled():
+        future.exception()
+
+
+class _PrioritySlots:
+    """A semaphore that wakes its highest-priority waiter first"""
+
+    def __init__(self, size: int):
+        self.free = size
+        # (-priority, arrival, future) of waiting acquirers
+        self._waiters: list[tuple[int, int, asyncio.Future]] = []
+        self._order = itertools.count()
+
+    async def acquire(self, priority: int = 0):
+        if self.free and not self._waiters:
+            self.free -= 1
+            return
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (-priority, next(self._order), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            if future.done() and not future.cancelled():
+                # Handed the slot just as the waiter was cancelled: pass it on
+                self.release()
+            raise
+
+    def release(self):
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.free += 1
+
+
+class SolverPool:
+    """Runs solver calls in worker processes, at most `max_workers` at a time.
+
+    Jobs beyond the pool size wait for a slot in the event loop, so the
+    solver deadline only starts counting once a worker is actually free.
+    """
+
+    def __init__(self, max_workers: int | None = None):
+        self.max_workers = max_workers or int(
+            os.getenv("SOLVER_WORKERS", str(os.cpu_count() or 1))
+        )
+        # CP-SAT search threads per solve; defaults to an even share of the CPUs
+        self.search_workers = int(
+            os.getenv(
+                "SOLVER_SEARCH_WORKERS",
+                str(max(1, (os.cpu_count() or 1) // self.max_workers)),
+            )
+        )
+        # Per-solve limits enforced in the worker processes (0: none)
+        self.cpu_seconds = float(os.getenv("SOLVER_CPU_LIMIT_SECONDS", "0"))
+        self.memory_bytes = int(os.getenv("SOLVER_MEMORY_LIMIT_MB", "0")) * 2**20
+        self._executor: ProcessPoolExecutor | None = None
+        self._slots: _PrioritySlots | None = None
+        self._context = multiprocessing.get_context("spawn")
+        self._incumbents = None
+        # One stop flag per solve holding a slot; free flags are listed here
+        self._stop_flags = None
+        self._free_stop_flags = list(range(self.max_workers))
+        self._solve_ids = itertools.count(1)
+        self._tokens = itertools.count()
+        # token -> (loop, callback) of solves that want incumbents
+        self._incumbent_handlers: dict[int, tuple] = {}
+        # Solves holding a solver process / waiting for one
+        self.running = 0
+        self.waiting = 0
+        # Every worker process has started and loaded the solver stack
+        self.warmed = False
+
+    @property
+    def executor(self) -> ProcessPoolExecutor:
+        if self._executor is None:
+            if self._incumbents is None:
+                self._incumbents = self._context.Queue()
+                self._stop_flags = self._context.Array(
+                    "q", self.max_workers, lock=False
+                )
+                threading.Thread(target=self._read_incumbents, daemon=True).start()
+            # spawn: forking a process that runs gRPC threads is not safe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.max_workers,
+                mp_context=self._context,
+                initializer=_init_worker,
+                initargs=(self._incumbents, self._stop_flags),
+            )
+            logger.info(f"Started solver pool with {self.max_workers} workers")
+        return self._executor
+
+    @property
+    def slots(self) -> _PrioritySlots:
+        if self._slots is None:
+            self._slots = _PrioritySlots(self.max_workers)
+        return self._slots
+
+    async def solve(
+        self,
+        problem_type: str,
+        constraints_json: str,
+        objectives_json: str,
+        timeout_seconds: int,
+        on_start: Callable[[], Awaitable[None] | None] | None = None,
+        base_assignment_json: str = "",
+        on_incumbent: Callable[[str], None] | None = None,
+        on_profile: Callable[[bytes], None] | None = None,
+        priority: int = 0,
+    ) -> str:
+        """Solve in a worker process and return the result JSON.
+
+        `on_incumbent` is called on the event loop with the JSON of each
+        improved intermediate result while the solve runs. With `on_profile`
+        the solve is profiled, and the callback gets the profile (see
+        job_profile.py) once it has finished. Solves with a higher
+        `priority` get the next free solver process first.
+
+        Cancelling the calling task stops the solve in its process.
+        """
+        timeout = timeout_seconds if timeout_seconds > 0 else DEFAULT_TIMEOUT_SECONDS
+        return await self._run(
+            _solve,
+            (problem_type, constraints_json, objectives_json, timeout),
+            (base_assignment_json,),
+            timeout,
+            on_start,
+            on_incumbent,
+            on_profile,
+            priority,
+        )
+
+    async def solve_typed(
+        self,
+        problem_type: str,
+        problem: bytes,
+        timeout_seconds: int,
+        on_start: Callable[[], Awaitable[None] | None] | None = None,
+        base_solution: bytes = b"",
+        base_assignment_json: str = "",
+        on_incumbent: Callable[[bytes], None] | None = None,
+        on_profile: Callable[[bytes], None] | None = None,
+        priority: int = 0,
+    ) -> bytes:
+        """Solve a serialized ScheduleProblem and return the serialized
+        ScheduleSolution; incumbents are reported serialized as well.
+        """
+        timeout = timeout_seconds if timeout_seconds > 0 else DEFAULT_TIMEOUT_SECONDS
+        return await self._run(
+            _solve_typed,
+            (problem_type, problem, timeout),
+            (base_solution, base_assignment_json),
+            timeout,
+            on_start,
+            on_incumbent,
+            on_profile,
+            priority,
+        )
+
+    async def _run(
+        self,
+        entry: Callable,
+        args: tuple,
+        warm_start: tuple,
+        timeout: int,
+        on_start: Callable[[], Awaitable[None] | None] | None,
+        on_incumbent: Callable | None,
+        on_profile: Callable[[bytes], None] | None,
+        priority: int,
+    ):
+        self.waiting += 1
+        try:
+            await self.slots.acquire(priority)
+        finally:
+            self.waiting -= 1
+        self.running += 1
+        stop_flag = self._free_stop_flags.pop()
+        try:
+            if on_start is not None:
+                started = on_start()
+                if asyncio.iscoroutine(started):
+                    await started
+
+            loop = asyncio.get_running_loop()
+            token = None
+            if on_incumbent is not None:
+                token = next(self._tokens)
+                self._incumbent_handlers[token] = (loop, on_incumbent)
+            executor = self.executor
+            solve_id = next(self._solve_ids)
+            control = _Control(
+                solve_id,
+                token,
+                on_profile is not None,
+                stop_flag,
+                self.cpu_seconds,
+                self.memory_bytes,
+            )
+            future = loop.run_in_executor(
+                executor, entry, control, *args, self.search_workers, *warm_start
+            )
+            problem_type = args[0]
+            deadline = timeout + TIMEOUT_GRACE_SECONDS
+            if on_profile is not None:
+                deadline += PROFILE_GRACE_SECONDS
+            started = time.perf_counter()
+            outcome = "error"
+            try:
+                result, model, profile = await asyncio.wait_for(
+                    asyncio.shield(future), deadline
+                )
+                outcome = "ok"
+            except TimeoutError as e:
+                outcome = "timeout"
+                # Stop the search, and keep the slot until the process has
+                # let go of it: the next solve would otherwise queue behind
+                # it with its own deadline already running
+                self._stop_flags[stop_flag] = solve_id
+                future.add_done_callback(_discard)
+                await asyncio.wait([future], timeout=CANCEL_GRACE_SECONDS)
+                raise SolverTimeoutError(
+                    f"Solver did not finish within {timeout} seconds"
+                ) from e
+            except asyncio.CancelledError:
+                outcome = "cancelled"
+                self._stop_flags[stop_flag] = solve_id
+                future.add_done_callback(_discard)
+                # Keep the slot until the process has let go of the solve
+                await asyncio.wait([future], timeout=CANCEL_GRACE_SECONDS)
+                raise
+            except SolverResourceError:
+                outcome = "resource_limit"
+                raise
+            except BrokenProcessPool:
+                logger.error("Solver pool broke, restarting it")
+                self.shutdown()
+                raise
+            finally:
+                self._incumbent_handlers.pop(token, None)
+                SOLVE_DURATION.labels(problem_type, outcome).observe(
+                    time.perf_counter() - started
+                )
+            observe_model(problem_type, model)
+            if profile is not None:
+                on_profile(profile)
+            return result
+        finally:
+            self._free_stop_flags.append(stop_flag)
+            self.running -= 1
+            self.slots.release()
+
+    def _read_incumbents(self):
+        while True:
+            token, result = self._incumbents.get()
+            handler = self._incumbent_handlers.get(token)
+            if handler is None:
+                # The solve already returned
+                continue
+            loop = handler[0]
+            try:
+                loop.call_soon_threadsafe(self._deliver, token, result)
+            except RuntimeError:
+                # Event loop closed
+                continue
+
+    def _deliver(self, token: int, result: str | bytes):
+        handler = self._incumbent_handlers.get(token)
+        if handler is None:
+            return
+        try:
+            handler[1](result)
+        except Exception as e:
+            logger.warning(f"Incumbent callback failed: {e}")
+
+    async def warm(self):
+        """Start the worker processes ahead of the first solve.
+
+        One call per worker makes the executor spawn them all; each loads
+        the solver stack before it takes its call.
+        """
+        loop = asyncio.get_running_loop()
+        executor = self.executor
+        await asyncio.gather(
+            *(loop.run_in_executor(executor, _ready) for _ in range(self.max_workers))
+        )
+        self.warmed = True
+        logger.info(f"Solver pool warm ({self.max_workers} workers)")
+
+    def shutdown(self, wait: bool = False):
+        self.warmed = False
+        if self._executor is not None:
+            self._executor.shutdown(wait=wait, cancel_futures=True)
+            self._executor = None
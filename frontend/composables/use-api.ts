@@ -31,11 +31,40 @@ export function useApi() {
         body: payload,
       }),
 
+    // Roster upload: employees.csv / shifts.csv are parsed and validated
+    // server-side into a stored problem; optimize({ problem_id }) solves it
+    // without resending the roster
+    uploadRoster: (files: {
+      employees: Blob;
+      shifts: Blob;
+      constraints_json?: string;
+      objectives_json?: string;
+    }) => {
+      const form = new FormData();
+      if (files.constraints_json)
+        form.append("constraints_json", files.constraints_json);
+      if (files.objectives_json)
+        form.append("objectives_json", files.objectives_json);
+      form.append("employees", files.employees, "employees.csv");
+      form.append("shifts", files.shifts, "shifts.csv");
+      // Multipart body: not the JSON client, which forces its Content-Type
+      return $fetch<{
+        problem_id: string;
+        created: boolean;
+        employees: number;
+        shifts: number;
+      }>(`${baseURL}/api/v1/problems`, {
+        method: "POST",
+        body: form,
+      });
+    },
+
     // Optimization
     optimize: (payload: {
       problem_type: string;
-      constraints_json: string;
-      objectives_json: string;
+      constraints_json?: string;
+      objectives_json?: string;
+      problem_id?: string;
       timeout_seconds?: number;
     }) =>
       api<{
@@ -0,0 +1,102 @@
+# scripts/bench-payloads.py
+# Compare JSON and typed protobuf scheduling payloads: bytes on the wire and
+# CPU spent encoding/decoding them, for a synthetic roster.
+#
+#   python scripts/bench-payloads.py --employees 200 --days 28
+import argparse
+import json
+import os
+import sys
+import timeit
+
+sys.path[:0] = [
+    os.path.join(os.path.dirname(__file__), "bench"),
+    os.path.join(os.path.dirname(__file__), "..", "backend", "services", "python-services"),
+]
+
+import payloads  # noqa: E402
+import scheduling  # noqa: E402
+import service_pb2  # noqa: E402
+import synthetic  # noqa: E402
+
+
+def per_call(fn, repeat: int) -> float:
+    """Best-of-3 milliseconds per call"""
+    return min(timeit.repeat(fn, number=repeat, repeat=3)) / repeat * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--employees", type=int, default=100)
+    parser.add_argument("--days", type=int, default=28)
+    parser.add_argument("--timeout", type=float, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    constraints = synthetic.constraints(
+        synthetic.RosterSpec(employees=args.employees, days=args.days, density=1.0)
+    )
+    constraints_json = json.dumps(constraints)
+    problem = scheduling.ScheduleProblem.from_json(constraints_json)
+    problem_bytes = payloads.encode_problem(problem)
+
+    result_json = scheduling.solve(
+        scheduling.SHIFT_SCHEDULING, constraints_json, "", args.timeout
+    )
+    result = json.loads(result_json)
+    solution = payloads.encode_solution(problem, result)
+
+    json_task = json.dumps(
+        {"job_id": "bench", "problem_type": "shift_scheduling", "constraints": constraints_json}
+    ).encode()
+    typed_task = service_pb2.OptimizationTask(
+        job_id="bench",
+        request=service_pb2.OptimizationRequest(
+            problem_type="shift_scheduling", problem=problem_bytes
+        ),
+    ).SerializeToString()
+
+    rows = [
+        # (what, JSON bytes, protobuf bytes, JSON ms, protobuf ms)
+        (
+            "problem: API -> queue -> worker",
+            len(json_task),
+            len(typed_task),
+            # Each hop re-encodes/decodes the JSON task; the typed task's
+            # problem is an opaque bytes field
+            per_call(lambda: json.dumps(json.loads(json_task)).encode(), args.repeat),
+            per_call(
+                lambda: service_pb2.OptimizationTask.FromString(typed_task).SerializeToString(),
+                args.repeat,
+            ),
+        ),
+        (
+            "problem: decode in solver",
+            len(constraints_json),
+            len(problem_bytes),
+            per_call(lambda: scheduling.ScheduleProblem.from_json(constraints_json), args.repeat),
+            per_call(lambda: payloads.decode_problem(problem_bytes), args.repeat),
+        ),
+        (
+            "result: encode in solver",
+            len(result_json),
+            len(solution),
+            per_call(lambda: json.dumps(result), args.repeat),
+            per_call(lambda: payloads.encode_solution(problem, result), args.repeat),
+        ),
+    ]
+
+    print(
+        f"{args.employees} employees, {len(problem.shifts)} shifts, "
+        f"{len(result['assignments'])} assignments"
+    )
+    print(f"{'':34} {'JSON B':>10} {'proto B':>10} {'ratio':>6} {'JSON ms':>9} {'proto ms':>9}")
+    for what, json_size, proto_size, json_ms, proto_ms in rows:
+        print(
+            f"{what:34} {json_size:>10} {proto_size:>10} {json_size / proto_size:>6.1f}"
+            f" {json_ms:>9.3f} {proto_ms:>9.3f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,254 @@
+# scripts/bench
+# Load and solver benchmarks for the Python service, runnable fully locally.
+#
+#   python scripts/bench generate --employees 200 --days 28 --out /tmp/roster
+#   python scripts/bench run --output bench.json            # in-process service
+#   python scripts/bench run --target localhost:50051 --health-url http://localhost:8000/health
+#   python scripts/bench run --scenarios completion --token-delay 0.02
+#   python scripts/bench run --scenarios presolve --density 0.1   # classes on/off
+#   python scripts/bench compare before.json after.json
+#
+# Without --target the service runs in this process on a free port, using
+# RABBITMQ_URL when a broker answers there (start solver workers with
+# `make dev-worker` then) and the in-process broker and embedded worker
+# otherwise. Results are JSON stamped with the git commit, so runs from
+# different commits can be compared.
+import argparse
+import asyncio
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SERVICE_DIR = os.path.join(HERE, "..", "..", "backend", "services", "python-services")
+sys.path[:0] = [HERE, SERVICE_DIR, os.path.join(SERVICE_DIR, "proto")]
+
+import runner  # noqa: E402
+import synthetic  # noqa: E402
+
+
+def add_roster_arguments(parser: argparse.ArgumentParser):
+    defaults = synthetic.RosterSpec()
+    parser.add_argument("--employees", type=int, default=defaults.employees)
+    parser.add_argument("--days", type=int, default=defaults.days)
+    parser.add_argument("--shifts-per-day", type=int, default=defaults.shifts_per_day)
+    parser.add_argument(
+        "--coverage", type=float, default=defaults.coverage,
+        help="share of the headcount on shift each day",
+    )
+    parser.add_argument(
+        "--density", type=float, default=defaults.density,
+        help="share of employees with a preference and an unavailability",
+    )
+    parser.add_argument("--seed", type=int, default=defaults.seed)
+
+
+def roster_spec(args) -> synthetic.RosterSpec:
+    return synthetic.RosterSpec(
+        employees=args.employees,
+        days=args.days,
+        shifts_per_day=args.shifts_per_day,
+        coverage=args.coverage,
+        density=args.density,
+        seed=args.seed,
+    )
+
+
+def git_commit() -> dict:
+    def git(*args) -> str:
+        return subprocess.run(
+            ["git", *args], cwd=HERE, capture_output=True, text=True, check=False
+        ).stdout.strip()
+
+    return {"commit": git("rev-parse", "HEAD"), "dirty": bool(git("status", "--porcelain"))}
+
+
+def generate(args):
+    spec = roster_spec(args)
+    employees, shifts = synthetic.write_csv(spec, args.out)
+    print(f"{spec.employees} employees, {spec.days * spec.shifts_per_day} shifts")
+    print(f"  {employees}\n  {shifts}")
+
+
+async def run_load(args, spec: synthetic.RosterSpec) -> dict:
+    if args.target:
+        health_url = args.health_url
+        result = await runner.run_load(
+            args.target, spec, args.requests, args.concurrency, args.timeout,
+            args.typed, args.poll_interval,
+            lambda: runner.remote_job_store_stats(health_url) if health_url else None,
+        )
+        result["target"] = args.target
+        return result
+    async with runner.LocalService(cache=args.cache) as service:
+        print(f"  in-process service on {service.address}, broker {service.broker}")
+        result = await runner.run_load(
+            service.address, spec, args.requests, args.concurrency, args.timeout,
+            args.typed, args.poll_interval, service.job_store_stats,
+        )
+        result["target"] = "in-process"
+        result["broker"] = service.broker
+        return result
+
+
+async def run_completion(args) -> dict:
+    if args.target:
+        result = await runner.run_completion(
+            args.target, args.requests, args.concurrency, args.max_tokens
+        )
+        result["target"] = args.target
+        return result
+    model_url = (
+        f"fake://?first_token_delay={args.first_token_delay}"
+        f"&token_delay={args.token_delay}"
+    )
+    local = runner.LocalService(cache=args.cache, completion_model_url=model_url)
+    async with local as service:
+        print(f"  in-process service on {service.address}, model {model_url}")
+        result = await runner.run_completion(
+            service.address, args.requests, args.concurrency, args.max_tokens
+        )
+        result["target"] = "in-process"
+        result["model"] = model_url
+        return result
+
+
+def run(args):
+    spec = roster_spec(args)
+    results = {
+        "meta": {
+            **git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpus": os.cpu_count(),
+            "args": {key: value for key, value in vars(args).items() if key != "func"},
+        }
+    }
+    scenarios = args.scenarios.split(",")
+    if "load" in scenarios:
+        print(f"load: {args.requests} jobs, {args.concurrency} concurrent clients")
+        results["load"] = asyncio.run(run_load(args, spec))
+        load = results["load"]
+        print(
+            f"  {load['jobs_per_second']:.1f} jobs/s, {load['rpcs_per_second']:.1f} RPC/s, "
+            f"statuses {load['statuses']}"
+        )
+        for rpc, latency in load["latency_ms"].items():
+            if latency["count"]:
+                print(
+                    f"  {rpc:<18} p50 {latency['p50']:8.2f} ms  p99 {latency['p99']:8.2f} ms"
+                )
+        if load["job_store"]["bytes_per_job"] is not None:
+            print(f"  job store grew {load['job_store']['bytes_per_job']:.0f} B/job")
+    if "solver" in scenarios:
+        print(f"solver: {args.sizes} employees, {args.days} days")
+        sizes = [int(size) for size in args.sizes.split(",")]
+        results["solver"] = runner.run_solver(sizes, spec, args.solver_timeout, args.workers)
+    if "presolve" in scenarios:
+        print(f"presolve: {args.sizes} employees, {args.days} days, density {args.density}")
+        sizes = [int(size) for size in args.sizes.split(",")]
+        results["presolve"] = runner.run_presolve(
+            sizes, spec, args.solver_timeout, args.workers
+        )
+    if "completion" in scenarios:
+        print(f"completion: {args.requests} prompts, {args.concurrency} concurrent clients")
+        results["completion"] = asyncio.run(run_completion(args))
+        for rpc, latency in results["completion"]["latency_ms"].items():
+            print(f"  {rpc:<29} p50 {latency['p50']:8.2f} ms  p99 {latency['p99']:8.2f} ms")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"wrote {args.output}")
+
+
+def flatten(results: dict) -> dict[str, float]:
+    """Numeric metrics by dotted path; solver runs keyed by headcount"""
+    metrics = {}
+
+    def walk(prefix: str, value):
+        if isinstance(value, dict):
+            for key, item in value.items():
+                walk(f"{prefix}.{key}" if prefix else key, item)
+        elif isinstance(value, int | float) and not isinstance(value, bool):
+            metrics[prefix] = value
+
+    load = dict(results.get("load", {}))
+    if "job_store" in load:
+        load["job_store"] = {
+            key: value for key, value in load["job_store"].items() if key != "samples"
+        }
+    walk("load", load)
+    walk("completion", results.get("completion", {}))
+    for run_result in results.get("solver", []):
+        walk(f"solver.{run_result['employees']}", run_result)
+    for run_result in results.get("presolve", []):
+        walk(f"presolve.{run_result['employees']}", run_result)
+    return metrics
+
+
+def compare(args):
+    with open(args.base) as f:
+        base = json.load(f)
+    with open(args.new) as f:
+        new = json.load(f)
+    print(f"base {base['meta']['commit'][:12]}  new {new['meta']['commit'][:12]}")
+    before, after = flatten(base), flatten(new)
+    for key in sorted(before.keys() & after.keys()):
+        old, value = before[key], after[key]
+        change = f"{(value - old) / old * 100:+7.1f}%" if old else ""
+        print(f"  {key:<48} {old:>12.4g} {value:>12.4g} {change}")
+
+
+def main():
+    parser = argparse.ArgumentParser(prog="scripts/bench")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    parser_generate = commands.add_parser("generate", help="write a synthetic roster as CSV")
+    add_roster_arguments(parser_generate)
+    parser_generate.add_argument("--out", default="roster")
+    parser_generate.set_defaults(func=generate)
+
+    parser_run = commands.add_parser("run", help="run benchmark scenarios")
+    add_roster_arguments(parser_run)
+    parser_run.add_argument("--scenarios", default="load,solver")
+    parser_run.add_argument("--target", help="host:port of a running service")
+    parser_run.add_argument("--health-url", help="its /health, to sample the job store")
+    parser_run.add_argument("--requests", type=int, default=100)
+    parser_run.add_argument("--concurrency", type=int, default=16)
+    parser_run.add_argument("--timeout", type=int, default=5, help="per job, seconds")
+    parser_run.add_argument("--typed", action="store_true", help="send ScheduleProblem bytes")
+    parser_run.add_argument("--poll-interval", type=float, default=0.05)
+    parser_run.add_argument(
+        "--cache", action="store_true", help="keep the in-process result cache on"
+    )
+    parser_run.add_argument("--sizes", default="25,50,100,200")
+    parser_run.add_argument("--solver-timeout", type=float, default=30)
+    parser_run.add_argument("--workers", type=int, default=0)
+    parser_run.add_argument("--max-tokens", type=int, default=0, help="per completion")
+    parser_run.add_argument(
+        "--first-token-delay", type=float, default=0.2,
+        help="seconds before the in-process fake model's first token",
+    )
+    parser_run.add_argument(
+        "--token-delay", type=float, default=0.02,
+        help="seconds between the in-process fake model's tokens",
+    )
+    parser_run.add_argument("--output", help="write the results as JSON")
+    parser_run.set_defaults(func=run)
+
+    parser_compare = commands.add_parser("compare", help="compare two result files")
+    parser_compare.add_argument("base")
+    parser_compare.add_argument("new")
+    parser_compare.set_defaults(func=compare)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
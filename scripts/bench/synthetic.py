@@ -0,0 +1,136 @@
+# scripts/bench/synthetic.py
+# Synthetic rosters in the frontend's employees.csv / shifts.csv schema, sized
+# by headcount and horizon, with a tunable share of employees carrying
+# preferences and unavailability (the constraint density).
+import csv
+import math
+import os
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+SHIFT_TYPES = (("Night Shift", "00:00"), ("Morning Shift", "08:00"), ("Evening Shift", "16:00"))
+
+FIRST_NAMES = (
+    "Alice", "Bob", "Carol", "David", "Emma", "Frank", "Grace", "Henry", "Isla", "Jack",
+    "Kara", "Liam", "Maya", "Noah", "Olivia", "Paul", "Quinn", "Ruby", "Sam", "Tara",
+)
+LAST_NAMES = (
+    "Smith", "Johnson", "Brown", "Garcia", "Miller", "Davis", "Wilson", "Moore", "Taylor",
+    "Clark", "Lewis", "Walker", "Young", "King", "Scott", "Green", "Baker", "Adams",
+)
+
+EMPLOYEE_COLUMNS = (
+    "employee_id",
+    "employee_name",
+    "employee_initials",
+    "preferred_shift_time",
+    "preferred_shift_date",
+    "unavailable_shift_time",
+    "unavailable_shift_date",
+)
+SHIFT_COLUMNS = ("shift_id", "date", "day", "time", "shift_type", "required")
+
+
+@dataclass(frozen=True)
+class RosterSpec:
+    employees: int = 50
+    days: int = 14
+    # Night/Morning/Evening, the first `shifts_per_day` of them each day
+    shifts_per_day: int = 3
+    # Share of the headcount needed on shift each day
+    coverage: float = 0.6
+    # Share of employees with a preferred and an unavailable shift
+    density: float = 0.5
+    seed: int = 1
+    start: date = date(2025, 1, 6)
+
+    def __post_init__(self):
+        if self.employees < 1 or self.days < 1:
+            raise ValueError("A roster needs at least one employee and one day")
+        if not 1 <= self.shifts_per_day <= len(SHIFT_TYPES):
+            raise ValueError(f"shifts_per_day must be 1..{len(SHIFT_TYPES)}")
+        if not 0 <= self.density <= 1 or not 0 < self.coverage <= 1:
+            raise ValueError("density must be in [0, 1] and coverage in (0, 1]")
+
+    @property
+    def dates(self) -> list[str]:
+        return [(self.start + timedelta(days=d)).isoformat() for d in range(self.days)]
+
+    @property
+    def required(self) -> int:
+        """Staff per shift"""
+        return max(1, round(self.employees * self.coverage / self.shifts_per_day))
+
+    @property
+    def max_shifts_per_employee(self) -> int:
+        # Five shifts a week
+        return math.ceil(self.days * 5 / 7)
+
+
+def employee_rows(spec: RosterSpec) -> list[dict]:
+    rng = random.Random(spec.seed)
+    dates = spec.dates
+    shift_types = [name for name, _ in SHIFT_TYPES[: spec.shifts_per_day]]
+    rows = []
+    for e in range(1, spec.employees + 1):
+        first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+        row = dict.fromkeys(EMPLOYEE_COLUMNS, "")
+        row.update(
+            employee_id=f"E{e:04d}",
+            employee_name=f"{first} {last}",
+            employee_initials=f"{first[0]}{last[0]}",
+        )
+        if rng.random() < spec.density:
+            row["preferred_shift_time"] = rng.choice(shift_types)
+            row["preferred_shift_date"] = rng.choice(dates)
+            # Half block one shift, half a whole day
+            row["unavailable_shift_date"] = rng.choice(dates)
+            if rng.random() < 0.5:
+                row["unavailable_shift_time"] = rng.choice(shift_types)
+        rows.append(row)
+    return rows
+
+
+def shift_rows(spec: RosterSpec) -> list[dict]:
+    rows = []
+    for d in range(spec.days):
+        day = spec.start + timedelta(days=d)
+        for shift_type, time in SHIFT_TYPES[: spec.shifts_per_day]:
+            rows.append(
+                {
+                    "shift_id": str(len(rows) + 1),
+                    "date": day.isoformat(),
+                    "day": day.strftime("%A"),
+                    "time": time,
+                    "shift_type": shift_type,
+                    "required": spec.required,
+                }
+            )
+    return rows
+
+
+def constraints(spec: RosterSpec) -> dict:
+    """The roster as a constraints_json document"""
+    return {
+        "employees": employee_rows(spec),
+        "shifts": shift_rows(spec),
+        "max_shifts_per_employee": spec.max_shifts_per_employee,
+    }
+
+
+def write_csv(spec: RosterSpec, directory: str) -> tuple[str, str]:
+    """Write employees.csv and shifts.csv (the UploadRoster inputs)"""
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for name, columns, rows in (
+        ("employees", EMPLOYEE_COLUMNS, employee_rows(spec)),
+        ("shifts", SHIFT_COLUMNS, shift_rows(spec)),
+    ):
+        path = os.path.join(directory, f"{name}.csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.DictWriter(f, fieldnames=columns)
+            writer.writeheader()
+            writer.writerows(rows)
+        paths.append(path)
+    return paths[0], paths[1]
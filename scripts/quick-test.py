@@ -3,7 +3,6 @@
 # Python script for quick API testing
 import requests
 import json
-import time
 
 BASE_URL = "http://localhost:8080"
 
@@ -22,9 +21,24 @@ def test_completion():
 
 def test_optimization():
     payload = {
-        "problem_type": "vehicle_routing",
-        "constraints_json": json.dumps({"vehicles": 3, "locations": 10}),
-        "objectives_json": json.dumps({"minimize": "total_distance"}),
+        "problem_type": "shift_scheduling",
+        "constraints_json": json.dumps({
+            "employees": [
+                {"employee_id": "E01", "employee_name": "Alice Smith",
+                 "preferred_shift_time": "Morning Shift",
+                 "unavailable_shift_time": "Night Shift"},
+                {"employee_id": "E02", "employee_name": "Bob Johnson",
+                 "preferred_shift_time": "Night Shift"},
+            ],
+            "shifts": [
+                {"shift_id": "1", "date": "2025-08-21", "time": "00:00",
+                 "shift_type": "Night Shift"},
+                {"shift_id": "2", "date": "2025-08-21", "time": "08:00",
+                 "shift_type": "Morning Shift"},
+            ],
+            "max_shifts_per_employee": 5,
+        }),
+        "objectives_json": json.dumps({"preferred_shift_weight": 1}),
         "timeout_seconds": 60
     }
     
@@ -36,15 +50,34 @@ def test_optimization():
     if "job_id" in result:
         job_id = result["job_id"]
         
-        # Check status a few times
-        for i in range(3):
-            time.sleep(2)
-            status_response = requests.get(f"{BASE_URL}/api/v1/job/{job_id}")
-            status = status_response.json()
-            print(f"Job status (check {i+1}): {status}")
-            
-            if status.get("status") in ["completed", "failed"]:
-                break
+        # Follow status transitions as server-sent events (no polling)
+        with requests.get(f"{BASE_URL}/api/v1/job/{job_id}/watch",
+                          stream=True, timeout=120) as response:
+            for line in response.iter_lines(decode_unicode=True):
+                if line.startswith("data:"):
+                    status = json.loads(line[len("data:"):])
+                    print(f"Job status: {status['status']} {status}")
+
+def test_roster_upload():
+    # Upload the frontend's CSV files once, then solve by problem_id
+    data_dir = "frontend/public/data"
+    with open(f"{data_dir}/employees.csv", "rb") as employees, \
+            open(f"{data_dir}/shifts.csv", "rb") as shifts:
+        response = requests.post(
+            f"{BASE_URL}/api/v1/problems",
+            files={"employees": employees, "shifts": shifts},
+            data={"constraints_json": json.dumps({"max_shifts_per_employee": 20})},
+        )
+    roster = response.json()
+    print(f"Roster upload: {roster}")
+
+    if "problem_id" in roster:
+        response = requests.post(f"{BASE_URL}/api/v1/optimize", json={
+            "problem_type": "shift_scheduling",
+            "problem_id": roster["problem_id"],
+            "timeout_seconds": 30,
+        })
+        print(f"Optimization started: {response.json()}")
 
 if __name__ == "__main__":
     print("Testing API endpoints...")
@@ -57,6 +90,9 @@ if __name__ == "__main__":
         print()
         
         test_optimization()
+        print()
+
+        test_roster_upload()
         
     except requests.exceptions.ConnectionError:
         print("Error: Could not connect to services. Make sure they're running!")
\ No newline at end of file